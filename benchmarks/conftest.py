@@ -0,0 +1,43 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def isolated_environment(tmp_path, monkeypatch):
+    # Don't share the user's HTTP cache or rapids-metadata-daemon.
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    monkeypatch.setenv("RAPIDS_METADATA_SOCKET", "")
+
+
+@pytest.fixture
+def metadata_server(httpserver: HTTPServer) -> HTTPServer:
+    """Serve this repository's published files, in place of GitHub."""
+    with open(os.path.join(ROOT, "rapids-metadata.json"), "rb") as f:
+        httpserver.expect_request("/rapids-metadata.json").respond_with_data(
+            f.read(), content_type="application/json"
+        )
+    shard_dir = os.path.join(ROOT, "rapids-metadata")
+    for filename in os.listdir(shard_dir):
+        with open(os.path.join(shard_dir, filename), "rb") as f:
+            httpserver.expect_request(f"/rapids-metadata/{filename}").respond_with_data(
+                f.read(), content_type="application/json"
+            )
+    return httpserver
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Report the memory added by each version of all_metadata.
+
+"flat" is the layout used before versions were derived and packages were
+shared: every version is a full copy with its own package objects. "shared" is
+the layout loaded from the snapshot. Each column counts the bytes reachable
+from a version that are not reachable from any earlier version.
+"""
+
+import gc
+import sys
+from collections.abc import Iterable
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+from rapids_metadata import all_metadata
+from rapids_metadata.metadata import RAPIDSPackage, RAPIDSVersion
+
+_IGNORED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def footprint(root: Any, seen: set[int]) -> int:
+    total = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _IGNORED_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+
+def unshared(version: RAPIDSVersion) -> RAPIDSVersion:
+    flat = version.flatten()
+    for repository in flat.repositories.values():
+        for package, package_data in repository.packages.items():
+            copied = object.__new__(RAPIDSPackage)
+            copied.__dict__.update(package_data.__dict__)
+            dict.__setitem__(repository.packages, package, copied)  # type: ignore[arg-type]
+    return flat
+
+
+def footprints(versions: Iterable[RAPIDSVersion]) -> list[int]:
+    seen: set[int] = set()
+    return [footprint(version, seen) for version in versions]
+
+
+if __name__ == "__main__":
+    names = list(all_metadata.versions)
+    flat_versions = [unshared(v) for v in all_metadata.versions.values()]
+    flat = footprints(flat_versions)
+    shared = footprints(all_metadata.versions.values())
+
+    print(f"{'version':<10}{'flat (bytes)':>14}{'shared (bytes)':>16}")
+    for name, flat_size, shared_size in zip(names, flat, shared):
+        print(f"{name:<10}{flat_size:>14}{shared_size:>16}")
+    print(f"{'total':<10}{sum(flat):>14}{sum(shared):>16}")
@@ -0,0 +1,120 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generate synthetic RAPIDS metadata of any size.
+
+Versions are built the way ``definitions.py`` builds the real ones: each
+version is derived from the previous one, and a small fraction of it changes.
+Repositories are added and removed, packages are added to and removed from
+repositories, and package properties change, for example when a package starts
+publishing wheels. The output is deterministic for a given seed.
+"""
+
+import random
+
+from rapids_metadata.metadata import (
+    RAPIDSMetadata,
+    RAPIDSPackage,
+    RAPIDSRepository,
+    RAPIDSVersion,
+)
+
+__all__ = [
+    "generate_metadata",
+    "version_name",
+]
+
+
+def version_name(index: int) -> str:
+    """Return the name of the ``index``-th version, counting from 24.08 with a
+    release every two months."""
+    months = 24 * 12 + 7 + 2 * index
+    return f"{months // 12:02}.{months % 12 + 1:02}"
+
+
+def _random_package(rng: random.Random) -> RAPIDSPackage:
+    # Most packages have every property, as in the real data.
+    return RAPIDSPackage.from_flags(0b1111 if rng.random() < 0.7 else rng.randrange(16))
+
+
+def _new_repository(
+    rng: random.Random, name: str, packages_per_repository: int
+) -> RAPIDSRepository:
+    return RAPIDSRepository(
+        packages={
+            f"{name}-package{p}": _random_package(rng)
+            for p in range(packages_per_repository)
+        }
+    )
+
+
+def generate_metadata(
+    num_versions: int = 12,
+    num_repositories: int = 30,
+    packages_per_repository: int = 4,
+    *,
+    change_rate: float = 0.05,
+    seed: int = 0,
+) -> RAPIDSMetadata:
+    """Generate metadata with ``num_versions`` versions.
+
+    The first version has ``num_repositories`` repositories with
+    ``packages_per_repository`` packages each. In each following version, about
+    ``change_rate`` of the repositories change: a package is added, removed,
+    or modified. Repositories are added and removed at a quarter of that rate,
+    so the number of repositories stays close to ``num_repositories``.
+    """
+    rng = random.Random(seed)
+    metadata = RAPIDSMetadata()
+    next_repository = num_repositories
+    version = RAPIDSVersion(
+        repositories={
+            f"repo{r}": _new_repository(rng, f"repo{r}", packages_per_repository)
+            for r in range(num_repositories)
+        }
+    )
+    metadata.versions[version_name(0)] = version
+
+    for index in range(1, num_versions):
+        version = version.derive()
+        repositories = sorted(version.repositories)
+        num_changes = max(1, round(len(repositories) * change_rate))
+        for name in rng.sample(repositories, min(num_changes, len(repositories))):
+            packages = version.repositories[name].packages
+            action = rng.random()
+            if action < 0.4 or not packages:
+                packages[f"{name}-package{len(packages)}-v{index}"] = _random_package(
+                    rng
+                )
+            elif action < 0.6:
+                del packages[rng.choice(sorted(packages))]
+            else:
+                package = rng.choice(sorted(packages))
+                packages[package] = RAPIDSPackage.from_flags(
+                    packages[package].flags ^ 1 << rng.randrange(4)
+                )
+        for _ in range(max(1, num_changes // 4)):
+            # Remove more often than add when there are too many repositories.
+            remove_rate = 0.5 * len(version.repositories) / num_repositories
+            if rng.random() < remove_rate and len(version.repositories) > 1:
+                del version.repositories[rng.choice(sorted(version.repositories))]
+            else:
+                name = f"repo{next_repository}"
+                next_repository += 1
+                version.repositories[name] = _new_repository(
+                    rng, name, packages_per_repository
+                )
+        metadata.versions[version_name(index)] = version
+
+    return metadata
@@ -0,0 +1,65 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+
+import pytest
+from pydantic import TypeAdapter
+from rapids_metadata import remote, snapshot
+from rapids_metadata.adapters import get_type_adapter
+from rapids_metadata.metadata import RAPIDSMetadata
+
+_ADAPTERS = {
+    "fresh": TypeAdapter,
+    "shared": get_type_adapter,
+}
+
+
+@pytest.fixture(scope="module")
+def metadata_json():
+    metadata = snapshot.load()
+    return json.dumps(get_type_adapter(RAPIDSMetadata).dump_python(metadata)).encode()
+
+
+@pytest.mark.parametrize("adapter", list(_ADAPTERS))
+def test_validate_dump_cycle(benchmark, metadata_json, adapter):
+    make_adapter = _ADAPTERS[adapter]
+
+    def cycle():
+        metadata = make_adapter(RAPIDSMetadata).validate_json(metadata_json)
+        return make_adapter(RAPIDSMetadata).dump_python(metadata)
+
+    assert benchmark(cycle)
+
+
+@pytest.mark.parametrize("adapter", list(_ADAPTERS))
+def test_fetch_cycle(benchmark, monkeypatch, tmp_path, metadata_json, adapter):
+    # A fetch served from the on-disk cache, as in a long-lived service that
+    # polls for updates.
+    url = "https://example.com/rapids-metadata.json"
+    cache = remote.HTTPCache(str(tmp_path), ttl=3600)
+    cache._store(url, remote._CacheEntry(metadata_json, None, None, time.time()))
+    monkeypatch.setattr(remote, "get_type_adapter", _ADAPTERS[adapter])
+
+    def cycle():
+        metadata = remote._fetch_from_url(url, cache=cache)
+        return _ADAPTERS[adapter](RAPIDSMetadata).dump_python(metadata)
+
+    assert benchmark(cycle)
+
+
+@pytest.mark.parametrize("adapter", list(_ADAPTERS))
+def test_adapter_construction(benchmark, adapter):
+    assert benchmark(_ADAPTERS[adapter], RAPIDSMetadata)
@@ -0,0 +1,87 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure fresh processes, which is what users of the package pay for."""
+
+import subprocess
+import sys
+
+import pytest
+
+_ROUNDS = 10
+
+
+def _run(args, cwd):
+    subprocess.run(args, cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+
+
+@pytest.fixture
+def project(tmp_path):
+    with open(tmp_path / "VERSION", "w") as f:
+        f.write("24.08.00\n")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import rapids_metadata",
+        "import rapids_metadata; rapids_metadata.all_metadata",
+        "import rapids_metadata.cli",
+        "from rapids_metadata.query import all_metadata; "
+        "all_metadata.get_current_version('.')",
+        "from rapids_metadata import all_metadata; "
+        "all_metadata.get_current_version('.')",
+    ],
+    ids=["import", "load", "cli", "query-current-version", "current-version"],
+)
+def test_import(benchmark, project, code):
+    benchmark.pedantic(
+        _run, args=([sys.executable, "-c", code], project), rounds=_ROUNDS
+    )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        [],
+        ["--all-versions"],
+        ["has-cuda-suffix", "cudf"],
+    ],
+    ids=["current-version", "all-versions", "query"],
+)
+def test_rapids_metadata_json(benchmark, project, args):
+    benchmark.pedantic(
+        _run,
+        args=([sys.executable, "-m", "rapids_metadata.cli", *args], project),
+        rounds=_ROUNDS,
+    )
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        [],
+        ["has-cuda-suffix", "cudf"],
+    ],
+    ids=["current-version", "query"],
+)
+def test_rapids_metadata_json_uncached(benchmark, monkeypatch, project, args):
+    # Without the output cache, every run loads the metadata.
+    monkeypatch.setenv("RAPIDS_METADATA_OUTPUT_CACHE", "")
+    benchmark.pedantic(
+        _run,
+        args=([sys.executable, "-m", "rapids_metadata.cli", *args], project),
+        rounds=_ROUNDS,
+    )
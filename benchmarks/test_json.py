@@ -0,0 +1,44 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from rapids_metadata import all_metadata
+from rapids_metadata import json as rapids_json
+from rapids_metadata.adapters import get_type_adapter
+from rapids_metadata.metadata import RAPIDSMetadata
+
+
+def _dump_python_then_json(adapter, metadata, pretty):
+    return rapids_json._dumps(adapter.dump_python(metadata), pretty).encode()
+
+
+_SERIALIZERS = {
+    "json.dumps": _dump_python_then_json,
+    "dump_json": rapids_json._dump_json,
+}
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+@pytest.mark.parametrize("serializer", list(_SERIALIZERS))
+def test_serialize_all_versions(benchmark, serializer, pretty):
+    adapter = get_type_adapter(RAPIDSMetadata)
+    assert benchmark(_SERIALIZERS[serializer], adapter, all_metadata, pretty)
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_main_all_versions(benchmark, tmp_path, pretty):
+    args = ["--all-versions", "-o", str(tmp_path / "rapids-metadata.json")]
+    if pretty:
+        args.append("--pretty")
+    benchmark(rapids_json.main, args)
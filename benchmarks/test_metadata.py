@@ -0,0 +1,52 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from rapids_metadata import snapshot
+
+
+def test_package_index_lookup(benchmark):
+    metadata = snapshot.load()
+    packages = sorted(metadata.package_index)
+
+    def lookup_all():
+        return [metadata.get_package_releases(package) for package in packages]
+
+    assert all(benchmark(lookup_all))
+
+
+def test_package_index_build(benchmark):
+    metadata = snapshot.load()
+
+    def build():
+        # An empty update still counts as a modification and drops the index.
+        metadata.versions.update()
+        return metadata.package_index
+
+    assert benchmark(build)
+
+
+@pytest.mark.parametrize("version", ["26.04.00", "99.02.00"], ids=["hit", "fallback"])
+def test_get_current_version(benchmark, tmp_path, version):
+    metadata = snapshot.load()
+    with open(tmp_path / "VERSION", "w") as f:
+        f.write(f"{version}\n")
+    assert (
+        benchmark(metadata.get_current_version, tmp_path) is metadata.versions["26.04"]
+    )
+
+
+def test_floor_version(benchmark):
+    metadata = snapshot.load()
+    assert benchmark(metadata.floor_version, "25.07") == "25.06"
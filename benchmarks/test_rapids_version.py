@@ -0,0 +1,104 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import builtins
+import contextlib
+import os
+import os.path
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+from packaging.version import InvalidVersion, Version
+from rapids_metadata import rapids_version
+
+
+def naive_get_rapids_version(directory, version_file="VERSION"):
+    """The implementation of get_rapids_version before it was memoized."""
+    while not os.path.samefile(directory, os.path.dirname(directory)):
+        try:
+            with open(os.path.join(directory, version_file)) as f:
+                version = Version(f.read())
+        except (FileNotFoundError, InvalidVersion):
+            directory = os.path.dirname(directory)
+        else:
+            return f"{version.major:02}.{version.minor:02}"
+    raise FileNotFoundError
+
+
+@contextlib.contextmanager
+def count_syscalls() -> Generator[dict[str, int], None, None]:
+    counts = {"stat": 0, "open": 0}
+    real_stat = os.stat
+    real_open = builtins.open
+
+    def stat(*args, **kwargs):
+        counts["stat"] += 1
+        return real_stat(*args, **kwargs)
+
+    def open(*args, **kwargs):
+        counts["open"] += 1
+        return real_open(*args, **kwargs)
+
+    with patch("os.stat", stat), patch("builtins.open", open):
+        yield counts
+
+
+@pytest.fixture(scope="module")
+def directories(tmp_path_factory):
+    root = tmp_path_factory.mktemp("repo")
+    with open(os.path.join(root, "VERSION"), "w") as f:
+        f.write("26.04.00\n")
+    directories = []
+    for a in range(10):
+        for b in range(10):
+            for c in range(10):
+                directory = os.path.join(root, f"a{a}", f"b{b}", f"c{c}", "src")
+                os.makedirs(directory)
+                directories.append(directory)
+    return directories
+
+
+def test_naive(benchmark, directories):
+    def run():
+        return [naive_get_rapids_version(d) for d in directories]
+
+    with count_syscalls() as counts:
+        assert set(run()) == {"26.04"}
+    benchmark.extra_info.update(counts)
+    benchmark(run)
+
+
+def test_get_rapids_version(benchmark, directories):
+    def run():
+        return [rapids_version.get_rapids_version(d) for d in directories]
+
+    run()
+    with count_syscalls() as counts:
+        assert set(run()) == {"26.04"}
+    benchmark.extra_info.update(counts)
+    benchmark(run)
+
+
+def test_resolve_many(benchmark, directories):
+    resolver = rapids_version.RAPIDSVersionResolver()
+
+    def run():
+        return resolver.resolve_many(directories)
+
+    run()
+    with count_syscalls() as counts:
+        assert set(run()) == {"26.04"}
+    benchmark.extra_info.update(counts)
+    benchmark(run)
@@ -0,0 +1,70 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from rapids_metadata import remote, snapshot
+from rapids_metadata.adapters import get_type_adapter
+from rapids_metadata.metadata import RAPIDSMetadata
+
+
+def test_fetch_from_url(benchmark, metadata_server):
+    # Download and validate the whole document on every round.
+    url = metadata_server.url_for("/rapids-metadata.json")
+    metadata = benchmark(remote._fetch_from_url, url)
+    assert "24.08" in metadata.versions
+
+
+def test_fetch_from_url_cached(benchmark, tmp_path, metadata_server):
+    # Served from the on-disk cache, so only validation is measured.
+    url = metadata_server.url_for("/rapids-metadata.json")
+    cache = remote.HTTPCache(str(tmp_path / "http"), ttl=3600)
+    remote._fetch_from_url(url, cache=cache)
+    metadata = benchmark(remote._fetch_from_url, url, cache=cache)
+    assert "24.08" in metadata.versions
+
+
+def test_fetch_version(benchmark, metadata_server):
+    base_url = metadata_server.url_for("/rapids-metadata/")
+    version = benchmark(
+        remote.fetch_version, "24.08", base_url=base_url, cache=False, retries=0
+    )
+    assert version.repositories
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_fetch_one_version(benchmark, tmp_path, metadata_server, lazy):
+    # Fetch from the cache and use a single version.
+    url = metadata_server.url_for("/rapids-metadata.json")
+    cache = remote.HTTPCache(str(tmp_path / "http"), ttl=3600)
+    remote._fetch_from_url(url, cache=cache)
+
+    def fetch_one_version():
+        metadata = remote._fetch_from_url(url, cache=cache, lazy=lazy)
+        return metadata.versions["24.08"]
+
+    version = benchmark(fetch_one_version)
+    assert version.repositories
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["validate", "cached"])
+def test_validation_cache(benchmark, tmp_path, cached):
+    # Loading the same document again, with and without the cache.
+    body = get_type_adapter(RAPIDSMetadata).dump_json(snapshot.load())
+    cache = remote.ValidationCache(str(tmp_path / "validated"))
+    if cached:
+        cache.validate(body)
+        metadata = benchmark(cache.validate, body)
+    else:
+        metadata = benchmark(remote._validate, RAPIDSMetadata, body)
+    assert "24.08" in metadata.versions
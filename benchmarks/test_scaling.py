@@ -0,0 +1,109 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure how each operation grows with the size of the metadata.
+
+Each benchmark is grouped by operation, so that the table for an operation
+lists its time at every scale. The scales are ``<versions>x<repositories>``,
+growing along one axis at a time from about the size of the real data.
+"""
+
+import functools
+
+import pytest
+from rapids_metadata import json as rapids_json
+from rapids_metadata import snapshot
+from rapids_metadata.adapters import get_type_adapter
+from rapids_metadata.metadata import RAPIDSMetadata
+from synthetic import generate_metadata, version_name
+
+_SCALES = [
+    (12, 30),
+    (48, 30),
+    (96, 30),
+    (12, 300),
+    (12, 3000),
+]
+
+
+@functools.cache
+def _metadata(num_versions: int, num_repositories: int) -> RAPIDSMetadata:
+    return generate_metadata(num_versions, num_repositories)
+
+
+@pytest.fixture(params=_SCALES, ids=[f"{v}x{r}" for v, r in _SCALES])
+def scale(request):
+    return request.param
+
+
+@pytest.fixture
+def metadata(benchmark, request, scale):
+    metadata = _metadata(*scale)
+    benchmark.group = request.node.originalname
+    benchmark.extra_info["versions"] = len(metadata.versions)
+    benchmark.extra_info["packages"] = sum(
+        len(version.all_packages) for version in metadata.versions.values()
+    )
+    return metadata
+
+
+def test_load_snapshot(benchmark, metadata):
+    # What `rapids_metadata.all_metadata` does on first access.
+    data = snapshot.dumps(metadata)
+    assert len(benchmark(snapshot.loads, data).versions) == len(metadata.versions)
+
+
+def test_validate_json(benchmark, metadata):
+    adapter = get_type_adapter(RAPIDSMetadata)
+    data = adapter.dump_json(metadata)
+    assert len(benchmark(adapter.validate_json, data).versions) == len(
+        metadata.versions
+    )
+
+
+def test_dump_json(benchmark, metadata):
+    adapter = get_type_adapter(RAPIDSMetadata)
+    assert benchmark(rapids_json._dump_json, adapter, metadata, False)
+
+
+def test_build_package_index(benchmark, metadata):
+    def build():
+        # An empty update still counts as a modification and drops the index.
+        metadata.versions.update()
+        return metadata.package_index
+
+    assert benchmark(build)
+
+
+def test_get_package_releases(benchmark, metadata):
+    package = "repo0-package0"
+    metadata.package_index
+    assert benchmark(metadata.get_package_releases, package)
+
+
+def test_floor_version(benchmark, metadata, scale):
+    metadata.sorted_versions
+    last = version_name(scale[0] - 1)
+    assert benchmark(metadata.floor_version, "99.01") == last
+
+
+def test_compute_package_sets(benchmark, metadata, scale):
+    # The latest version has been derived the most times.
+    version = metadata.versions[version_name(scale[0] - 1)]
+
+    def compute():
+        metadata.versions.update()
+        return version.all_packages
+
+    assert benchmark(compute)
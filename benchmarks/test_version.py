@@ -0,0 +1,65 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from rapids_metadata.metadata import RAPIDSPackage, RAPIDSRepository, RAPIDSVersion
+
+
+def make_version(num_repositories: int) -> RAPIDSVersion:
+    return RAPIDSVersion(
+        repositories={
+            f"repo{r}": RAPIDSRepository(
+                packages={
+                    f"repo{r}-package{p}": RAPIDSPackage(
+                        publishes_prereleases=p % 2 == 0,
+                        has_cuda_suffix=p % 3 != 0,
+                    )
+                    for p in range(10)
+                }
+            )
+            for r in range(num_repositories)
+        }
+    )
+
+
+# Repeated access should take the same time regardless of the number of
+# packages in the version.
+@pytest.mark.parametrize("num_repositories", [1, 10, 100, 1000])
+@pytest.mark.parametrize(
+    "view",
+    [
+        "all_packages",
+        "prerelease_packages",
+        "cuda_suffixed_packages",
+        "conda_packages",
+        "wheel_packages",
+    ],
+)
+def test_repeated_access(benchmark, num_repositories, view):
+    version = make_version(num_repositories).derive()
+    getattr(version, view)
+    result = benchmark(getattr, version, view)
+    assert len(version.all_packages) == num_repositories * 10
+    assert result is getattr(version, view)
+
+
+@pytest.mark.parametrize("num_repositories", [1, 10, 100, 1000])
+def test_access_after_modification(benchmark, num_repositories):
+    version = make_version(num_repositories).derive()
+
+    def modify_and_access():
+        version.repositories["repo0"].packages["new-package"] = RAPIDSPackage()
+        return version.cuda_suffixed_packages
+
+    assert "new-package" in benchmark(modify_and_access)
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# Copyright (c) 2024, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 
 import os.path
 import sys
@@ -16,5 +16,9 @@ if __name__ == "__main__":
             os.path.join(repo_root, "rapids-metadata.json"),
             "--pretty",
             "--all-versions",
+            "--shard-dir",
+            os.path.join(repo_root, "rapids-metadata"),
+            "--delta-dir",
+            os.path.join(repo_root, "rapids-metadata-deltas"),
         ]
     )
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, NVIDIA CORPORATION.
+
+import os.path
+import sys
+
+repo_root = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(os.path.join(repo_root, "src"))
+
+import rapids_metadata.snapshot as rapids_snapshot  # noqa: E402
+from rapids_metadata.definitions import all_metadata  # noqa: E402
+
+if __name__ == "__main__":
+    with open(rapids_snapshot.SNAPSHOT_PATH, "wb") as f:
+        f.write(rapids_snapshot.dumps(all_metadata))
@@ -0,0 +1,34 @@
+#!/bin/bash
+# Copyright (c) 2026, NVIDIA CORPORATION.
+
+# Run the benchmarks and compare them with a baseline saved earlier on the same
+# machine, failing if any benchmark's median regressed by more than the
+# threshold.
+#
+#   ci/run_benchmarks.sh --save-baseline  # before a change
+#   ci/run_benchmarks.sh                  # after it
+#
+# Extra arguments are passed to pytest.
+
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+BASELINE="${RAPIDS_METADATA_BENCHMARK_BASELINE:-.benchmarks/baseline.json}"
+THRESHOLD="${RAPIDS_METADATA_BENCHMARK_THRESHOLD:-25%}"
+
+if [[ "${1:-}" == "--save-baseline" ]]; then
+  shift
+  mkdir -p "$(dirname "${BASELINE}")"
+  exec python -m pytest benchmarks --benchmark-json="${BASELINE}" "$@"
+fi
+
+if [[ ! -f "${BASELINE}" ]]; then
+  echo "No baseline at ${BASELINE}, run $0 --save-baseline first" >&2
+  exit 1
+fi
+
+exec python -m pytest benchmarks \
+  --benchmark-compare="${BASELINE}" \
+  --benchmark-compare-fail="median:${THRESHOLD}" \
+  "$@"
@@ -0,0 +1,68 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""On-disk caches shared by :mod:`rapids_metadata.remote` and
+:mod:`rapids_metadata.cli`.
+
+:mod:`rapids_metadata.cli` is imported on every invocation of
+``rapids-metadata-json``, so this module must stay cheap to import.
+"""
+
+import os
+
+__all__: list[str] = []
+
+
+def _cache_directory(name: str) -> str:
+    """Return the directory of the cache called ``name`` in
+    ``$XDG_CACHE_HOME/rapids-metadata``."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "rapids-metadata", name)
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write a file atomically, so that concurrent readers and writers only
+    ever see complete files."""
+    import tempfile
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _prune(directory: str, max_entries: int, suffix: str = ""):
+    """Remove the oldest entries ending with ``suffix`` from a cache directory,
+    keeping ``max_entries``. Files being written by :func:`_write_atomic` are
+    ignored."""
+    paths = [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if not name.startswith(".") and name.endswith(suffix)
+    ]
+    if len(paths) <= max_entries:
+        return
+    paths.sort(key=os.path.getmtime)
+    for path in paths[: len(paths) - max_entries]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            # Pruned by another process.
+            pass
@@ -0,0 +1,219 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Implementation shared by :mod:`rapids_metadata.metadata`,
+:mod:`rapids_metadata.snapshot`, and :mod:`rapids_metadata.query`.
+
+Both sets of metadata classes use the snapshot format, package flags, package
+sets, and indexes defined here, so they can't disagree about them. This module
+must not import pydantic or packaging, see :mod:`rapids_metadata.query`.
+"""
+
+import marshal
+import os.path
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple, Protocol, TypeVar
+
+__all__: list[str] = []
+
+_P = TypeVar("_P")
+_R = TypeVar("_R")
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), "all_metadata.marshal")
+_SNAPSHOT_FORMAT_VERSION = 2
+_SNAPSHOT_MARSHAL_VERSION = 4
+
+# Changes from the previous version: the names of its repositories in order,
+# or None if they are the same as in the previous version, and every package of
+# each repository that was added or changed in any way, in order, as flags.
+# Repositories that aren't in the delta are the same as in the previous
+# version.
+_Delta = tuple["list[str] | None", dict[str, dict[str, int]]]
+
+
+class _Package(Protocol):
+    @property
+    def publishes_prereleases(self) -> bool: ...
+
+    @property
+    def has_cuda_suffix(self) -> bool: ...
+
+    @property
+    def has_conda_package(self) -> bool: ...
+
+    @property
+    def has_wheel_package(self) -> bool: ...
+
+
+def _package_flags(package: _Package) -> int:
+    """Pack a package's flags into a 4-bit integer, with
+    ``publishes_prereleases`` as the least significant bit."""
+    return (
+        package.publishes_prereleases
+        | package.has_cuda_suffix << 1
+        | package.has_conda_package << 2
+        | package.has_wheel_package << 3
+    )
+
+
+def _package_fields(flags: int) -> dict[str, bool]:
+    """Unpack flags packed by :func:`_package_flags` into package fields."""
+    if not 0 <= flags < 16:
+        raise ValueError(f"Invalid package flags {flags}")
+    return {
+        "publishes_prereleases": bool(flags & 1),
+        "has_cuda_suffix": bool(flags & 2),
+        "has_conda_package": bool(flags & 4),
+        "has_wheel_package": bool(flags & 8),
+    }
+
+
+def _dump_snapshot(versions: list[tuple[str, _Delta]]) -> bytes:
+    """Marshal each version and its delta from the previous version into a
+    snapshot."""
+    return marshal.dumps(
+        (_SNAPSHOT_FORMAT_VERSION, versions), _SNAPSHOT_MARSHAL_VERSION
+    )
+
+
+def _load_snapshot(data: bytes) -> list[tuple[str, _Delta]]:
+    """Unmarshal a snapshot into each version and its delta from the previous
+    version."""
+    format_version, versions = marshal.loads(data)
+    if format_version != _SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format version {format_version}")
+    return versions
+
+
+def _resolve_snapshot(
+    versions: list[tuple[str, _Delta]],
+    package: Callable[[int], _P],
+    repository: Callable[[dict[str, _P]], _R],
+) -> Iterator[tuple[str, dict[str, _R]]]:
+    """Apply the deltas of a snapshot in order, yielding each version's
+    repositories in order. Packages are created from their flags by
+    ``package``, and repositories from their packages by ``repository``. Each
+    version gets a new dict of repositories, but repositories that a version
+    doesn't change are shared with the previous version."""
+    repositories: dict[str, _R] = {}
+    for version, (names, changed) in versions:
+        resolved = {
+            name: repository(
+                {
+                    package_name: package(flags)
+                    for package_name, flags in packages.items()
+                }
+            )
+            for name, packages in changed.items()
+        }
+        repositories = {
+            name: resolved[name] if name in resolved else repositories[name]
+            for name in (repositories if names is None else names)
+        }
+        yield version, repositories
+
+
+class _PackageSets(NamedTuple):
+    all: frozenset[str]
+    prerelease: frozenset[str]
+    cuda_suffixed: frozenset[str]
+    conda: frozenset[str]
+    wheel: frozenset[str]
+    repositories: Mapping[str, str]
+
+
+def _compute_package_sets(repositories: Mapping[str, Any]) -> _PackageSets:
+    all_packages: set[str] = set()
+    prerelease: set[str] = set()
+    cuda_suffixed: set[str] = set()
+    conda: set[str] = set()
+    wheel: set[str] = set()
+    package_repositories: dict[str, str] = {}
+    for repository, repository_data in repositories.items():
+        for package, package_data in repository_data.packages.items():
+            all_packages.add(package)
+            package_repositories.setdefault(package, repository)
+            if package_data.publishes_prereleases:
+                prerelease.add(package)
+            if package_data.has_cuda_suffix:
+                cuda_suffixed.add(package)
+            if package_data.has_conda_package:
+                conda.add(package)
+            if package_data.has_wheel_package:
+                wheel.add(package)
+    return _PackageSets(
+        all=frozenset(all_packages),
+        prerelease=frozenset(prerelease),
+        cuda_suffixed=frozenset(cuda_suffixed),
+        conda=frozenset(conda),
+        wheel=frozenset(wheel),
+        repositories=MappingProxyType(package_repositories),
+    )
+
+
+class _VersionIndex(NamedTuple):
+    """Version strings sorted from oldest to newest, and the keys they are
+    sorted and looked up by."""
+
+    names: tuple[str, ...]
+    keys: tuple[Any, ...]
+
+
+def _build_version_index(
+    versions: Mapping[str, Any], key: Callable[[str], Any]
+) -> _VersionIndex:
+    keyed = sorted((key(version), version) for version in versions)
+    return _VersionIndex(
+        names=tuple(version for _, version in keyed),
+        keys=tuple(version_key for version_key, _ in keyed),
+    )
+
+
+def _find_version(index: _VersionIndex, key: Any) -> str | None:
+    i = bisect_left(index.keys, key)
+    if i < len(index.keys) and index.keys[i] == key:
+        return index.names[i]
+    return None
+
+
+def _floor_version(index: _VersionIndex, key: Any) -> str | None:
+    i = bisect_right(index.keys, key)
+    return index.names[i - 1] if i > 0 else None
+
+
+def _ceiling_version(index: _VersionIndex, key: Any) -> str | None:
+    i = bisect_left(index.keys, key)
+    return index.names[i] if i < len(index.names) else None
+
+
+def _compute_package_index(
+    sorted_versions: tuple[str, ...],
+    versions: Mapping[str, Any],
+    release: Callable[[str, str, Any], _R],
+) -> Mapping[str, tuple[_R, ...]]:
+    """Map each package to its releases, created by ``release`` from the
+    version, repository, and package, in the order of ``sorted_versions``."""
+    index: dict[str, list[_R]] = {}
+    for version in sorted_versions:
+        version_data = versions[version]
+        for repository, repository_data in version_data.repositories.items():
+            for package, package_data in repository_data.packages.items():
+                index.setdefault(package, []).append(
+                    release(version, repository, package_data)
+                )
+    return MappingProxyType(
+        {package: tuple(releases) for package, releases in index.items()}
+    )
@@ -0,0 +1,53 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared pydantic adapters.
+
+Building a :class:`~pydantic.TypeAdapter` compiles a validator and serializer
+for the type, which costs far more than using them on data of the size of the
+RAPIDS metadata. The adapters here are built on first use and then reused.
+"""
+
+from copy import deepcopy
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+__all__ = [
+    "get_json_schema",
+    "get_type_adapter",
+]
+
+_T = TypeVar("_T")
+
+
+@cache
+def get_type_adapter(tp: type[_T]) -> TypeAdapter[_T]:
+    """Return the shared adapter for a type, such as
+    :class:`~rapids_metadata.metadata.RAPIDSMetadata`,
+    :class:`~rapids_metadata.metadata.RAPIDSVersion`, or
+    :class:`~rapids_metadata.metadata.RAPIDSPackage`."""
+    return TypeAdapter(tp)
+
+
+@cache
+def _json_schema(tp: type) -> dict[str, Any]:
+    return get_type_adapter(tp).json_schema()
+
+
+def get_json_schema(tp: type) -> dict[str, Any]:
+    """Return the JSON schema of a type. The schema is generated once, and a
+    copy of it is returned on each call."""
+    return deepcopy(_json_schema(tp))
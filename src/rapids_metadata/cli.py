@@ -0,0 +1,303 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Entry point of ``rapids-metadata-json``.
+
+If a ``rapids-metadata-daemon`` is listening, the command line is forwarded to
+it and its output is printed. The daemon is asked first, because it may have
+refreshed its metadata. Otherwise, the output of command lines that only write
+to stdout is cached on disk. If it is cached, it is printed without loading the
+metadata. Otherwise, :func:`rapids_metadata.json.main` is run in this process,
+and its output is written to stdout as it is produced and cached. This module
+is imported on every invocation, so it only uses modules that are cheap to
+import, and talks to the daemon with :mod:`marshal` rather than :mod:`json`.
+"""
+
+import hashlib
+import io
+import marshal
+import os
+import sys
+
+from ._cache import _cache_directory, _prune, _write_atomic
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import socket
+    from typing import Any, BinaryIO
+
+__all__ = [
+    "main",
+]
+
+_PROTOCOL_VERSION = 2
+_MARSHAL_VERSION = 4
+_CONNECT_TIMEOUT = 1.0
+_RESPONSE_TIMEOUT = 30.0
+
+# Queries that read from stdin, which the daemon can't see.
+_STDIN_QUERIES = frozenset({"batch"})
+
+_OUTPUT_CACHE_VERSION = 1
+_MAX_OUTPUT_ENTRIES = 64
+# Options that only change what is written to stdout. Command lines with any
+# other option, including abbreviations of these, aren't cached.
+_CACHED_OPTIONS = frozenset(
+    {"--all-versions", "--format", "--json", "--pretty", "--rapids-version", "--schema"}
+)
+
+
+def _socket_path() -> str | None:
+    """Return the path of the daemon's socket, or ``None`` if the daemon is
+    disabled.
+
+    The path is taken from ``$RAPIDS_METADATA_SOCKET`` if it is set. An empty
+    value disables the daemon. Otherwise, the socket is in
+    ``$XDG_RUNTIME_DIR``, or ``/tmp`` if that isn't set. Clients only talk to
+    a daemon run by the same user.
+    """
+    path = os.environ.get("RAPIDS_METADATA_SOCKET")
+    if path is not None:
+        return path or None
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(runtime_dir, f"rapids-metadata-{os.getuid()}.sock")
+
+
+def _daemon_key() -> str:
+    """Identify the installed package and its metadata snapshot.
+
+    The daemon only answers clients with the same key, so a daemon started
+    before the package was upgraded isn't used.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    st = os.stat(os.path.join(package_dir, "all_metadata.marshal"))
+    return f"{_PROTOCOL_VERSION}:{package_dir}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _output_cache_directory() -> str | None:
+    """Return the directory of the output cache, or ``None`` if it is disabled.
+
+    The directory is taken from ``$RAPIDS_METADATA_OUTPUT_CACHE`` if it is set.
+    An empty value disables the cache. Otherwise, the cache is in
+    ``$XDG_CACHE_HOME/rapids-metadata/output``.
+    """
+    directory = os.environ.get("RAPIDS_METADATA_OUTPUT_CACHE")
+    if directory is not None:
+        return directory or None
+    return _cache_directory("output")
+
+
+def _output_key(argv: list[str]) -> str | None:
+    """Identify the output of a command line, or return ``None`` if it can't
+    be cached.
+
+    The key contains the installed package, as in :func:`_daemon_key`, and the
+    module that produces the output, so that upgrading the package invalidates
+    the cache. It also contains the RAPIDS version of the current directory
+    and the command line.
+    """
+    for arg in argv:
+        if arg.startswith("-") and arg.partition("=")[0] not in _CACHED_OPTIONS:
+            return None
+    if not _STDIN_QUERIES.isdisjoint(argv):
+        return None
+
+    from .rapids_version import get_rapids_version
+
+    try:
+        version = get_rapids_version(os.getcwd())
+    except FileNotFoundError:
+        version = ""
+    st = os.stat(os.path.join(os.path.dirname(os.path.abspath(__file__)), "json.py"))
+    return "\0".join(
+        [
+            str(_OUTPUT_CACHE_VERSION),
+            _daemon_key(),
+            f"{st.st_mtime_ns}:{st.st_size}",
+            version,
+            *argv,
+        ]
+    )
+
+
+def _output_path(directory: str, key: str) -> str:
+    return os.path.join(directory, hashlib.sha256(key.encode()).hexdigest())
+
+
+def _read_output(directory: str, key: str) -> bytes | None:
+    try:
+        with open(_output_path(directory, key), "rb") as f:
+            entry_key, output = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if entry_key != key or type(output) is not bytes:
+        return None
+    return output
+
+
+def _write_output(directory: str, key: str, output: bytes):
+    """Store the output of a command line."""
+    entry = marshal.dumps((key, output), _MARSHAL_VERSION)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        _write_atomic(_output_path(directory, key), entry)
+        # Remove the oldest entries, such as those of previous installations.
+        _prune(directory, _MAX_OUTPUT_ENTRIES)
+    except OSError:
+        # The cache is an optimization. Failing to write it shouldn't fail
+        # the command.
+        pass
+
+
+def _write_stdout(output: bytes):
+    if hasattr(sys.stdout, "buffer"):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(output.decode())
+
+
+class _Tee(io.BytesIO):
+    """Buffer that also writes everything written to it to a binary stream."""
+
+    def __init__(self, stream: "BinaryIO"):
+        super().__init__()
+        self._stream = stream
+
+    def write(self, data: "Any") -> int:
+        self._stream.write(data)
+        return super().write(data)
+
+
+def _run_captured(argv: list[str]) -> bytes:
+    """Run :func:`rapids_metadata.json.main` and return what it wrote to
+    stdout. The output is also written to stdout as it is produced, so that
+    row formats still stream, and even if it fails."""
+    from .json import main as json_main
+
+    stdout = sys.stdout
+    stream = getattr(stdout, "buffer", None)
+    if stream is not None:
+        stdout.flush()
+    buffer = io.BytesIO() if stream is None else _Tee(stream)
+    captured = sys.stdout = io.TextIOWrapper(
+        buffer,
+        encoding=getattr(stdout, "encoding", None) or "utf-8",
+        errors=getattr(stdout, "errors", None) or "strict",
+        write_through=True,
+    )
+    try:
+        json_main(argv)
+    finally:
+        sys.stdout = stdout
+        # Flush without closing the buffer.
+        captured.detach()
+        output = buffer.getvalue()
+        if stream is None:
+            _write_stdout(output)
+        else:
+            stream.flush()
+    return output
+
+
+def _receive(sock: "socket.socket") -> bytes:
+    """Read from a socket until the other end shuts down its side."""
+    chunks = []
+    while chunk := sock.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _is_own_daemon(sock: "socket.socket", path: str) -> bool:
+    """Whether the daemon at the other end of a connected socket runs as this
+    user. Anyone can create a socket in ``/tmp``, and the output of
+    ``--format shell`` is meant to be sourced, so a daemon run by another
+    user mustn't be trusted."""
+    import socket
+
+    if hasattr(socket, "SO_PEERCRED"):
+        import struct
+
+        credentials = struct.Struct("3i")
+        _, uid, _ = credentials.unpack(
+            sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, credentials.size)
+        )
+    else:
+        uid = os.stat(path).st_uid
+    return uid == os.getuid()
+
+
+def _query_daemon(argv: list[str]) -> "dict[str, Any] | None":
+    path = _socket_path()
+    # Checking that the socket exists first is much cheaper than importing
+    # socket when no daemon is running.
+    if path is None or not _STDIN_QUERIES.isdisjoint(argv) or not os.path.exists(path):
+        return None
+
+    import socket
+
+    request = {
+        "key": _daemon_key(),
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "encoding": getattr(sys.stdout, "encoding", None) or "utf-8",
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CONNECT_TIMEOUT)
+            sock.connect(path)
+            if not _is_own_daemon(sock, path):
+                return None
+            sock.settimeout(_RESPONSE_TIMEOUT)
+            sock.sendall(marshal.dumps(request, _MARSHAL_VERSION))
+            sock.shutdown(socket.SHUT_WR)
+            response = marshal.loads(_receive(sock))
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if "error" in response:
+        return None
+    return response
+
+
+def main(argv: list[str] | None = None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # A daemon may have refreshed its metadata since the output was cached.
+    response = _query_daemon(argv)
+    if response is not None:
+        _write_stdout(response["stdout"])
+        sys.stderr.write(response["stderr"])
+        if response["status"]:
+            sys.exit(response["status"])
+        return
+
+    directory = _output_cache_directory()
+    key = None if directory is None else _output_key(argv)
+    if key is None:
+        from .json import main as json_main
+
+        json_main(argv)
+        return
+    assert directory is not None
+    output = _read_output(directory, key)
+    if output is not None:
+        _write_stdout(output)
+        return
+    _write_output(directory, key, _run_captured(argv))
+
+
+if __name__ == "__main__":
+    main()
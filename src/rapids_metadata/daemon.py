@@ -0,0 +1,210 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Daemon that answers ``rapids-metadata-json`` queries over a Unix socket.
+
+The daemon keeps the metadata loaded, so that a ``rapids-metadata-json`` client
+only pays for starting Python and connecting to it. See
+:mod:`rapids_metadata.cli` for the client side.
+"""
+
+import argparse
+import io
+import marshal
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any
+
+from . import all_metadata
+from .cli import _MARSHAL_VERSION, _daemon_key, _receive, _socket_path
+from .json import main as json_main
+from .metadata import RAPIDSMetadata
+
+__all__ = [
+    "MetadataDaemon",
+    "main",
+]
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "MetadataDaemon"
+
+    def handle(self):
+        try:
+            request = marshal.loads(_receive(self.request))
+        except (EOFError, ValueError, TypeError):
+            return
+        response = self.server.answer(request)
+        self.request.sendall(marshal.dumps(response, _MARSHAL_VERSION))
+
+
+class MetadataDaemon(socketserver.UnixStreamServer):
+    """Server that runs ``rapids-metadata-json`` command lines sent by clients.
+
+    Requests are handled one at a time, in the client's working directory,
+    against :attr:`metadata`. Clients with a different
+    :mod:`~rapids_metadata.cli` key are turned away, so that they fall back to
+    running the command themselves.
+    """
+
+    def __init__(self, path: str, metadata: RAPIDSMetadata | None = None):
+        self.metadata = all_metadata if metadata is None else metadata
+        self.key = _daemon_key()
+        # answer() redirects sys.stderr to the client while it runs a command,
+        # so report the daemon's own errors here.
+        self._stderr = sys.stderr
+        self._bound = False
+        super().__init__(path, _Handler)
+
+    def server_bind(self):
+        path = self.server_address
+        assert isinstance(path, str)
+        if os.path.exists(path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(path)
+                except ConnectionRefusedError:
+                    # Left behind by a daemon that didn't shut down cleanly.
+                    os.unlink(path)
+                else:
+                    raise OSError(f"A daemon is already listening on {path}")
+        old_umask = os.umask(0o077)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+        self._bound = True
+
+    def server_close(self):
+        super().server_close()
+        if self._bound:
+            self._bound = False
+            try:
+                os.unlink(self.server_address)  # type: ignore[arg-type]
+            except FileNotFoundError:
+                pass
+
+    def answer(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run a command line and return its exit status and output."""
+        if request.get("key") != self.key:
+            return {"error": "Client and daemon are different installations"}
+
+        # Capture stdout as bytes, because some formats, such as msgpack, are
+        # binary.
+        stdout = io.BytesIO()
+        captured = io.TextIOWrapper(
+            stdout, encoding=request.get("encoding", "utf-8"), write_through=True
+        )
+        stderr = io.StringIO()
+        status = 0
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(request["cwd"])
+        except OSError as e:
+            return {"error": str(e)}
+        # The client's stdin isn't forwarded, so don't let queries read the
+        # daemon's.
+        old_stdin = sys.stdin
+        sys.stdin = io.StringIO()
+        try:
+            with redirect_stdout(captured), redirect_stderr(stderr):
+                try:
+                    json_main(request["argv"], source=self.metadata)
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        status = e.code or 0
+                    else:
+                        print(e.code, file=sys.stderr)
+                        status = 1
+                except Exception:
+                    traceback.print_exc()
+                    status = 1
+        finally:
+            sys.stdin = old_stdin
+            os.chdir(old_cwd)
+            # Flush without closing the buffer.
+            captured.detach()
+        return {
+            "status": status,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+    def refresh_periodically(self, interval: float, stop: threading.Event):
+        """Bring :attr:`metadata` up to date with GitHub every ``interval``
+        seconds until ``stop`` is set. Failed updates are reported and
+        retried at the next interval."""
+        from .remote import update_metadata
+
+        while not stop.wait(interval):
+            try:
+                self.metadata = update_metadata(self.metadata)
+            except Exception:
+                traceback.print_exc(file=self._stderr)
+
+
+def main(argv: list[str] | None = None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser()
+    parser.description = (
+        "Keep RAPIDS metadata loaded and answer rapids-metadata-json queries."
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="<path>",
+        default=_socket_path(),
+        help="Path of the Unix socket to listen on",
+    )
+    parser.add_argument(
+        "--refresh",
+        metavar="<seconds>",
+        type=float,
+        help=(
+            "Update the metadata from GitHub at this interval instead of only "
+            "using the metadata included in the package"
+        ),
+    )
+
+    parsed = parser.parse_args(argv)
+    if not parsed.socket:
+        parser.error("No socket path given and $RAPIDS_METADATA_SOCKET is empty")
+
+    # Exit through SystemExit on SIGTERM so that the socket is removed.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    stop = threading.Event()
+    with MetadataDaemon(parsed.socket) as server:
+        if parsed.refresh:
+            threading.Thread(
+                target=server.refresh_periodically,
+                args=(parsed.refresh, stop),
+                daemon=True,
+            ).start()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+
+
+if __name__ == "__main__":
+    main()
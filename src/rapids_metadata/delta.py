@@ -0,0 +1,160 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental changes between revisions of RAPIDS metadata.
+
+A delta has the shape of the metadata JSON document, but lists only what
+changed, in the style of a JSON merge patch: ``null`` removes a version,
+repository, or package, and anything else adds or replaces it. Packages are
+always replaced whole. Each delta names the :func:`metadata_digest` of the
+revision it applies to and of the revision it produces, so deltas can be
+chained.
+"""
+
+import hashlib
+import json
+
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+from .adapters import get_type_adapter
+from .metadata import (
+    RAPIDSMetadata,
+    RAPIDSRepository,
+    RAPIDSVersion,
+    _InternedPackage,
+)
+
+__all__ = [
+    "MetadataDelta",
+    "RepositoryDelta",
+    "VersionDelta",
+    "apply_delta",
+    "compute_delta",
+    "metadata_digest",
+]
+
+
+@dataclass
+class RepositoryDelta:
+    """Changes to the packages of a repository."""
+
+    packages: dict[str, _InternedPackage | None] = Field(default_factory=dict)
+
+
+@dataclass
+class VersionDelta:
+    """Changes to the repositories of a version."""
+
+    repositories: dict[str, RepositoryDelta | None] = Field(default_factory=dict)
+
+
+@dataclass
+class MetadataDelta:
+    """Changes from one revision of the metadata to another."""
+
+    base: str
+    target: str
+    versions: dict[str, VersionDelta | None] = Field(default_factory=dict)
+
+
+def metadata_digest(metadata: RAPIDSMetadata) -> str:
+    """Return the SHA-256 of the compact, key-sorted JSON form of the metadata.
+
+    This identifies a revision independently of how the document was formatted
+    when it was published.
+    """
+    data = get_type_adapter(RAPIDSMetadata).dump_python(metadata)
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+def _diff_repository(
+    old: RAPIDSRepository, new: RAPIDSRepository
+) -> RepositoryDelta | None:
+    delta = RepositoryDelta()
+    for package in old.packages:
+        if package not in new.packages:
+            delta.packages[package] = None
+    for package, package_data in new.packages.items():
+        if old.packages.get(package) != package_data:
+            delta.packages[package] = package_data
+    return delta if delta.packages else None
+
+
+def _diff_version(old: RAPIDSVersion, new: RAPIDSVersion) -> VersionDelta | None:
+    delta = VersionDelta()
+    for repository in old.repositories:
+        if repository not in new.repositories:
+            delta.repositories[repository] = None
+    for repository, repository_data in new.repositories.items():
+        old_repository = old.repositories.get(repository)
+        if old_repository is None:
+            delta.repositories[repository] = RepositoryDelta(
+                packages=dict(repository_data.packages)
+            )
+        elif (
+            repository_delta := _diff_repository(old_repository, repository_data)
+        ) is not None:
+            delta.repositories[repository] = repository_delta
+    return delta if delta.repositories else None
+
+
+def compute_delta(old: RAPIDSMetadata, new: RAPIDSMetadata) -> MetadataDelta:
+    """Return the changes that turn ``old`` into ``new``."""
+    delta = MetadataDelta(base=metadata_digest(old), target=metadata_digest(new))
+    for version in old.versions:
+        if version not in new.versions:
+            delta.versions[version] = None
+    for version, version_data in new.versions.items():
+        old_version = old.versions.get(version)
+        if old_version is None:
+            version_delta = _diff_version(RAPIDSVersion(), version_data)
+            delta.versions[version] = version_delta or VersionDelta()
+        elif (version_delta := _diff_version(old_version, version_data)) is not None:
+            delta.versions[version] = version_delta
+    return delta
+
+
+def apply_delta(metadata: RAPIDSMetadata, delta: MetadataDelta) -> RAPIDSMetadata:
+    """Return a copy of the metadata with the delta applied.
+
+    ``metadata`` itself isn't modified, and versions that the delta doesn't
+    touch are shared with it. Raises :class:`KeyError` if the delta removes
+    something that doesn't exist. The caller is responsible for checking that
+    the delta applies to this revision, see :attr:`MetadataDelta.base`.
+    """
+    versions = dict(metadata.versions)
+    for version, version_delta in delta.versions.items():
+        if version_delta is None:
+            del versions[version]
+            continue
+        version_data = (
+            versions[version].flatten() if version in versions else RAPIDSVersion()
+        )
+        for repository, repository_delta in version_delta.repositories.items():
+            if repository_delta is None:
+                del version_data.repositories[repository]
+                continue
+            repository_data = version_data.repositories.setdefault(
+                repository, RAPIDSRepository()
+            )
+            for package, package_data in repository_delta.packages.items():
+                if package_data is None:
+                    del repository_data.packages[package]
+                else:
+                    repository_data.packages[package] = package_data
+        versions[version] = version_data
+    return RAPIDSMetadata(versions=versions)
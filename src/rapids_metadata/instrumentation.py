@@ -0,0 +1,206 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in counters and timings of the work done inside this package.
+
+Instrumentation is off by default. Set ``$RAPIDS_METADATA_INSTRUMENTATION`` to
+a non-empty value other than ``0`` before importing the package, or call
+:func:`enable`, to turn it on. While it is off, each instrumented operation
+only checks a flag.
+
+The following metrics are recorded:
+
+``import_seconds{stage}``
+    Reading and unmarshaling the metadata snapshot on first access of
+    :data:`rapids_metadata.all_metadata`.
+``import_version_seconds{version}``
+    Building each version from the snapshot.
+``version_file_probes{result}``
+    Directories checked for a VERSION file by
+    :func:`~rapids_metadata.rapids_version.get_rapids_version`. ``result`` is
+    ``missing``, ``cached``, or ``parsed``.
+``current_version_lookups{result}``
+    Calls to :meth:`~rapids_metadata.metadata.RAPIDSMetadata.get_current_version`.
+    ``result`` is ``exact``, ``fallback`` (to the latest version), or
+    ``missing``.
+``fetch_seconds{source}`` and ``fetch_bytes{source}``
+    Documents fetched by :mod:`rapids_metadata.remote`. ``source`` is
+    ``network``, ``not_modified``, ``cache``, or ``stale_cache``.
+``validation_seconds{type}``
+    Validating fetched documents.
+``validation_cache_lookups{result}``
+    Lookups in a :class:`~rapids_metadata.remote.ValidationCache`. ``result``
+    is ``hit``, ``miss``, ``corrupt``, or ``version_mismatch``.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import NamedTuple
+
+__all__ = [
+    "Counter",
+    "Report",
+    "Timing",
+    "disable",
+    "enable",
+    "is_enabled",
+    "prometheus_text",
+    "report",
+    "reset",
+]
+
+_PREFIX = "rapids_metadata_"
+
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+_enabled = os.environ.get("RAPIDS_METADATA_INSTRUMENTATION", "") not in ("", "0")
+_lock = threading.Lock()
+_counters: dict[_Key, float] = {}
+_timings: dict[_Key, tuple[int, float]] = {}
+
+
+class Counter(NamedTuple):
+    """Total of a counted quantity."""
+
+    name: str
+    labels: Mapping[str, str]
+    value: float
+
+
+class Timing(NamedTuple):
+    """Number of times an operation ran and the total time it took."""
+
+    name: str
+    labels: Mapping[str, str]
+    calls: int
+    seconds: float
+
+
+class Report(NamedTuple):
+    """Everything recorded since instrumentation was enabled or reset."""
+
+    counters: tuple[Counter, ...]
+    timings: tuple[Timing, ...]
+
+
+def enable():
+    """Start recording."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording. What has been recorded so far is kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """Discard everything recorded so far."""
+    with _lock:
+        _counters.clear()
+        _timings.clear()
+
+
+def _key(name: str, labels: Mapping[str, str]) -> _Key:
+    return name, tuple(sorted(labels.items()))
+
+
+def _count(name: str, amount: float = 1, **labels: str):
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def _observe(name: str, seconds: float, **labels: str):
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        calls, total = _timings.get(key, (0, 0.0))
+        _timings[key] = (calls + 1, total + seconds)
+
+
+@contextmanager
+def _timed(name: str, **labels: str) -> Iterator[None]:
+    """Record how long the body takes, if instrumentation is enabled."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _observe(name, time.perf_counter() - start, **labels)
+
+
+def report() -> Report:
+    """Return everything recorded so far, sorted by name and labels."""
+    with _lock:
+        counters = sorted(_counters.items())
+        timings = sorted(_timings.items())
+    return Report(
+        counters=tuple(
+            Counter(name, dict(labels), value) for (name, labels), value in counters
+        ),
+        timings=tuple(
+            Timing(name, dict(labels), calls, seconds)
+            for (name, labels), (calls, seconds) in timings
+        ),
+    )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _sample(name: str, labels: Mapping[str, str], value: float) -> str:
+    if labels:
+        label_text = ",".join(
+            f'{label}="{_escape(label_value)}"' for label, label_value in labels.items()
+        )
+        name = f"{name}{{{label_text}}}"
+    return f"{name} {value!r}\n"
+
+
+def prometheus_text() -> str:
+    """Return everything recorded so far in the Prometheus text exposition
+    format. Counters are exposed as ``counter`` metrics and timings as
+    ``summary`` metrics in seconds, all prefixed with ``rapids_metadata_``."""
+    current = report()
+    lines = []
+    previous = None
+    for counter in current.counters:
+        name = f"{_PREFIX}{counter.name}_total"
+        if name != previous:
+            lines.append(f"# TYPE {name} counter\n")
+            previous = name
+        lines.append(_sample(name, counter.labels, counter.value))
+    for timing in current.timings:
+        name = f"{_PREFIX}{timing.name}"
+        if name != previous:
+            lines.append(f"# TYPE {name} summary\n")
+            previous = name
+        lines.append(_sample(f"{name}_count", timing.labels, timing.calls))
+        lines.append(_sample(f"{name}_sum", timing.labels, timing.seconds))
+    return "".join(lines)
@@ -1,4 +1,4 @@
-# Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -13,27 +13,423 @@
 # limitations under the License.
 
 import argparse
+import csv
+import hashlib
 import json
 import os
+import shlex
 import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import lru_cache
 from typing import Any, TextIO
 
-from pydantic import TypeAdapter
+from pydantic import TypeAdapter, ValidationError
 
 from . import all_metadata
-from .metadata import RAPIDSMetadata
+from .adapters import get_json_schema, get_type_adapter
+from .delta import MetadataDelta, compute_delta, metadata_digest
+from .metadata import RAPIDSMetadata, RAPIDSPackage, RAPIDSVersion
 from .rapids_version import get_rapids_version
 
 __all__ = [
     "main",
 ]
 
+_INDEX = "index.json"
+_MAX_DELTAS = 50
 
-def main(argv: list[str] | None = None):
+
+def _dumps(data: Any, pretty: bool) -> str:
+    output = json.dumps(
+        data,
+        sort_keys=True,
+        separators=(",", ": ") if pretty else (",", ":"),
+        indent="  " if pretty else None,
+    )
+    if pretty:
+        output += "\n"
+    return output
+
+
+def _dump_json(adapter: TypeAdapter[Any], value: Any, pretty: bool) -> bytes:
+    """Serialize a value straight to JSON with pydantic. The output is the same
+    as ``_dumps(adapter.dump_python(value), pretty).encode()``."""
+    output = adapter.dump_json(
+        value, indent=2 if pretty else None, context={"sort_keys": True}
+    )
+    if not output.isascii():
+        # json.dumps() escapes non-ASCII characters, but pydantic doesn't.
+        return _dumps(adapter.dump_python(value), pretty).encode()
+    if pretty:
+        output += b"\n"
+    return output
+
+
+def _write_shards(metadata: RAPIDSMetadata, directory: str, pretty: bool):
+    """Write each version to ``<directory>/<version>.json``, and an index of
+    the versions and the SHA-256 of their files to ``<directory>/index.json``.
+    Shards of versions in the previous index that are no longer in the
+    metadata are removed. Other files in the directory are left alone."""
+    os.makedirs(directory, exist_ok=True)
+    index_path = os.path.join(directory, _INDEX)
+    try:
+        with open(index_path) as f:
+            previous_versions = list(json.load(f)["versions"])
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        previous_versions = []
+
+    version_adapter = get_type_adapter(RAPIDSVersion)
+    index = {}
+    for version, version_data in metadata.versions.items():
+        shard = _dump_json(version_adapter, version_data, pretty)
+        with open(os.path.join(directory, f"{version}.json"), "wb") as f:
+            f.write(shard)
+        index[version] = {"sha256": hashlib.sha256(shard).hexdigest()}
+    with open(index_path, "w") as f:
+        f.write(_dumps({"versions": index}, pretty))
+    for version in previous_versions:
+        filename = f"{version}.json"
+        # Don't follow an index that names files outside of the directory.
+        if version in index or os.path.basename(filename) != filename:
+            continue
+        try:
+            os.unlink(os.path.join(directory, filename))
+        except FileNotFoundError:
+            pass
+
+
+def _write_delta(
+    previous_path: str,
+    metadata: RAPIDSMetadata,
+    directory: str,
+    pretty: bool,
+):
+    """Write the delta from the metadata in ``previous_path`` to ``metadata``
+    to ``<directory>/<base digest>.json``, and record it in the chain in
+    ``<directory>/index.json``. Only the newest deltas are kept."""
+    os.makedirs(directory, exist_ok=True)
+    index_path = os.path.join(directory, _INDEX)
+    try:
+        with open(index_path) as f:
+            deltas = json.load(f)["deltas"]
+    except FileNotFoundError:
+        deltas = []
+
+    try:
+        with open(previous_path, "rb") as f:
+            previous = get_type_adapter(RAPIDSMetadata).validate_json(f.read())
+    except (FileNotFoundError, ValidationError):
+        previous = None
+    if previous is not None:
+        delta = compute_delta(previous, metadata)
+        if delta.base != delta.target:
+            with open(os.path.join(directory, f"{delta.base}.json"), "w") as f:
+                f.write(
+                    _dumps(get_type_adapter(MetadataDelta).dump_python(delta), pretty)
+                )
+            deltas = [entry for entry in deltas if entry["base"] != delta.base]
+            deltas.append({"base": delta.base, "target": delta.target})
+
+    for entry in deltas[:-_MAX_DELTAS]:
+        os.unlink(os.path.join(directory, f"{entry['base']}.json"))
+    with open(index_path, "w") as f:
+        f.write(
+            _dumps(
+                {
+                    "latest": metadata_digest(metadata),
+                    "deltas": deltas[-_MAX_DELTAS:],
+                },
+                pretty,
+            )
+        )
+
+
+_ROW_FIELDS = ("version", "repository", "package", *RAPIDSPackage.__dataclass_fields__)
+
+
+def _rows(metadata: RAPIDSMetadata) -> Iterator[dict[str, Any]]:
+    """Yield one flat row per package of each repository of each version, in
+    the same order as the JSON output."""
+    for version, version_data in sorted(metadata.versions.items()):
+        for repository, repository_data in sorted(version_data.repositories.items()):
+            for package, package_data in sorted(repository_data.packages.items()):
+                yield {
+                    "version": version,
+                    "repository": repository,
+                    "package": package,
+                    **{name: getattr(package_data, name) for name in _ROW_FIELDS[3:]},
+                }
+
+
+def _write_ndjson(metadata: RAPIDSMetadata, output: TextIO):
+    for row in _rows(metadata):
+        output.write(json.dumps(row) + "\n")
+
+
+def _write_csv(metadata: RAPIDSMetadata, output: TextIO):
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(_ROW_FIELDS)
+    for row in _rows(metadata):
+        # Spell booleans the way JSON does, which columnar tools recognize.
+        writer.writerow(
+            ("true" if value else "false") if isinstance(value, bool) else value
+            for value in row.values()
+        )
+
+
+def _dump_msgpack(metadata: RAPIDSMetadata) -> bytes:
+    import msgpack  # type: ignore[import-not-found, import-untyped]
+
+    return msgpack.packb(
+        get_type_adapter(RAPIDSMetadata).dump_python(
+            metadata, context={"sort_keys": True}
+        )
+    )
+
+
+_ROW_WRITERS: dict[str, Callable[[RAPIDSMetadata, TextIO], None]] = {
+    "ndjson": _write_ndjson,
+    "csv": _write_csv,
+}
+
+
+def _shell_array(name: str, values: Mapping[str, str]) -> str:
+    if not values:
+        return f"declare -gA {name}=()\n"
+    items = "".join(
+        f"  [{shlex.quote(key)}]={shlex.quote(value)}\n"
+        for key, value in sorted(values.items())
+    )
+    return f"declare -gA {name}=(\n{items})\n"
+
+
+def _dump_shell(version: str, version_data: RAPIDSVersion) -> str:
+    """Return a bash script that defines associative arrays keyed by the
+    packages of a version, to be sourced by shell scripts.
+
+    ``RAPIDS_REPO_OF`` maps each package to its repository. Each package that
+    has a property is mapped to ``1`` in ``RAPIDS_PRERELEASE``,
+    ``RAPIDS_CUDA_SUFFIXED``, ``RAPIDS_CONDA``, and ``RAPIDS_WHEEL``. The
+    arrays are global even if the script is sourced in a function.
+    """
+    return "".join(
+        [
+            f"RAPIDS_METADATA_VERSION={shlex.quote(version)}\n",
+            _shell_array("RAPIDS_REPO_OF", version_data.package_repositories),
+            *(
+                _shell_array(name, dict.fromkeys(packages, "1"))
+                for name, packages in [
+                    ("RAPIDS_PRERELEASE", version_data.prerelease_packages),
+                    ("RAPIDS_CUDA_SUFFIXED", version_data.cuda_suffixed_packages),
+                    ("RAPIDS_CONDA", version_data.conda_packages),
+                    ("RAPIDS_WHEEL", version_data.wheel_packages),
+                ]
+            ),
+        ]
+    )
+
+
+class _QueryError(Exception):
+    pass
+
+
+def _find_version_name(source: RAPIDSMetadata, version: str) -> str:
+    try:
+        name = source.find_version(version)
+    except ValueError:
+        name = None
+    if name is None:
+        raise _QueryError(f"RAPIDS version {version} not found")
+    return name
+
+
+def _find_version(source: RAPIDSMetadata, version: str) -> RAPIDSVersion:
+    return source.versions[_find_version_name(source, version)]
+
+
+def _get_package_repository(version: RAPIDSVersion, package: str) -> str:
+    try:
+        return version.package_repositories[package]
+    except KeyError:
+        raise _QueryError(f"Package {package} not found")
+
+
+def _get_package(version: RAPIDSVersion, package: str) -> RAPIDSPackage:
+    repository = _get_package_repository(version, package)
+    return version.repositories[repository].packages[package]
+
+
+def _get_repository_packages(version: RAPIDSVersion, repository: str) -> list[str]:
+    try:
+        return sorted(version.repositories[repository].packages)
+    except KeyError:
+        raise _QueryError(f"Repository {repository} not found")
+
+
+# Name, help, argument name, and function of each query subcommand
+_QUERIES: list[tuple[str, str, str | None, Callable[..., Any]]] = [
+    (
+        "has-cuda-suffix",
+        "Whether a package has a CUDA suffix",
+        "package",
+        lambda version, package: _get_package(version, package).has_cuda_suffix,
+    ),
+    (
+        "publishes-prereleases",
+        "Whether a package publishes prereleases",
+        "package",
+        lambda version, package: _get_package(version, package).publishes_prereleases,
+    ),
+    (
+        "has-conda-package",
+        "Whether a package is published as a Conda package",
+        "package",
+        lambda version, package: _get_package(version, package).has_conda_package,
+    ),
+    (
+        "has-wheel-package",
+        "Whether a package is published as a wheel",
+        "package",
+        lambda version, package: _get_package(version, package).has_wheel_package,
+    ),
+    (
+        "all-packages",
+        "List all packages",
+        None,
+        lambda version: sorted(version.all_packages),
+    ),
+    (
+        "prerelease-packages",
+        "List packages that publish prereleases",
+        None,
+        lambda version: sorted(version.prerelease_packages),
+    ),
+    (
+        "cuda-suffixed-packages",
+        "List packages that have a CUDA suffix",
+        None,
+        lambda version: sorted(version.cuda_suffixed_packages),
+    ),
+    (
+        "conda-packages",
+        "List packages that are published as Conda packages",
+        None,
+        lambda version: sorted(version.conda_packages),
+    ),
+    (
+        "wheel-packages",
+        "List packages that are published as wheels",
+        None,
+        lambda version: sorted(version.wheel_packages),
+    ),
+    (
+        "repositories",
+        "List all repositories",
+        None,
+        lambda version: sorted(version.repositories),
+    ),
+    (
+        "repository-of",
+        "Name of the repository that publishes a package",
+        "package",
+        _get_package_repository,
+    ),
+    (
+        "repository-packages",
+        "List the packages published by a repository",
+        "repository",
+        _get_repository_packages,
+    ),
+]
+
+
+def _get_package_info(version: RAPIDSVersion, package: str) -> dict[str, Any]:
+    repository = _get_package_repository(version, package)
+    return {
+        "repository": repository,
+        **get_type_adapter(RAPIDSPackage).dump_python(
+            version.repositories[repository].packages[package]
+        ),
+    }
+
+
+def _answer_batch(
+    source: RAPIDSMetadata,
+    default_version: str | None,
+    lines: Iterable[str],
+    output: TextIO,
+):
+    """Answer NDJSON queries from ``lines``, writing one NDJSON answer per
+    query to ``output`` as soon as it is known.
+
+    Each query is an object with a ``query`` name from :data:`_QUERIES`, the
+    argument of the query, and an optional ``version``. Without a ``query``,
+    the ``package`` is looked up and its repository and properties are
+    returned. The answer is the query with an ``answer`` or ``error`` added.
+    """
+    queries: dict[str | None, tuple[str | None, Callable[..., Any]]] = {
+        name: (argument, function) for name, _, argument, function in _QUERIES
+    }
+    queries[None] = ("package", _get_package_info)
+
+    @lru_cache(maxsize=256)
+    def get_version(version: str | None) -> RAPIDSVersion:
+        if version is not None:
+            return _find_version(source, version)
+        try:
+            return source.get_current_version(os.getcwd())
+        except (FileNotFoundError, KeyError):
+            raise _QueryError("No version given and no RAPIDS version found")
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            query = json.loads(line)
+        except ValueError as e:
+            response: dict[str, Any] = {"input": line.rstrip("\n"), "error": str(e)}
+        else:
+            response = query if isinstance(query, dict) else {"input": query}
+            try:
+                if not isinstance(query, dict):
+                    raise _QueryError("Query must be an object")
+                name = query.get("query")
+                if not isinstance(name, str | None) or name not in queries:
+                    raise _QueryError(f"Unknown query {name}")
+                argument, function = queries[name]
+                version = query.get("version", default_version)
+                if version is not None and not isinstance(version, str):
+                    raise _QueryError("Version must be a string")
+                version_data = get_version(version)
+                if argument is None:
+                    answer = function(version_data)
+                elif not isinstance(query.get(argument), str):
+                    raise _QueryError(f"Query must have a {argument} string")
+                else:
+                    answer = function(version_data, query[argument])
+            except _QueryError as e:
+                response = {**response, "error": str(e)}
+            else:
+                response = {**response, "answer": answer}
+        output.write(json.dumps(response) + "\n")
+        output.flush()
+
+
+def _format_answer(answer: Any) -> str:
+    if isinstance(answer, bool):
+        return "true\n" if answer else "false\n"
+    if isinstance(answer, list):
+        return "".join(f"{item}\n" for item in answer)
+    return f"{answer}\n"
+
+
+def main(argv: list[str] | None = None, *, source: RAPIDSMetadata | None = None):
     if argv is None:
         argv = sys.argv[1:]
+    if source is None:
+        source = all_metadata
 
-    parser = argparse.ArgumentParser()
+    parser = argparse.ArgumentParser(prog="rapids-metadata-json")
     parser.description = "Output RAPIDS metadata as a JSON document."
     parser.add_argument(
         "--all-versions",
@@ -48,48 +444,203 @@ def main(argv: list[str] | None = None):
     parser.add_argument(
         "--pretty", action="store_true", help="Pretty-print JSON output"
     )
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson", "csv", "msgpack", "shell"],
+        default="json",
+        help=(
+            "Output format. ndjson and csv output one row per package of each "
+            "repository of each version. msgpack outputs the JSON document as "
+            "MessagePack, and requires the msgpack package. shell outputs a "
+            "bash script to source, which defines associative arrays of the "
+            "packages of a single version"
+        ),
+    )
+    parser.add_argument(
+        "--rapids-version",
+        dest="version",
+        metavar="<version>",
+        help="Output this RAPIDS version instead of the one in the VERSION file",
+    )
     parser.add_argument(
         "-o",
         "--output",
         metavar="<output file>",
         help="Write to a file instead of stdout",
     )
+    parser.add_argument(
+        "--shard-dir",
+        metavar="<directory>",
+        help="Also write an index and one file per version to a directory",
+    )
+    parser.add_argument(
+        "--delta-dir",
+        metavar="<directory>",
+        help=(
+            "Also write the changes from the previous contents of the output "
+            "file to a chain of deltas in a directory"
+        ),
+    )
 
-    parsed = parser.parse_args(argv)
+    query_options = argparse.ArgumentParser(add_help=False)
+    query_options.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the answer as JSON instead of plain text",
+    )
+    query_options.add_argument(
+        "--rapids-version",
+        metavar="<version>",
+        help="Query this RAPIDS version instead of the one in the VERSION file",
+    )
+    subparsers = parser.add_subparsers(
+        dest="query",
+        metavar="<query>",
+        title="queries",
+        description=(
+            "Instead of outputting the metadata, answer a question about the "
+            "current RAPIDS version"
+        ),
+    )
+    for name, help_text, argument, function in _QUERIES:
+        query_parser = subparsers.add_parser(
+            name, help=help_text, description=help_text, parents=[query_options]
+        )
+        query_parser.set_defaults(query_argument=argument, query_function=function)
+        if argument is not None:
+            query_parser.add_argument(argument, metavar=f"<{argument}>")
+    batch_help = (
+        "Answer NDJSON queries read from stdin, such as "
+        '{"query": "has-cuda-suffix", "package": "cudf", "version": "24.08"}, '
+        "with one NDJSON line each"
+    )
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help=batch_help,
+        description=batch_help,
+        parents=[query_options],
+    )
+    batch_parser.set_defaults(query_argument=None, query_function=None)
 
-    def write_file(data: dict[str, Any], f: TextIO):
-        json.dump(
-            data,
-            f,
-            sort_keys=True,
-            separators=(",", ": ") if parsed.pretty else (",", ":"),
-            indent="  " if parsed.pretty else None,
+    parsed = parser.parse_args(argv)
+    if parsed.query and (
+        parsed.all_versions or parsed.schema or parsed.shard_dir or parsed.delta_dir
+    ):
+        parser.error(
+            "Queries can't be used with --all-versions, --schema, --shard-dir, "
+            "or --delta-dir"
+        )
+    if parsed.schema and parsed.shard_dir:
+        parser.error("--shard-dir can't be used with --schema")
+    if parsed.version is not None and (parsed.all_versions or parsed.schema):
+        parser.error("--rapids-version can't be used with --all-versions or --schema")
+    if parsed.delta_dir and (parsed.schema or not parsed.output):
+        parser.error("--delta-dir requires --output and can't be used with --schema")
+    if parsed.format != "json" and (
+        parsed.query
+        or parsed.schema
+        or parsed.shard_dir
+        or parsed.delta_dir
+        or parsed.pretty
+    ):
+        parser.error(
+            "--format can't be used with queries, --schema, --shard-dir, "
+            "--delta-dir, or --pretty"
         )
-        if parsed.pretty:
-            f.write("\n")
+    if parsed.format == "shell" and parsed.all_versions:
+        parser.error("--format shell can't be used with --all-versions")
+    if parsed.format == "msgpack":
+        try:
+            import msgpack  # type: ignore[import-not-found, import-untyped]  # noqa: F401
+        except ImportError:
+            parser.error(
+                "--format msgpack requires the msgpack package, install "
+                "rapids-metadata[msgpack]"
+            )
 
-    type_adapter = TypeAdapter(RAPIDSMetadata)
-    if parsed.schema:
-        data = type_adapter.json_schema()
+    # --rapids-version can be given before or after the query.
+    rapids_version = (
+        parsed.version
+        if getattr(parsed, "rapids_version", None) is None
+        else parsed.rapids_version
+    )
+    if parsed.query == "batch":
+        if parsed.output:
+            with open(parsed.output, "w") as f:
+                _answer_batch(source, rapids_version, sys.stdin, f)
+        else:
+            _answer_batch(source, rapids_version, sys.stdin, sys.stdout)
+        return
+    elif parsed.query:
+        try:
+            version_data = (
+                source.get_current_version(os.getcwd())
+                if rapids_version is None
+                else _find_version(source, rapids_version)
+            )
+            answer = (
+                parsed.query_function(version_data)
+                if parsed.query_argument is None
+                else parsed.query_function(
+                    version_data, getattr(parsed, parsed.query_argument)
+                )
+            )
+        except _QueryError as e:
+            sys.exit(str(e))
+        output = (
+            _dumps(answer, parsed.pretty) if parsed.json else _format_answer(answer)
+        ).encode()
+    elif parsed.schema:
+        output = _dumps(get_json_schema(RAPIDSMetadata), parsed.pretty).encode()
     else:
-        metadata = (
-            all_metadata
-            if parsed.all_versions
-            else RAPIDSMetadata(
+        if parsed.all_versions:
+            metadata = source
+        elif rapids_version is not None:
+            try:
+                version = _find_version_name(source, rapids_version)
+            except _QueryError as e:
+                sys.exit(str(e))
+            metadata = RAPIDSMetadata(versions={version: source.versions[version]})
+        else:
+            metadata = RAPIDSMetadata(
                 versions={
-                    get_rapids_version(os.getcwd()): all_metadata.get_current_version(
+                    get_rapids_version(os.getcwd()): source.get_current_version(
                         os.getcwd()
                     )
                 }
             )
-        )
-        data = type_adapter.dump_python(metadata)
+        if parsed.format in _ROW_WRITERS:
+            # Write rows as they are produced instead of building the output.
+            if parsed.output:
+                with open(parsed.output, "w", newline="") as f:
+                    _ROW_WRITERS[parsed.format](metadata, f)
+            else:
+                _ROW_WRITERS[parsed.format](metadata, sys.stdout)
+            return
+        if parsed.shard_dir:
+            _write_shards(metadata, parsed.shard_dir, parsed.pretty)
+        if parsed.delta_dir:
+            _write_delta(parsed.output, metadata, parsed.delta_dir, parsed.pretty)
+        if parsed.format == "shell":
+            ((version, version_data),) = metadata.versions.items()
+            output = _dump_shell(version, version_data).encode()
+        elif parsed.format == "msgpack":
+            output = _dump_msgpack(metadata)
+        else:
+            output = _dump_json(
+                get_type_adapter(RAPIDSMetadata), metadata, parsed.pretty
+            )
 
     if parsed.output:
-        with open(parsed.output, "w") as f:
-            write_file(data, f)
+        with open(parsed.output, "wb") as f:
+            f.write(output)
+    elif hasattr(sys.stdout, "buffer"):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.flush()
     else:
-        write_file(data, sys.stdout)
+        # Redirected to a text stream, e.g. by contextlib.redirect_stdout().
+        sys.stdout.write(output.decode())
 
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
-# Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -12,22 +12,225 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from copy import deepcopy
 from os import PathLike
+from typing import Annotated, Any, NamedTuple, TypeVar
 
-from pydantic import ConfigDict, Field
+from pydantic import (
+    AfterValidator,
+    ConfigDict,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    WrapSerializer,
+)
 from pydantic.dataclasses import dataclass
 
+from ._shared import (
+    _build_version_index,
+    _ceiling_version,
+    _compute_package_index,
+    _compute_package_sets,
+    _find_version,
+    _floor_version,
+    _package_fields,
+    _package_flags,
+    _PackageSets,
+    _VersionIndex,
+)
+from .instrumentation import _count
 from .rapids_version import get_rapids_version
 
 __all__ = [
     "RAPIDSMetadata",
     "RAPIDSPackage",
+    "RAPIDSPackageRelease",
     "RAPIDSRepository",
     "RAPIDSVersion",
 ]
 
+_K = TypeVar("_K")
+_V = TypeVar("_V")
 
-@dataclass
+# Replaced with a new object whenever any metadata is modified. Cached views
+# record the token they were computed under and are discarded when it changes.
+_generation = object()
+
+
+def _modified():
+    global _generation
+    _generation = object()
+
+
+def _cached(obj: Any, name: str, compute: Callable[[], _V]) -> _V:
+    """Return a view cached on obj, computing it again if anything has been
+    modified since it was cached."""
+    cached = obj.__dict__.get(name)
+    if cached is not None and cached[0] is _generation:
+        return cached[1]
+    generation = _generation
+    value = compute()
+    # Bypass _Tracked.__setattr__, which would invalidate the cache.
+    obj.__dict__[name] = (generation, value)
+    return value
+
+
+class _TrackedDict(dict[_K, _V]):
+    """dict that invalidates cached views when it is modified."""
+
+    __slots__ = ()
+
+    def __setitem__(self, key: _K, value: _V):
+        _modified()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: _K):
+        _modified()
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> "_TrackedDict[_K, _V]":  # type: ignore[override,misc]
+        _modified()
+        return super().__ior__(other)
+
+    def clear(self):
+        _modified()
+        super().clear()
+
+    def pop(self, *args: Any) -> Any:
+        _modified()
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[_K, _V]:
+        _modified()
+        return super().popitem()
+
+    def setdefault(self, *args: Any) -> Any:
+        _modified()
+        return super().setdefault(*args)
+
+    def update(self, *args: Any, **kwargs: Any):
+        _modified()
+        super().update(*args, **kwargs)
+
+
+class _Tracked:
+    """Base class for metadata objects that invalidate cached views when an
+    attribute is assigned."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any):
+        if type(value) is dict:
+            value = _TrackedDict(value)
+        _modified()
+        super().__setattr__(name, value)
+
+
+class _Unvalidated:
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any):
+        self.data = data
+
+    def __repr__(self) -> str:
+        return "<unvalidated>"
+
+
+class _LazyDict(MutableMapping[_K, _V]):
+    """Mapping whose values are validated from raw data on first access.
+
+    Iterating over the keys, checking membership, and taking the length don't
+    validate anything. Values that fail validation raise
+    :class:`~pydantic.ValidationError` when they are read.
+    """
+
+    __slots__ = ("_entries", "_validate")
+
+    def __init__(self, raw: Mapping[_K, Any], validate: Callable[[Any], _V]):
+        self._entries: dict[_K, Any] = {
+            key: _Unvalidated(value) for key, value in raw.items()
+        }
+        self._validate = validate
+
+    def __getitem__(self, key: _K) -> _V:
+        value = self._entries[key]
+        if type(value) is _Unvalidated:
+            # Not a modification, so cached views stay valid.
+            value = self._entries[key] = self._validate(value.data)
+        return value
+
+    def __setitem__(self, key: _K, value: _V):
+        _modified()
+        self._entries[key] = value
+
+    def __delitem__(self, key: _K):
+        _modified()
+        del self._entries[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def validate_all(self):
+        """Validate every value that hasn't been read yet."""
+        for key in self._entries:
+            self[key]
+
+    def __repr__(self) -> str:
+        # Don't validate anything, asyncio takes the repr of task results.
+        return repr(self._entries)
+
+    def __copy__(self) -> dict[_K, _V]:
+        return _TrackedDict(_flatten(self))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[_K, _V]:
+        return _TrackedDict(
+            (key, deepcopy(value, memo)) for key, value in _flatten(self).items()
+        )
+
+
+def _flatten(mapping: Mapping[_K, _V]) -> dict[_K, _V]:
+    """Return the contents of a mapping as a dict, without copying dicts."""
+    if isinstance(mapping, dict):
+        return mapping
+    return {key: mapping[key] for key in mapping}
+
+
+def _sort_keys(info: SerializationInfo) -> bool:
+    """Whether serialization was asked to sort keys with
+    ``context={"sort_keys": True}``."""
+    return isinstance(info.context, dict) and bool(info.context.get("sort_keys"))
+
+
+def _serialize_mapping(
+    value: Mapping[str, Any],
+    handler: SerializerFunctionWrapHandler,
+    info: SerializationInfo,
+) -> Any:
+    value = _flatten(value)
+    if _sort_keys(info):
+        value = dict(sorted(value.items()))
+    return handler(value)
+
+
+_Dict = Annotated[
+    dict[str, _V],
+    AfterValidator(_TrackedDict),
+    WrapSerializer(_serialize_mapping),
+]
+
+
+# Packages are immutable. There are only 16 distinct packages, one for each
+# combination of flags, and metadata shares a single instance of each of them.
+# To change a package's flags, replace it in its repository. The docstring is
+# part of the JSON schema, so these notes live here instead.
+@dataclass(frozen=True)
 class RAPIDSPackage:
     """Package published by a RAPIDS repository. Includes both Python packages and Conda packages."""
 
@@ -51,51 +254,166 @@ class RAPIDSPackage:
         description="""Whether or not the package exists as a wheel package.""",
     )
 
+    @property
+    def flags(self) -> int:
+        """The package's flags packed into a 4-bit integer, with
+        ``publishes_prereleases`` as the least significant bit."""
+        return _package_flags(self)
+
+    @classmethod
+    def from_flags(cls, flags: int) -> "RAPIDSPackage":
+        """Return the shared package with the given flags. The inverse of
+        :attr:`flags`."""
+        try:
+            return _packages[flags]
+        except KeyError:
+            pass
+        return _intern(cls(**_package_fields(flags)))
+
+    def __copy__(self) -> "RAPIDSPackage":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "RAPIDSPackage":
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (RAPIDSPackage.from_flags, (self.flags,))
+
+
+_packages: dict[int, RAPIDSPackage] = {}
+
+
+def _intern(package: RAPIDSPackage) -> RAPIDSPackage:
+    """Return the shared package with the same flags as the given one."""
+    return _packages.setdefault(package.flags, package)
+
+
+_InternedPackage = Annotated[RAPIDSPackage, AfterValidator(_intern)]
+
+_sorted_package_fields: dict[int, dict[str, bool]] = {}
+
+
+def _serialize_packages(
+    value: Mapping[str, RAPIDSPackage],
+    handler: SerializerFunctionWrapHandler,
+    info: SerializationInfo,
+) -> Any:
+    if not _sort_keys(info):
+        return handler(_flatten(value))
+    # Packages serialize their fields in declaration order, so substitute a
+    # plain dict with sorted keys for each of the 16 kinds of package.
+    packages = {}
+    for package, package_data in sorted(_flatten(value).items()):
+        try:
+            fields = _sorted_package_fields[package_data.flags]
+        except KeyError:
+            fields = _sorted_package_fields.setdefault(
+                package_data.flags,
+                {
+                    name: getattr(package_data, name)
+                    for name in sorted(package_data.__dataclass_fields__)
+                },
+            )
+        packages[package] = fields
+    return packages
+
 
 @dataclass
-class RAPIDSRepository:
+class RAPIDSRepository(_Tracked):
     """RAPIDS Git repository. Can publish more than one package."""
 
-    packages: dict[str, RAPIDSPackage] = Field(
-        default_factory=dict,
+    packages: Annotated[
+        dict[str, _InternedPackage],
+        AfterValidator(_TrackedDict),
+        WrapSerializer(_serialize_packages),
+    ] = Field(
+        default_factory=_TrackedDict,
         description="""Dictionary of packages in this repository by name.""",
     )
 
+    def derive(self) -> "RAPIDSRepository":
+        """Return a copy of this repository for a new version to modify.
+
+        Packages are immutable, so the copy shares them and only the
+        dictionary of packages is copied. Modifying either repository doesn't
+        affect the other.
+        """
+        repository: RAPIDSRepository = object.__new__(RAPIDSRepository)
+        # Skip validation, the packages are already valid.
+        object.__setattr__(repository, "packages", _TrackedDict(self.packages))
+        return repository
+
 
 @dataclass
-class RAPIDSVersion:
+class RAPIDSVersion(_Tracked):
     """Version of RAPIDS, which contains many Git repositories."""
 
-    repositories: dict[str, RAPIDSRepository] = Field(
-        default_factory=dict,
+    repositories: _Dict[RAPIDSRepository] = Field(
+        default_factory=_TrackedDict,
         description="""Dictionary of repositories in this version by name.""",
     )
 
+    def derive(self) -> "RAPIDSVersion":
+        """Return a copy of this version for the next release to modify.
+
+        Each repository is copied with :meth:`RAPIDSRepository.derive`, so the
+        copy shares the immutable packages but none of the dictionaries.
+        Modifying either version doesn't affect the other.
+        """
+        version: RAPIDSVersion = object.__new__(RAPIDSVersion)
+        object.__setattr__(
+            version,
+            "repositories",
+            _TrackedDict(
+                (repository, repository_data.derive())
+                for repository, repository_data in self.repositories.items()
+            ),
+        )
+        return version
+
+    def flatten(self) -> "RAPIDSVersion":
+        """Return a deep, independent copy of this version."""
+        return deepcopy(self)
+
+    def _package_sets(self) -> _PackageSets:
+        return _cached(self, "_cached_package_sets", self._compute_package_sets)
+
+    def _compute_package_sets(self) -> _PackageSets:
+        return _compute_package_sets(self.repositories)
+
     @property
-    def all_packages(self) -> set[str]:
-        return {
-            package
-            for repository_data in self.repositories.values()
-            for package in repository_data.packages
-        }
+    def all_packages(self) -> frozenset[str]:
+        return self._package_sets().all
 
     @property
-    def prerelease_packages(self) -> set[str]:
-        return {
-            package
-            for repository_data in self.repositories.values()
-            for package, package_data in repository_data.packages.items()
-            if package_data.publishes_prereleases
-        }
+    def prerelease_packages(self) -> frozenset[str]:
+        return self._package_sets().prerelease
 
     @property
-    def cuda_suffixed_packages(self) -> set[str]:
-        return {
-            package
-            for repository_data in self.repositories.values()
-            for package, package_data in repository_data.packages.items()
-            if package_data.has_cuda_suffix
-        }
+    def cuda_suffixed_packages(self) -> frozenset[str]:
+        return self._package_sets().cuda_suffixed
+
+    @property
+    def conda_packages(self) -> frozenset[str]:
+        return self._package_sets().conda
+
+    @property
+    def wheel_packages(self) -> frozenset[str]:
+        return self._package_sets().wheel
+
+    @property
+    def package_repositories(self) -> Mapping[str, str]:
+        """Read-only mapping from package name to the repository that
+        publishes it."""
+        return self._package_sets().repositories
+
+
+class RAPIDSPackageRelease(NamedTuple):
+    """A package as published in a single RAPIDS version."""
+
+    version: str
+    repository: str
+    package: RAPIDSPackage
 
 
 @dataclass(
@@ -105,17 +423,57 @@ class RAPIDSVersion:
         },
     )
 )
-class RAPIDSMetadata:
+class RAPIDSMetadata(_Tracked):
     """All RAPIDS metadata."""
 
-    versions: dict[str, RAPIDSVersion] = Field(
-        default_factory=dict,
+    versions: _Dict[RAPIDSVersion] = Field(
+        default_factory=_TrackedDict,
         description=(
             """Dictionary of RAPIDS versions by <major>.<minor> """
             """version string."""
         ),
     )
 
+    def _version_index(self) -> _VersionIndex:
+        return _cached(self, "_cached_version_index", self._compute_version_index)
+
+    def _compute_version_index(self) -> _VersionIndex:
+        from packaging.version import Version
+
+        return _build_version_index(self.versions, Version)
+
+    @property
+    def sorted_versions(self) -> tuple[str, ...]:
+        """Version strings, sorted from oldest to newest."""
+        return self._version_index().names
+
+    @property
+    def latest_version(self) -> str | None:
+        """The newest version, or ``None`` if there are no versions."""
+        names = self._version_index().names
+        return names[-1] if names else None
+
+    def find_version(self, version: str) -> str | None:
+        """Return the version string equal to ``version``, or ``None``.
+        Versions are compared as versions, so ``"24.8"`` finds ``"24.08"``."""
+        from packaging.version import Version
+
+        return _find_version(self._version_index(), Version(version))
+
+    def floor_version(self, version: str) -> str | None:
+        """Return the latest version less than or equal to ``version``, or
+        ``None`` if every version is newer."""
+        from packaging.version import Version
+
+        return _floor_version(self._version_index(), Version(version))
+
+    def ceiling_version(self, version: str) -> str | None:
+        """Return the earliest version greater than or equal to ``version``, or
+        ``None`` if every version is older."""
+        from packaging.version import Version
+
+        return _ceiling_version(self._version_index(), Version(version))
+
     def get_current_version(
         self,
         directory: str | PathLike[str],
@@ -125,11 +483,39 @@ class RAPIDSMetadata:
 
         current_version = get_rapids_version(directory, version_file)
         try:
-            return self.versions[current_version]
+            version = self.versions[current_version]
         except KeyError:
-            max_version, max_version_data = max(
-                self.versions.items(), key=lambda item: Version(item[0])
-            )
-            if Version(current_version) > Version(max_version):
-                return max_version_data
+            index = self._version_index()
+            if index.keys and Version(current_version) > index.keys[-1]:
+                _count("current_version_lookups", result="fallback")
+                return self.versions[index.names[-1]]
+            _count("current_version_lookups", result="missing")
             raise
+        _count("current_version_lookups", result="exact")
+        return version
+
+    @property
+    def package_index(self) -> Mapping[str, tuple[RAPIDSPackageRelease, ...]]:
+        """Read-only mapping from package name to every release of that
+        package, sorted by version. Built on first access and rebuilt after the
+        metadata is modified."""
+        return _cached(self, "_cached_package_index", self._compute_package_index)
+
+    def _compute_package_index(
+        self,
+    ) -> Mapping[str, tuple[RAPIDSPackageRelease, ...]]:
+        return _compute_package_index(
+            self.sorted_versions, self.versions, RAPIDSPackageRelease
+        )
+
+    def get_package_releases(self, package: str) -> tuple[RAPIDSPackageRelease, ...]:
+        """Return every release of a package, sorted by version, or an empty
+        tuple if no version of RAPIDS contains it."""
+        return self.package_index.get(package, ())
+
+    def validate_all(self):
+        """Validate every version that was loaded lazily and hasn't been read
+        yet, see :func:`rapids_metadata.remote.fetch_from_url_async`. Raises
+        :class:`~pydantic.ValidationError` if any of them is invalid."""
+        if isinstance(self.versions, _LazyDict):
+            self.versions.validate_all()
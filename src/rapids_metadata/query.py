@@ -0,0 +1,328 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Read-only RAPIDS metadata for programs that only query it.
+
+:data:`all_metadata` holds the same metadata as
+:data:`rapids_metadata.all_metadata`, loaded from the same snapshot, in
+immutable classes with the same properties and query methods as those in
+:mod:`rapids_metadata.metadata`. Neither pydantic nor packaging is imported,
+which keeps the startup time of short-lived processes, such as ``pre-commit``
+hooks, low. The metadata can't be modified, validated, or serialized. Use
+:mod:`rapids_metadata.metadata` for that.
+
+Versions are compared by their release segments, so ``"24.8"`` and
+``"24.08.0"`` are equal, and pre-, post-, and development releases compare
+equal to their release.
+"""
+
+from collections.abc import Mapping
+from os import PathLike
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from ._shared import (
+    SNAPSHOT_PATH,
+    _build_version_index,
+    _ceiling_version,
+    _compute_package_index,
+    _compute_package_sets,
+    _find_version,
+    _floor_version,
+    _load_snapshot,
+    _package_fields,
+    _package_flags,
+    _PackageSets,
+    _resolve_snapshot,
+    _VersionIndex,
+)
+from .instrumentation import _count
+from .rapids_version import _parse_release, get_rapids_version
+
+__all__ = [
+    "RAPIDSMetadata",
+    "RAPIDSPackage",
+    "RAPIDSPackageRelease",
+    "RAPIDSRepository",
+    "RAPIDSVersion",
+    "all_metadata",
+    "load",
+    "loads",
+]
+
+
+class _Frozen:
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+
+class RAPIDSPackage(NamedTuple):
+    """Package published by a RAPIDS repository. All 16 packages are shared,
+    use :meth:`from_flags` to get one."""
+
+    publishes_prereleases: bool = True
+    has_cuda_suffix: bool = True
+    has_conda_package: bool = True
+    has_wheel_package: bool = True
+
+    @property
+    def flags(self) -> int:
+        """The package's flags packed into a 4-bit integer, with
+        ``publishes_prereleases`` as the least significant bit."""
+        return _package_flags(self)
+
+    @classmethod
+    def from_flags(cls, flags: int) -> "RAPIDSPackage":
+        """Return the shared package with the given flags. The inverse of
+        :attr:`flags`."""
+        if flags in _packages:
+            return _packages[flags]
+        # Every valid package is in _packages, so this raises ValueError.
+        return cls(**_package_fields(flags))
+
+
+_packages = {flags: RAPIDSPackage(**_package_fields(flags)) for flags in range(16)}
+
+
+class RAPIDSPackageRelease(NamedTuple):
+    """A package as published in a single RAPIDS version."""
+
+    version: str
+    repository: str
+    package: RAPIDSPackage
+
+
+class RAPIDSRepository(_Frozen):
+    """RAPIDS Git repository. Can publish more than one package."""
+
+    __slots__ = ("packages",)
+
+    packages: Mapping[str, RAPIDSPackage]
+
+    def __init__(self, packages: Mapping[str, RAPIDSPackage]):
+        object.__setattr__(self, "packages", MappingProxyType(dict(packages)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RAPIDSRepository):
+            return NotImplemented
+        return self.packages == other.packages
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RAPIDSRepository(packages={dict(self.packages)!r})"
+
+
+class RAPIDSVersion(_Frozen):
+    """Version of RAPIDS, which contains many Git repositories."""
+
+    __slots__ = ("repositories", "_package_sets")
+
+    repositories: Mapping[str, RAPIDSRepository]
+    _package_sets: _PackageSets | None
+
+    def __init__(self, repositories: Mapping[str, RAPIDSRepository]):
+        object.__setattr__(self, "repositories", MappingProxyType(dict(repositories)))
+        object.__setattr__(self, "_package_sets", None)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RAPIDSVersion):
+            return NotImplemented
+        return self.repositories == other.repositories
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RAPIDSVersion(repositories={dict(self.repositories)!r})"
+
+    def _get_package_sets(self) -> _PackageSets:
+        package_sets = self._package_sets
+        if package_sets is None:
+            package_sets = self._compute_package_sets()
+            object.__setattr__(self, "_package_sets", package_sets)
+        return package_sets
+
+    def _compute_package_sets(self) -> _PackageSets:
+        return _compute_package_sets(self.repositories)
+
+    @property
+    def all_packages(self) -> frozenset[str]:
+        return self._get_package_sets().all
+
+    @property
+    def prerelease_packages(self) -> frozenset[str]:
+        return self._get_package_sets().prerelease
+
+    @property
+    def cuda_suffixed_packages(self) -> frozenset[str]:
+        return self._get_package_sets().cuda_suffixed
+
+    @property
+    def conda_packages(self) -> frozenset[str]:
+        return self._get_package_sets().conda
+
+    @property
+    def wheel_packages(self) -> frozenset[str]:
+        return self._get_package_sets().wheel
+
+    @property
+    def package_repositories(self) -> Mapping[str, str]:
+        """Read-only mapping from package name to the repository that
+        publishes it."""
+        return self._get_package_sets().repositories
+
+
+def _version_key(version: str) -> tuple[int, ...]:
+    release = _parse_release(version)
+    if release is None:
+        raise ValueError(f"Invalid version: {version!r}")
+    # Trailing zeros don't change a version's value.
+    end = len(release)
+    while end > 1 and release[end - 1] == 0:
+        end -= 1
+    return release[:end]
+
+
+class RAPIDSMetadata(_Frozen):
+    """All RAPIDS metadata."""
+
+    __slots__ = ("versions", "_version_index", "_package_index")
+
+    versions: Mapping[str, RAPIDSVersion]
+    _version_index: _VersionIndex | None
+    _package_index: Mapping[str, tuple[RAPIDSPackageRelease, ...]] | None
+
+    def __init__(self, versions: Mapping[str, RAPIDSVersion]):
+        object.__setattr__(self, "versions", MappingProxyType(dict(versions)))
+        object.__setattr__(self, "_version_index", None)
+        object.__setattr__(self, "_package_index", None)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RAPIDSMetadata):
+            return NotImplemented
+        return self.versions == other.versions
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RAPIDSMetadata(versions={dict(self.versions)!r})"
+
+    def _get_version_index(self) -> _VersionIndex:
+        index = self._version_index
+        if index is None:
+            index = _build_version_index(self.versions, _version_key)
+            object.__setattr__(self, "_version_index", index)
+        return index
+
+    @property
+    def sorted_versions(self) -> tuple[str, ...]:
+        """Version strings, sorted from oldest to newest."""
+        return self._get_version_index().names
+
+    @property
+    def latest_version(self) -> str | None:
+        """The newest version, or ``None`` if there are no versions."""
+        names = self._get_version_index().names
+        return names[-1] if names else None
+
+    def find_version(self, version: str) -> str | None:
+        """Return the version string equal to ``version``, or ``None``.
+        Versions are compared as versions, so ``"24.8"`` finds ``"24.08"``."""
+        return _find_version(self._get_version_index(), _version_key(version))
+
+    def floor_version(self, version: str) -> str | None:
+        """Return the latest version less than or equal to ``version``, or
+        ``None`` if every version is newer."""
+        return _floor_version(self._get_version_index(), _version_key(version))
+
+    def ceiling_version(self, version: str) -> str | None:
+        """Return the earliest version greater than or equal to ``version``, or
+        ``None`` if every version is older."""
+        return _ceiling_version(self._get_version_index(), _version_key(version))
+
+    def get_current_version(
+        self,
+        directory: str | PathLike[str],
+        version_file: str | PathLike[str] = "VERSION",
+    ) -> RAPIDSVersion:
+        current_version = get_rapids_version(directory, version_file)
+        try:
+            version = self.versions[current_version]
+        except KeyError:
+            names, keys = self._get_version_index()
+            if keys and _version_key(current_version) > keys[-1]:
+                _count("current_version_lookups", result="fallback")
+                return self.versions[names[-1]]
+            _count("current_version_lookups", result="missing")
+            raise
+        _count("current_version_lookups", result="exact")
+        return version
+
+    @property
+    def package_index(self) -> Mapping[str, tuple[RAPIDSPackageRelease, ...]]:
+        """Read-only mapping from package name to every release of that
+        package, sorted by version. Built on first access."""
+        package_index = self._package_index
+        if package_index is None:
+            package_index = self._compute_package_index()
+            object.__setattr__(self, "_package_index", package_index)
+        return package_index
+
+    def _compute_package_index(
+        self,
+    ) -> Mapping[str, tuple[RAPIDSPackageRelease, ...]]:
+        return _compute_package_index(
+            self.sorted_versions, self.versions, RAPIDSPackageRelease
+        )
+
+    def get_package_releases(self, package: str) -> tuple[RAPIDSPackageRelease, ...]:
+        """Return every release of a package, sorted by version, or an empty
+        tuple if no version of RAPIDS contains it."""
+        return self.package_index.get(package, ())
+
+
+def loads(data: bytes) -> RAPIDSMetadata:
+    """Build read-only metadata from the format of
+    :mod:`rapids_metadata.snapshot`."""
+    return RAPIDSMetadata(
+        {
+            version: RAPIDSVersion(repositories)
+            for version, repositories in _resolve_snapshot(
+                _load_snapshot(data), _packages.__getitem__, RAPIDSRepository
+            )
+        }
+    )
+
+
+def load(path: str | PathLike[str] = SNAPSHOT_PATH) -> RAPIDSMetadata:
+    """Load a snapshot file, by default the one shipped with this package."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return loads(data)
+
+
+all_metadata: RAPIDSMetadata
+
+
+def __getattr__(name: str) -> RAPIDSMetadata:
+    if name == "all_metadata":
+        global all_metadata
+        all_metadata = load()
+        return all_metadata
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-# Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -12,25 +12,157 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import os.path
+from collections.abc import Iterable
 from os import PathLike
 
-__all__ = ["get_rapids_version"]
+from .instrumentation import _count
 
+__all__ = ["RAPIDSVersionResolver", "get_rapids_version"]
 
-def get_rapids_version(
-    directory: str | PathLike[str],
-    version_file: str | PathLike[str] = "VERSION",
-) -> str:
-    from packaging.version import InvalidVersion, Version
+# (st_mtime_ns, st_size, st_ino) of a VERSION file, or None if it doesn't exist
+_StatKey = tuple[int, int, int] | None
+
+
+# The version scheme of PEP 440, as accepted by packaging.version.Version.
+# Compiled on first use.
+_VERSION_PATTERN = r"""
+    \s*v?
+    (?:[0-9]+!)?
+    (?P<release>[0-9]+(?:\.[0-9]+)*)
+    (?:[-_.]?(?:alpha|a|beta|b|preview|pre|c|rc)[-_.]?[0-9]*)?
+    (?:-[0-9]+|[-_.]?(?:post|rev|r)[-_.]?[0-9]*)?
+    (?:[-_.]?dev[-_.]?[0-9]*)?
+    (?:\+[a-z0-9]+(?:[-_.][a-z0-9]+)*)?
+    \s*
+"""
+_version_regex = None
+
+
+def _parse_release(version: str) -> tuple[int, ...] | None:
+    """Return the release segment of a PEP 440 version, such as ``(24, 8, 0)``
+    for ``"24.08.00a1"``, or ``None`` if it isn't a valid version.
+
+    This is used instead of :mod:`packaging`, which is slow to import.
+    """
+    global _version_regex
+    if _version_regex is None:
+        import re
+
+        _version_regex = re.compile(_VERSION_PATTERN, re.VERBOSE | re.IGNORECASE)
+    match = _version_regex.fullmatch(version)
+    if match is None:
+        return None
+    return tuple(int(part) for part in match["release"].split("."))
+
+
+def _read_version_file(path: str) -> str | None:
+    try:
+        with open(path) as f:
+            release = _parse_release(f.read())
+    except FileNotFoundError:
+        return None
+    if release is None:
+        return None
+    major, minor = (*release, 0)[:2]
+    return f"{major:02}.{minor:02}"
+
+
+class RAPIDSVersionResolver:
+    """Finds the RAPIDS version of directories from the nearest VERSION file at
+    or above them.
+
+    Each directory's VERSION file is parsed once and cached. A cached entry is
+    reused until the file's modification time, size, or inode changes, so
+    checking a directory costs a single ``stat()``. Lookups through
+    :meth:`resolve_many` also share the directories they have in common.
+    """
 
-    while not os.path.samefile(directory, os.path.dirname(directory)):
+    def __init__(self, version_file: str | PathLike[str] = "VERSION"):
+        self.version_file = version_file
+        self._entries: dict[str, tuple[_StatKey, str | None]] = {}
+
+    def _read(self, directory: str) -> str | None:
+        path = os.path.join(directory, self.version_file)
+        key: _StatKey
         try:
-            with open(os.path.join(directory, version_file)) as f:
-                version = Version(f.read())
-        except (FileNotFoundError, InvalidVersion):
-            directory = os.path.dirname(directory)
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            key = None
         else:
-            return f"{version.major:02}.{version.minor:02}"
+            key = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        entry = self._entries.get(directory)
+        if entry is not None and entry[0] == key:
+            _count("version_file_probes", result="missing" if key is None else "cached")
+            return entry[1]
+        _count("version_file_probes", result="missing" if key is None else "parsed")
+        version = None if key is None else _read_version_file(path)
+        self._entries[directory] = (key, version)
+        return version
+
+    def _resolve(
+        self, directory: str | PathLike[str], resolved: dict[str, str | None]
+    ) -> str | None:
+        directory = os.path.abspath(directory)
+        visited = []
+        while True:
+            try:
+                result = resolved[directory]
+                break
+            except KeyError:
+                pass
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                result = None
+                break
+            visited.append(directory)
+            result = self._read(directory)
+            if result is not None:
+                break
+            directory = parent
+
+        for directory in visited:
+            resolved[directory] = result
+        return result
+
+    def resolve(self, directory: str | PathLike[str]) -> str:
+        """Return the ``<major>.<minor>`` RAPIDS version of a directory.
+
+        Raises :class:`FileNotFoundError` if there is no valid VERSION file in
+        the directory or any of its parents.
+        """
+        result = self._resolve(directory, {})
+        if result is None:
+            raise FileNotFoundError
+        return result
+
+    def resolve_many(
+        self, directories: Iterable[str | PathLike[str]]
+    ) -> list[str | None]:
+        """Return the RAPIDS version of each directory, or ``None`` for
+        directories that don't have one. Each ancestor directory is checked at
+        most once."""
+        resolved: dict[str, str | None] = {}
+        return [self._resolve(directory, resolved) for directory in directories]
+
+    def clear(self):
+        """Forget all cached VERSION files."""
+        self._entries.clear()
 
-    raise FileNotFoundError
+
+_resolvers: dict[str | PathLike[str], RAPIDSVersionResolver] = {}
+
+
+def get_rapids_version(
+    directory: str | PathLike[str],
+    version_file: str | PathLike[str] = "VERSION",
+) -> str:
+    try:
+        resolver = _resolvers[version_file]
+    except KeyError:
+        resolver = _resolvers.setdefault(
+            version_file, RAPIDSVersionResolver(version_file)
+        )
+    return resolver.resolve(directory)
@@ -1,4 +1,4 @@
-# Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -12,21 +12,750 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import marshal
+import os
+import time
+import urllib.error
+import urllib.parse
 import urllib.request
+from collections.abc import Coroutine, Iterable
+from functools import cache
+from typing import Any, NamedTuple, TypeVar
 
-import pydantic
+from pydantic import Field
+from pydantic.dataclasses import dataclass
 
-from .metadata import RAPIDSMetadata
+from . import snapshot
+from ._cache import _cache_directory, _prune, _write_atomic
+from ._shared import _SNAPSHOT_FORMAT_VERSION
+from .adapters import get_type_adapter
+from .delta import MetadataDelta, apply_delta, metadata_digest
+from .instrumentation import _count, _observe, _timed
+from .metadata import RAPIDSMetadata, RAPIDSVersion, _LazyDict
 
-__all__ = ["fetch_latest"]
+__all__ = [
+    "HTTPCache",
+    "ValidationCache",
+    "fetch_all_async",
+    "fetch_from_url_async",
+    "fetch_latest",
+    "fetch_latest_async",
+    "fetch_version",
+    "fetch_version_async",
+    "update_metadata",
+    "update_metadata_async",
+]
 
 _GITHUB_METADATA_URL = "https://raw.githubusercontent.com/rapidsai/rapids-metadata/main/rapids-metadata.json"
+_GITHUB_SHARD_URL = (
+    "https://raw.githubusercontent.com/rapidsai/rapids-metadata/main/rapids-metadata/"
+)
+_GITHUB_DELTA_URL = "https://raw.githubusercontent.com/rapidsai/rapids-metadata/main/rapids-metadata-deltas/"
 
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
 
-def _fetch_from_url(url: str) -> RAPIDSMetadata:
-    with urllib.request.urlopen(url) as f:
-        return pydantic.TypeAdapter(RAPIDSMetadata).validate_json(f.read())
+_T = TypeVar("_T")
 
 
-def fetch_latest() -> RAPIDSMetadata:
-    return _fetch_from_url(_GITHUB_METADATA_URL)
+class _CacheEntry(NamedTuple):
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    checked: float
+
+
+@dataclasses.dataclass(frozen=True)
+class HTTPCache:
+    """On-disk cache of downloaded metadata documents.
+
+    A cached document is used without contacting the server for ``ttl``
+    seconds after it was last fetched or revalidated. After that, the server is
+    asked for the document with ``If-None-Match`` and ``If-Modified-Since``
+    headers, so an unchanged document is not downloaded again. If the server
+    can't be reached or returns an error, the cached document is used
+    regardless of its age.
+
+    By default, documents are stored in ``$XDG_CACHE_HOME/rapids-metadata``.
+    """
+
+    directory: str = dataclasses.field(default_factory=lambda: _cache_directory("http"))
+    ttl: float = 300.0
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return (
+            os.path.join(self.directory, f"{key}.body"),
+            os.path.join(self.directory, f"{key}.json"),
+        )
+
+    def _load(self, url: str) -> _CacheEntry | None:
+        body_path, info_path = self._paths(url)
+        try:
+            with open(info_path) as f:
+                info = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if info.get("url") != url or info.get("sha256") != (
+            hashlib.sha256(body).hexdigest()
+        ):
+            return None
+        return _CacheEntry(
+            body=body,
+            etag=info.get("etag"),
+            last_modified=info.get("last_modified"),
+            checked=info.get("checked", 0.0),
+        )
+
+    def _store(self, url: str, entry: _CacheEntry):
+        body_path, info_path = self._paths(url)
+        info = {
+            "url": url,
+            "sha256": hashlib.sha256(entry.body).hexdigest(),
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "checked": entry.checked,
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            _write_atomic(body_path, entry.body)
+            _write_atomic(info_path, json.dumps(info).encode())
+        except OSError:
+            # The cache is an optimization. Failing to write it shouldn't fail
+            # the fetch.
+            pass
+
+    def clear(self):
+        """Remove all cached documents."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith((".body", ".json")):
+                os.unlink(os.path.join(self.directory, name))
+
+
+_VALIDATION_CACHE_FORMAT_VERSION = 2
+_MARSHAL_VERSION = 2
+
+
+@cache
+def _package_version() -> str:
+    """Return the installed version of this package. Validation rules can
+    change between versions, so entries of the validation cache record it."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("rapids-metadata")
+    except PackageNotFoundError:
+        return ""
+
+
+@dataclasses.dataclass(frozen=True)
+class ValidationCache:
+    """On-disk cache of validated metadata documents.
+
+    Each document that is validated is stored in the compact
+    :mod:`~rapids_metadata.snapshot` format, keyed by the SHA-256 digest of its
+    bytes. When the same bytes are validated again, the snapshot is loaded
+    instead, which skips pydantic validation. The loaded versions are flat and
+    independent of each other, like validated ones. Entries that are
+    truncated, corrupted, or written by another version of this package are
+    ignored, and the document is validated and stored again. Only the
+    ``max_entries`` most recently stored documents are kept.
+
+    By default, entries are stored in
+    ``$XDG_CACHE_HOME/rapids-metadata/validated``.
+    """
+
+    directory: str = dataclasses.field(
+        default_factory=lambda: _cache_directory("validated")
+    )
+    max_entries: int = 8
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, f"{digest}.snapshot")
+
+    def _load(self, digest: str) -> RAPIDSMetadata | None:
+        try:
+            with open(self._path(digest), "rb") as f:
+                entry = f.read()
+        except OSError:
+            _count("validation_cache_lookups", result="miss")
+            return None
+        try:
+            fields = marshal.loads(entry)
+            format_version = fields[0]
+        except (EOFError, ValueError, TypeError, IndexError):
+            _count("validation_cache_lookups", result="corrupt")
+            return None
+        if format_version != _VALIDATION_CACHE_FORMAT_VERSION:
+            _count("validation_cache_lookups", result="version_mismatch")
+            return None
+        try:
+            (
+                _,
+                snapshot_format_version,
+                package_version,
+                document_digest,
+                checksum,
+                data,
+            ) = fields
+        except (ValueError, TypeError):
+            _count("validation_cache_lookups", result="corrupt")
+            return None
+        if (
+            snapshot_format_version != _SNAPSHOT_FORMAT_VERSION
+            or package_version != _package_version()
+        ):
+            _count("validation_cache_lookups", result="version_mismatch")
+            return None
+        if document_digest != digest or checksum != hashlib.sha256(data).digest():
+            _count("validation_cache_lookups", result="corrupt")
+            return None
+        _count("validation_cache_lookups", result="hit")
+        return snapshot.loads(data)
+
+    def _store(self, digest: str, metadata: RAPIDSMetadata):
+        data = snapshot.dumps(metadata)
+        entry = marshal.dumps(
+            (
+                _VALIDATION_CACHE_FORMAT_VERSION,
+                _SNAPSHOT_FORMAT_VERSION,
+                _package_version(),
+                digest,
+                hashlib.sha256(data).digest(),
+                data,
+            ),
+            _MARSHAL_VERSION,
+        )
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            _write_atomic(self._path(digest), entry)
+            _prune(self.directory, self.max_entries, ".snapshot")
+        except OSError:
+            # The cache is an optimization. Failing to write it shouldn't fail
+            # the validation.
+            pass
+
+    def validate(self, data: bytes) -> RAPIDSMetadata:
+        """Return the metadata in the JSON document ``data``, validating it
+        only if it isn't in the cache. Raises
+        :class:`~pydantic.ValidationError` if it is invalid."""
+        digest = hashlib.sha256(data).hexdigest()
+        metadata = self._load(digest)
+        if metadata is None:
+            metadata = _validate(RAPIDSMetadata, data)
+            self._store(digest, metadata)
+        return metadata
+
+    def clear(self):
+        """Remove all cached documents."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith(".snapshot"):
+                os.unlink(os.path.join(self.directory, name))
+
+
+def _download(
+    url: str, cached: _CacheEntry | None, timeout: float
+) -> _CacheEntry | None:
+    """Download ``url``, or return ``None`` if it's unchanged from ``cached``."""
+    request = urllib.request.Request(url)
+    if cached is not None:
+        if cached.etag is not None:
+            request.add_header("If-None-Match", cached.etag)
+        if cached.last_modified is not None:
+            request.add_header("If-Modified-Since", cached.last_modified)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as f:
+            return _CacheEntry(
+                body=f.read(),
+                etag=f.headers.get("ETag"),
+                last_modified=f.headers.get("Last-Modified"),
+                checked=time.time(),
+            )
+    except urllib.error.HTTPError as e:
+        if cached is not None and e.code == 304:
+            return None
+        raise
+
+
+def _is_retryable(e: OSError) -> bool:
+    if isinstance(e, urllib.error.HTTPError):
+        return e.code in (408, 429) or e.code >= 500
+    return True
+
+
+async def _download_with_retries(
+    url: str,
+    cached: _CacheEntry | None,
+    timeout: float,
+    retries: int,
+    backoff: float,
+) -> _CacheEntry | None:
+    attempt = 0
+    while True:
+        try:
+            return await asyncio.wait_for(
+                asyncio.to_thread(_download, url, cached, timeout), timeout
+            )
+        except OSError as e:
+            # asyncio.TimeoutError is an OSError as of Python 3.11, but not
+            # before, so it is caught separately below.
+            if attempt >= retries or not _is_retryable(e):
+                raise
+        except asyncio.TimeoutError:
+            if attempt >= retries:
+                raise
+        await asyncio.sleep(backoff * 2**attempt)
+        attempt += 1
+
+
+async def _fetch_bytes(
+    url: str,
+    cache: HTTPCache | None,
+    timeout: float,
+    retries: int,
+    backoff: float,
+) -> bytes:
+    start = time.perf_counter()
+    source, body = await _fetch_bytes_from_source(url, cache, timeout, retries, backoff)
+    _observe("fetch_seconds", time.perf_counter() - start, source=source)
+    _count("fetch_bytes", len(body), source=source)
+    return body
+
+
+async def _fetch_bytes_from_source(
+    url: str,
+    cache: HTTPCache | None,
+    timeout: float,
+    retries: int,
+    backoff: float,
+) -> tuple[str, bytes]:
+    """Return the body of ``url`` and where it came from, as reported by
+    :mod:`~rapids_metadata.instrumentation`."""
+    if cache is None:
+        entry = await _download_with_retries(url, None, timeout, retries, backoff)
+        assert entry is not None
+        return "network", entry.body
+
+    cached = cache._load(url)
+    if cached is not None and time.time() - cached.checked < cache.ttl:
+        return "cache", cached.body
+    try:
+        entry = await _download_with_retries(url, cached, timeout, retries, backoff)
+    except (OSError, asyncio.TimeoutError):
+        # Covers HTTP errors, connection failures, and timeouts. Fall back to
+        # the last good copy if there is one.
+        if cached is None:
+            raise
+        return "stale_cache", cached.body
+    source = "network"
+    if entry is None:
+        assert cached is not None
+        entry = cached._replace(checked=time.time())
+        source = "not_modified"
+    cache._store(url, entry)
+    return source, entry.body
+
+
+def _validate(tp: type[_T], data: bytes) -> _T:
+    with _timed("validation_seconds", type=tp.__name__):
+        return get_type_adapter(tp).validate_json(data)  # type: ignore[arg-type]
+
+
+@dataclass
+class _UnvalidatedMetadata:
+    """The top-level structure of a metadata document, with the versions left
+    unvalidated."""
+
+    versions: dict[str, dict[str, Any]] = Field(default_factory=dict)
+
+
+def _validate_version(data: Any) -> RAPIDSVersion:
+    with _timed("validation_seconds", type="RAPIDSVersion"):
+        return get_type_adapter(RAPIDSVersion).validate_python(data)
+
+
+def _validate_metadata(
+    data: bytes, lazy: bool, validation_cache: ValidationCache | None
+) -> RAPIDSMetadata:
+    if validation_cache is not None:
+        if not lazy:
+            return validation_cache.validate(data)
+        cached = validation_cache._load(hashlib.sha256(data).hexdigest())
+        if cached is not None:
+            return cached
+    if not lazy:
+        return _validate(RAPIDSMetadata, data)
+    document = _validate(_UnvalidatedMetadata, data)
+    metadata = RAPIDSMetadata()
+    # Bypass _Tracked.__setattr__, which would turn the mapping into a dict.
+    object.__setattr__(
+        metadata, "versions", _LazyDict(document.versions, _validate_version)
+    )
+    return metadata
+
+
+async def fetch_from_url_async(
+    url: str,
+    *,
+    cache: HTTPCache | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    lazy: bool = False,
+    validation_cache: ValidationCache | None = None,
+) -> RAPIDSMetadata:
+    """Fetch metadata from a URL.
+
+    Each attempt is abandoned after ``timeout`` seconds. Timeouts, connection
+    failures, and HTTP 408, 429, and 5xx responses are retried up to
+    ``retries`` times, waiting ``backoff`` seconds before the first retry and
+    twice as long before each following one. If ``cache`` is given, it is used
+    as described in :class:`HTTPCache`.
+
+    By default, the whole document is validated before it is returned. If
+    ``lazy`` is true, only its top-level structure is, and each version is
+    validated when it is first read from ``versions``, so that the cost
+    depends on how many versions are used. An invalid version then raises
+    :class:`~pydantic.ValidationError` when it is read. Call
+    :meth:`~rapids_metadata.metadata.RAPIDSMetadata.validate_all` on the result
+    to validate the rest.
+
+    If ``validation_cache`` is given, a document that was validated before is
+    loaded from it without being validated again, as described in
+    :class:`ValidationCache`. A document that isn't in the cache and is
+    validated lazily is not stored in it.
+    """
+    body = await _fetch_bytes(url, cache, timeout, retries, backoff)
+    return _validate_metadata(body, lazy, validation_cache)
+
+
+async def fetch_all_async(
+    urls: Iterable[str],
+    *,
+    cache: HTTPCache | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    lazy: bool = False,
+    validation_cache: ValidationCache | None = None,
+) -> list[RAPIDSMetadata]:
+    """Fetch metadata from several URLs concurrently, with the same options as
+    :func:`fetch_from_url_async`. The results are in the order of ``urls``. If
+    any fetch fails, the others are cancelled and the error is raised."""
+    tasks = [
+        asyncio.ensure_future(
+            fetch_from_url_async(
+                url,
+                cache=cache,
+                timeout=timeout,
+                retries=retries,
+                backoff=backoff,
+                lazy=lazy,
+                validation_cache=validation_cache,
+            )
+        )
+        for url in urls
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def fetch_latest_async(
+    *,
+    cache: HTTPCache | bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    lazy: bool = False,
+    validation_cache: ValidationCache | bool = True,
+) -> RAPIDSMetadata:
+    """Fetch the latest metadata from GitHub.
+
+    By default, the document is cached in the default :class:`HTTPCache`. Pass
+    an :class:`HTTPCache` to use a different directory or TTL, or ``False`` to
+    always download it. Likewise, the validated document is cached in the
+    default :class:`ValidationCache` unless ``validation_cache`` is another
+    :class:`ValidationCache` or ``False``. The other options are described in
+    :func:`fetch_from_url_async`.
+    """
+    if cache is True:
+        cache = HTTPCache()
+    if validation_cache is True:
+        validation_cache = ValidationCache()
+    return await fetch_from_url_async(
+        _GITHUB_METADATA_URL,
+        cache=cache or None,
+        timeout=timeout,
+        retries=retries,
+        backoff=backoff,
+        lazy=lazy,
+        validation_cache=validation_cache or None,
+    )
+
+
+async def _fetch_shard(
+    version: str,
+    base_url: str,
+    cache: HTTPCache | None,
+    timeout: float,
+    retries: int,
+    backoff: float,
+) -> tuple[bytes, bool]:
+    index = json.loads(
+        await _fetch_bytes(
+            urllib.parse.urljoin(base_url, "index.json"),
+            cache,
+            timeout,
+            retries,
+            backoff,
+        )
+    )
+    digest = index["versions"][version]["sha256"]
+    shard = await _fetch_bytes(
+        urllib.parse.urljoin(base_url, f"{version}.json"),
+        cache,
+        timeout,
+        retries,
+        backoff,
+    )
+    return shard, hashlib.sha256(shard).hexdigest() == digest
+
+
+async def fetch_version_async(
+    version: str,
+    *,
+    base_url: str = _GITHUB_SHARD_URL,
+    cache: HTTPCache | bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+) -> RAPIDSVersion:
+    """Fetch the metadata of a single version.
+
+    Only the shard index and the version's own shard, as written by
+    ``rapids-metadata-json --shard-dir``, are downloaded from ``base_url``.
+    Raises :class:`KeyError` if the version isn't in the index, and
+    :class:`ValueError` if the shard doesn't match the digest in the index. The
+    other options are described in :func:`fetch_latest_async`.
+    """
+    http_cache = HTTPCache() if cache is True else cache or None
+    shard, valid = await _fetch_shard(
+        version, base_url, http_cache, timeout, retries, backoff
+    )
+    if not valid and http_cache is not None:
+        # The index and shard may have been cached at different times, so
+        # revalidate both of them.
+        shard, valid = await _fetch_shard(
+            version,
+            base_url,
+            dataclasses.replace(http_cache, ttl=0),
+            timeout,
+            retries,
+            backoff,
+        )
+    if not valid:
+        raise ValueError(f"Shard for version {version} doesn't match the index")
+    return _validate(RAPIDSVersion, shard)
+
+
+async def update_metadata_async(
+    metadata: RAPIDSMetadata,
+    *,
+    base_url: str = _GITHUB_DELTA_URL,
+    full_url: str = _GITHUB_METADATA_URL,
+    cache: HTTPCache | bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+) -> RAPIDSMetadata:
+    """Bring previously fetched metadata up to date.
+
+    The delta index at ``base_url``, as written by ``rapids-metadata-json
+    --delta-dir``, is downloaded, followed by each delta between the revision
+    of ``metadata`` and the latest one. Only the deltas are validated, and
+    versions they don't touch are shared with ``metadata``, which is not
+    modified. If the chain doesn't reach back to ``metadata``, or the result
+    doesn't match the latest revision, the full document is fetched from
+    ``full_url`` instead. The other options are described in
+    :func:`fetch_latest_async`.
+    """
+    http_cache = HTTPCache() if cache is True else cache or None
+    index = json.loads(
+        await _fetch_bytes(
+            urllib.parse.urljoin(base_url, "index.json"),
+            http_cache,
+            timeout,
+            retries,
+            backoff,
+        )
+    )
+    latest = index["latest"]
+    targets = {entry["base"]: entry["target"] for entry in index["deltas"]}
+
+    digest = metadata_digest(metadata)
+    if digest == latest:
+        return metadata
+    updated = metadata
+    for _ in range(len(targets)):
+        if digest not in targets:
+            break
+        delta = _validate(
+            MetadataDelta,
+            await _fetch_bytes(
+                urllib.parse.urljoin(base_url, f"{digest}.json"),
+                http_cache,
+                timeout,
+                retries,
+                backoff,
+            ),
+        )
+        if delta.base != digest:
+            break
+        updated = apply_delta(updated, delta)
+        digest = delta.target
+        if digest == latest:
+            if metadata_digest(updated) == latest:
+                return updated
+            break
+
+    return await fetch_from_url_async(
+        full_url,
+        cache=http_cache,
+        timeout=timeout,
+        retries=retries,
+        backoff=backoff,
+    )
+
+
+def _run(coroutine: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion and return its result. If this thread is
+    already running an event loop, such as in Jupyter, the coroutine runs in a
+    worker thread with an event loop of its own, and this thread blocks until
+    it's done."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def _fetch_from_url(
+    url: str,
+    cache: HTTPCache | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    lazy: bool = False,
+    validation_cache: ValidationCache | None = None,
+) -> RAPIDSMetadata:
+    return _run(
+        fetch_from_url_async(
+            url,
+            cache=cache,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+            lazy=lazy,
+            validation_cache=validation_cache,
+        )
+    )
+
+
+def fetch_latest(
+    *,
+    cache: HTTPCache | bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    lazy: bool = False,
+    validation_cache: ValidationCache | bool = True,
+) -> RAPIDSMetadata:
+    """Fetch the latest metadata from GitHub.
+
+    This is a blocking wrapper around :func:`fetch_latest_async`. It can
+    also be called from a running event loop.
+    """
+    return _run(
+        fetch_latest_async(
+            cache=cache,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+            lazy=lazy,
+            validation_cache=validation_cache,
+        )
+    )
+
+
+def fetch_version(
+    version: str,
+    *,
+    base_url: str = _GITHUB_SHARD_URL,
+    cache: HTTPCache | bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+) -> RAPIDSVersion:
+    """Fetch the metadata of a single version.
+
+    This is a blocking wrapper around :func:`fetch_version_async`. It can
+    also be called from a running event loop.
+    """
+    return _run(
+        fetch_version_async(
+            version,
+            base_url=base_url,
+            cache=cache,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+        )
+    )
+
+
+def update_metadata(
+    metadata: RAPIDSMetadata,
+    *,
+    base_url: str = _GITHUB_DELTA_URL,
+    full_url: str = _GITHUB_METADATA_URL,
+    cache: HTTPCache | bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+) -> RAPIDSMetadata:
+    """Bring previously fetched metadata up to date.
+
+    This is a blocking wrapper around :func:`update_metadata_async`. It can
+    also be called from a running event loop.
+    """
+    return _run(
+        update_metadata_async(
+            metadata,
+            base_url=base_url,
+            full_url=full_url,
+            cache=cache,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+        )
+    )
@@ -0,0 +1,122 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact, prevalidated snapshot of RAPIDS metadata.
+
+The snapshot is a :mod:`marshal` blob containing, for each version in order,
+the repositories that differ from the previous version with all of their
+packages, and the order of the repositories if it differs too. Packages are
+stored as their 4-bit :attr:`~rapids_metadata.metadata.RAPIDSPackage.flags`.
+Loading a snapshot rebuilds the versions without running pydantic validation.
+"""
+
+import os
+from typing import Any
+
+from ._shared import SNAPSHOT_PATH, _Delta, _dump_snapshot, _load_snapshot
+from .instrumentation import _timed
+from .metadata import (
+    RAPIDSMetadata,
+    RAPIDSPackage,
+    RAPIDSRepository,
+    RAPIDSVersion,
+    _TrackedDict,
+)
+
+__all__ = [
+    "SNAPSHOT_PATH",
+    "dumps",
+    "load",
+    "loads",
+]
+
+
+def _construct(cls: type, **fields: Any) -> Any:
+    obj: Any = object.__new__(cls)
+    obj.__dict__.update(fields)
+    return obj
+
+
+def _diff(parent: RAPIDSVersion, child: RAPIDSVersion) -> _Delta:
+    names = list(child.repositories)
+    changed = {
+        repository: {
+            package: package_data.flags
+            for package, package_data in repository_data.packages.items()
+        }
+        for repository, repository_data in child.repositories.items()
+        if repository not in parent.repositories
+        # Compare the order too, so that loading a snapshot restores it.
+        or list(parent.repositories[repository].packages.items())
+        != list(repository_data.packages.items())
+    }
+    return (None if names == list(parent.repositories) else names), changed
+
+
+def _resolve(
+    parent: RAPIDSVersion | None, delta: _Delta
+) -> dict[str, RAPIDSRepository]:
+    names, changed = delta
+    if names is None:
+        assert parent is not None
+        names = list(parent.repositories)
+    repositories = {}
+    for repository in names:
+        if repository in changed:
+            repositories[repository] = _construct(
+                RAPIDSRepository,
+                packages=_TrackedDict(
+                    (package, RAPIDSPackage.from_flags(flags))
+                    for package, flags in changed[repository].items()
+                ),
+            )
+        else:
+            assert parent is not None
+            repositories[repository] = parent.repositories[repository].derive()
+    return repositories
+
+
+def dumps(metadata: RAPIDSMetadata) -> bytes:
+    """Serialize metadata into the snapshot format."""
+    versions = []
+    previous = RAPIDSVersion()
+    for version, version_data in metadata.versions.items():
+        versions.append((version, _diff(previous, version_data)))
+        previous = version_data
+    return _dump_snapshot(versions)
+
+
+def loads(data: bytes) -> RAPIDSMetadata:
+    """Materialize metadata from the snapshot format without validating it.
+    Repositories, packages, and versions are in the same order as in the
+    metadata that was serialized."""
+    with _timed("import_seconds", stage="unmarshal"):
+        versions = _load_snapshot(data)
+
+    metadata = _construct(RAPIDSMetadata, versions=_TrackedDict())
+    previous: RAPIDSVersion | None = None
+    for version, delta in versions:
+        with _timed("import_version_seconds", version=version):
+            version_data = _construct(
+                RAPIDSVersion, repositories=_TrackedDict(_resolve(previous, delta))
+            )
+        metadata.versions[version] = previous = version_data
+    return metadata
+
+
+def load(path: str | os.PathLike[str] = SNAPSHOT_PATH) -> RAPIDSMetadata:
+    """Load a snapshot file, by default the one shipped with this package."""
+    with _timed("import_seconds", stage="read"), open(path, "rb") as f:
+        data = f.read()
+    return loads(data)
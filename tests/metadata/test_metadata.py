@@ -1,4 +1,4 @@
-# Copyright (c) 2024, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -68,3 +68,84 @@ def test_get_current_version(current_version, expected_version, metadata):
         for v, m in metadata.versions.items():
             if v != expected_version:
                 assert m != current_version
+
+
+def test_package_index():
+    metadata = md.RAPIDSMetadata(
+        versions={
+            "24.10": md.RAPIDSVersion(
+                repositories={
+                    "repo2": md.RAPIDSRepository(
+                        packages={"package1": md.RAPIDSPackage(has_cuda_suffix=False)}
+                    ),
+                }
+            ),
+            "24.06": md.RAPIDSVersion(
+                repositories={
+                    "repo1": md.RAPIDSRepository(
+                        packages={
+                            "package1": md.RAPIDSPackage(),
+                            "package2": md.RAPIDSPackage(),
+                        }
+                    ),
+                }
+            ),
+        }
+    )
+    assert metadata.get_package_releases("package1") == (
+        md.RAPIDSPackageRelease("24.06", "repo1", md.RAPIDSPackage()),
+        md.RAPIDSPackageRelease(
+            "24.10", "repo2", md.RAPIDSPackage(has_cuda_suffix=False)
+        ),
+    )
+    assert metadata.get_package_releases("package2") == (
+        md.RAPIDSPackageRelease("24.06", "repo1", md.RAPIDSPackage()),
+    )
+    assert metadata.get_package_releases("package3") == ()
+    assert metadata.package_index is metadata.package_index
+    assert set(metadata.package_index) == {"package1", "package2"}
+
+    metadata.versions["24.08"] = metadata.versions["24.06"].derive()
+    metadata.versions["24.08"].repositories["repo1"].packages["package3"] = (
+        md.RAPIDSPackage()
+    )
+    assert [r.version for r in metadata.get_package_releases("package1")] == [
+        "24.06",
+        "24.08",
+        "24.10",
+    ]
+    assert metadata.get_package_releases("package3") == (
+        md.RAPIDSPackageRelease("24.08", "repo1", md.RAPIDSPackage()),
+    )
+
+
+@pytest.mark.parametrize(
+    ["version", "exact", "floor", "ceiling"],
+    [
+        ("24.04", None, None, "24.06"),
+        ("24.06", "24.06", "24.06", "24.06"),
+        ("24.6", "24.06", "24.06", "24.06"),
+        ("24.07", None, "24.06", "24.08"),
+        ("24.08", "24.08", "24.08", "24.08"),
+        ("24.10", None, "24.08", None),
+    ],
+)
+def test_version_lookups(metadata, version, exact, floor, ceiling):
+    assert metadata.find_version(version) == exact
+    assert metadata.floor_version(version) == floor
+    assert metadata.ceiling_version(version) == ceiling
+
+
+def test_version_index_invalidated(metadata):
+    assert metadata.sorted_versions == ("24.06", "24.08")
+    assert metadata.latest_version == "24.08"
+
+    metadata.versions["24.10"] = md.RAPIDSVersion()
+    metadata.versions["24.02"] = md.RAPIDSVersion()
+    assert metadata.sorted_versions == ("24.02", "24.06", "24.08", "24.10")
+    assert metadata.latest_version == "24.10"
+    assert metadata.floor_version("24.09") == "24.08"
+
+    del metadata.versions["24.10"]
+    assert metadata.latest_version == "24.08"
+    assert md.RAPIDSMetadata().latest_version is None
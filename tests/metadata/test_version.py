@@ -1,4 +1,4 @@
-# Copyright (c) 2024, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
+import pickle
+from copy import deepcopy
+from dataclasses import FrozenInstanceError
+
 import pytest
 from rapids_metadata import metadata as md
 
@@ -54,3 +59,252 @@ def test_prerelease_packages(metadata):
 
 def test_cuda_suffixed_packages(metadata):
     assert metadata.cuda_suffixed_packages == {"package1", "package3"}
+
+
+def test_conda_packages(metadata):
+    metadata.repositories["repo1"].packages["package1"] = md.RAPIDSPackage(
+        has_conda_package=False
+    )
+    assert metadata.conda_packages == {"package2", "package3", "package4"}
+
+
+def test_wheel_packages(metadata):
+    metadata.repositories["repo2"].packages["package3"] = md.RAPIDSPackage(
+        has_wheel_package=False
+    )
+    assert metadata.wheel_packages == {"package1", "package2", "package4"}
+
+
+def test_package_repositories(metadata):
+    assert metadata.package_repositories == {
+        "package1": "repo1",
+        "package2": "repo1",
+        "package3": "repo2",
+        "package4": "repo2",
+    }
+    del metadata.repositories["repo2"].packages["package4"]
+    assert "package4" not in metadata.package_repositories
+    with pytest.raises(TypeError):
+        metadata.package_repositories["package4"] = "repo1"  # type: ignore[index]
+
+
+def test_package_sets_cached(metadata):
+    all_packages = metadata.all_packages
+    assert isinstance(all_packages, frozenset)
+    assert metadata.all_packages is all_packages
+    assert metadata.prerelease_packages is metadata.prerelease_packages
+    assert metadata.cuda_suffixed_packages is metadata.cuda_suffixed_packages
+
+    derived = metadata.derive()
+    assert derived.all_packages == all_packages
+    assert derived.all_packages is derived.all_packages
+    assert metadata.all_packages is all_packages
+
+
+@pytest.mark.parametrize(
+    ["modify", "all_packages", "cuda_suffixed_packages"],
+    [
+        (
+            lambda v: v.repositories["repo1"].packages.update(
+                package5=md.RAPIDSPackage()
+            ),
+            {"package1", "package2", "package3", "package4", "package5"},
+            {"package1", "package3", "package5"},
+        ),
+        (
+            lambda v: v.repositories["repo1"].packages.pop("package1"),
+            {"package2", "package3", "package4"},
+            {"package3"},
+        ),
+        (
+            lambda v: v.repositories.clear(),
+            set(),
+            set(),
+        ),
+        (
+            lambda v: setattr(v, "repositories", {"repo3": md.RAPIDSRepository()}),
+            set(),
+            set(),
+        ),
+        (
+            lambda v: setattr(v.repositories["repo2"], "packages", {}),
+            {"package1", "package2"},
+            {"package1"},
+        ),
+        (
+            lambda v: v.repositories["repo1"].packages.__setitem__(
+                "package2", md.RAPIDSPackage()
+            ),
+            {"package1", "package2", "package3", "package4"},
+            {"package1", "package2", "package3"},
+        ),
+    ],
+)
+def test_package_sets_invalidated(
+    metadata, modify, all_packages, cuda_suffixed_packages
+):
+    assert metadata.all_packages == {"package1", "package2", "package3", "package4"}
+    assert metadata.cuda_suffixed_packages == {"package1", "package3"}
+    derived = metadata.derive()
+    assert derived.cuda_suffixed_packages == {"package1", "package3"}
+
+    modify(derived)
+    assert derived.all_packages == all_packages
+    assert derived.cuda_suffixed_packages == cuda_suffixed_packages
+    assert metadata.all_packages == {"package1", "package2", "package3", "package4"}
+    assert metadata.cuda_suffixed_packages == {"package1", "package3"}
+
+    modify(metadata)
+    assert metadata.all_packages == all_packages
+    assert metadata.cuda_suffixed_packages == cuda_suffixed_packages
+
+
+def test_package_sets_invalidated_default():
+    version = md.RAPIDSVersion()
+    assert version.all_packages == set()
+    version.repositories["repo"] = md.RAPIDSRepository()
+    version.repositories["repo"].packages["package"] = md.RAPIDSPackage()
+    assert version.all_packages == {"package"}
+
+
+def test_derive(metadata):
+    derived = metadata.derive()
+    assert derived == metadata
+    assert derived.repositories.keys() == metadata.repositories.keys()
+
+    derived.repositories["repo1"].packages["package5"] = md.RAPIDSPackage()
+    derived.repositories["repo1"].packages["package1"] = md.RAPIDSPackage(
+        has_cuda_suffix=False
+    )
+    del derived.repositories["repo1"].packages["package2"]
+    del derived.repositories["repo2"]
+    derived.repositories["repo3"] = md.RAPIDSRepository()
+
+    assert list(derived.repositories) == ["repo1", "repo3"]
+    assert derived.all_packages == {"package1", "package5"}
+    assert derived.cuda_suffixed_packages == {"package5"}
+    assert "repo2" not in derived.repositories
+    with pytest.raises(KeyError):
+        del derived.repositories["repo2"]
+
+    assert list(metadata.repositories) == ["repo1", "repo2"]
+    assert metadata.all_packages == {"package1", "package2", "package3", "package4"}
+    assert metadata.cuda_suffixed_packages == {"package1", "package3"}
+
+    grandchild = derived.derive()
+    grandchild.repositories["repo2"] = md.RAPIDSRepository()
+    assert list(grandchild.repositories) == ["repo1", "repo3", "repo2"]
+    assert grandchild.all_packages == {"package1", "package5"}
+    assert "repo2" not in derived.repositories
+
+
+def test_derive_independent_of_parent(metadata):
+    derived = metadata.derive()
+    grandchild = derived.derive()
+    assert derived.all_packages == {"package1", "package2", "package3", "package4"}
+
+    metadata.repositories["repo1"].packages["package5"] = md.RAPIDSPackage()
+    del metadata.repositories["repo2"]
+    derived.repositories["repo1"].packages["package6"] = md.RAPIDSPackage()
+    derived.repositories["repo3"] = md.RAPIDSRepository()
+
+    assert metadata.all_packages == {"package1", "package2", "package5"}
+    assert list(derived.repositories) == ["repo1", "repo2", "repo3"]
+    assert derived.all_packages == {
+        "package1",
+        "package2",
+        "package3",
+        "package4",
+        "package6",
+    }
+    assert list(grandchild.repositories) == ["repo1", "repo2"]
+    assert grandchild.all_packages == {"package1", "package2", "package3", "package4"}
+
+    repository = metadata.repositories["repo1"].derive()
+    metadata.repositories["repo1"].packages.clear()
+    assert list(repository.packages) == ["package1", "package2", "package5"]
+
+
+def test_derive_shares_packages(metadata):
+    derived = metadata.derive()
+    assert type(derived.repositories) is md._TrackedDict
+    assert type(derived.repositories["repo1"].packages) is md._TrackedDict
+    assert derived.repositories["repo1"] is not metadata.repositories["repo1"]
+    assert (
+        derived.repositories["repo1"].packages["package1"]
+        is metadata.repositories["repo1"].packages["package1"]
+    )
+
+
+def test_derive_asdict(metadata):
+    derived = metadata.derive().derive()
+    assert dataclasses.asdict(derived) == dataclasses.asdict(derived.flatten())
+    assert dataclasses.asdict(derived) == {
+        "repositories": {
+            "repo1": {
+                "packages": {
+                    "package1": dataclasses.asdict(
+                        metadata.repositories["repo1"].packages["package1"]
+                    ),
+                    "package2": dataclasses.asdict(
+                        metadata.repositories["repo1"].packages["package2"]
+                    ),
+                },
+            },
+            "repo2": {
+                "packages": {
+                    "package3": dataclasses.asdict(
+                        metadata.repositories["repo2"].packages["package3"]
+                    ),
+                    "package4": dataclasses.asdict(
+                        metadata.repositories["repo2"].packages["package4"]
+                    ),
+                },
+            },
+        },
+    }
+
+
+def test_flatten(metadata):
+    derived = metadata.derive()
+    del derived.repositories["repo2"]
+    flattened = derived.flatten()
+    assert flattened == derived
+    assert flattened.repositories["repo1"] is not derived.repositories["repo1"]
+    assert (
+        flattened.repositories["repo1"].packages["package1"]
+        is metadata.repositories["repo1"].packages["package1"]
+    )
+
+
+def test_packages_interned(metadata):
+    packages = [
+        package
+        for repository in metadata.repositories.values()
+        for package in repository.packages.values()
+    ]
+    for package in packages:
+        assert md.RAPIDSPackage.from_flags(package.flags) is package
+    assert metadata.repositories["repo1"].packages[
+        "package1"
+    ] is md.RAPIDSPackage.from_flags(0b1111)
+    assert len({id(package) for package in md._packages.values()}) <= 16
+
+    with pytest.raises(FrozenInstanceError):
+        packages[0].has_cuda_suffix = False
+    with pytest.raises(ValueError, match="Invalid package flags 16"):
+        md.RAPIDSPackage.from_flags(16)
+
+
+@pytest.mark.parametrize("flags", range(16))
+def test_package_flags(flags):
+    package = md.RAPIDSPackage.from_flags(flags)
+    assert package.flags == flags
+    assert package == md.RAPIDSPackage(
+        publishes_prereleases=bool(flags & 1),
+        has_cuda_suffix=bool(flags & 2),
+        has_conda_package=bool(flags & 4),
+        has_wheel_package=bool(flags & 8),
+    )
+    assert deepcopy(package) is package
+    assert pickle.loads(pickle.dumps(package)) is package
@@ -0,0 +1,35 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from pydantic import TypeAdapter
+from rapids_metadata import adapters as rapids_adapters
+from rapids_metadata.metadata import RAPIDSMetadata, RAPIDSPackage, RAPIDSVersion
+
+
+@pytest.mark.parametrize("tp", [RAPIDSMetadata, RAPIDSVersion, RAPIDSPackage])
+def test_get_type_adapter(tp):
+    adapter = rapids_adapters.get_type_adapter(tp)
+    assert isinstance(adapter, TypeAdapter)
+    assert rapids_adapters.get_type_adapter(tp) is adapter
+    assert adapter.dump_python(adapter.validate_python({})) == TypeAdapter(
+        tp
+    ).dump_python(tp())
+
+
+def test_get_json_schema():
+    schema = rapids_adapters.get_json_schema(RAPIDSMetadata)
+    assert schema == TypeAdapter(RAPIDSMetadata).json_schema()
+    schema["title"] = "Modified"
+    assert rapids_adapters.get_json_schema(RAPIDSMetadata)["title"] == "RAPIDSMetadata"
@@ -0,0 +1,162 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from rapids_metadata import cli as rapids_cli
+from rapids_metadata import json as rapids_json
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("RAPIDS_METADATA_SOCKET", "")
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "VERSION").write_text("24.08.00\n")
+    monkeypatch.chdir(project)
+    return project
+
+
+@pytest.fixture
+def output_cache(xdg_cache_home):
+    return xdg_cache_home / "rapids-metadata" / "output"
+
+
+def run(capsysbinary, argv, *, cached):
+    with patch("rapids_metadata.json.main", wraps=rapids_json.main) as json_main:
+        rapids_cli.main(argv)
+    assert json_main.called != cached
+    return capsysbinary.readouterr().out
+
+
+def test_no_heavy_imports():
+    code = "import sys, rapids_metadata.cli; print('socket' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    assert result.stdout == "False\n"
+
+
+def test_output_cache_directory(monkeypatch, xdg_cache_home, output_cache):
+    monkeypatch.delenv("RAPIDS_METADATA_OUTPUT_CACHE", raising=False)
+    assert rapids_cli._output_cache_directory() == str(output_cache)
+    monkeypatch.setenv("RAPIDS_METADATA_OUTPUT_CACHE", "/cache")
+    assert rapids_cli._output_cache_directory() == "/cache"
+    monkeypatch.setenv("RAPIDS_METADATA_OUTPUT_CACHE", "")
+    assert rapids_cli._output_cache_directory() is None
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--all-versions", "--pretty"],
+        ["--format=csv"],
+        ["--format", "msgpack"],
+        ["has-cuda-suffix", "cudf", "--json"],
+        ["repository-packages", "rmm", "--rapids-version", "24.10"],
+        ["--schema"],
+    ],
+)
+def test_output_cache(project, capsysbinary, argv):
+    if "msgpack" in argv:
+        pytest.importorskip("msgpack")
+    output = run(capsysbinary, argv, cached=False)
+    assert output
+    assert run(capsysbinary, argv, cached=True) == output
+
+
+def test_output_cache_streams(project, capsysbinary):
+    def json_main(argv):
+        print("first row", flush=True)
+        # Written to stdout before the command finishes.
+        assert capsysbinary.readouterr().out == b"first row\n"
+        print("second row")
+
+    with patch("rapids_metadata.json.main", json_main):
+        rapids_cli.main(["--format", "ndjson"])
+    assert capsysbinary.readouterr().out == b"second row\n"
+    assert run(capsysbinary, ["--format", "ndjson"], cached=True) == (
+        b"first row\nsecond row\n"
+    )
+
+
+def test_output_cache_key(project, capsysbinary):
+    output = run(capsysbinary, [], cached=False)
+    (project / "VERSION").write_text("24.10.00\n")
+    assert run(capsysbinary, [], cached=False) != output
+    (project / "VERSION").write_text("24.08.00a1\n")
+    assert run(capsysbinary, [], cached=True) == output
+
+    # Upgrading the package
+    with patch("rapids_metadata.cli._daemon_key", return_value="other"):
+        assert run(capsysbinary, [], cached=False) == output
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["-o", "output.json"],
+        ["--out", "output.json"],
+        ["--output=output.json"],
+        ["--shard-dir", "shards"],
+        ["--all", "--pretty"],
+        ["batch"],
+        ["--help"],
+    ],
+)
+def test_output_cache_uncached(project, argv):
+    assert rapids_cli._output_key(argv) is None
+
+
+def test_output_cache_error(project, capsysbinary, output_cache):
+    with pytest.raises(SystemExit):
+        rapids_cli.main(["repository-of", "nonexistent"])
+    assert not output_cache.exists()
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [b"", b"garbage", b"\xe9\x00\x00\x00\x00"],
+)
+def test_output_cache_corrupt(project, capsysbinary, output_cache, entry):
+    output = run(capsysbinary, [], cached=False)
+    (path,) = output_cache.iterdir()
+    path.write_bytes(entry)
+    assert run(capsysbinary, [], cached=False) == output
+    assert run(capsysbinary, [], cached=True) == output
+
+
+def test_output_cache_disabled(project, capsysbinary, monkeypatch, output_cache):
+    monkeypatch.setenv("RAPIDS_METADATA_OUTPUT_CACHE", "")
+    run(capsysbinary, [], cached=False)
+    run(capsysbinary, [], cached=False)
+    assert not output_cache.exists()
+
+
+def test_output_cache_pruned(project, capsysbinary, monkeypatch, output_cache):
+    monkeypatch.setattr(rapids_cli, "_MAX_OUTPUT_ENTRIES", 2)
+    for i, package in enumerate(["cudf", "rmm", "cuml"]):
+        argv = ["has-cuda-suffix", package]
+        run(capsysbinary, argv, cached=False)
+        # Make the order of the modification times unambiguous.
+        path = rapids_cli._output_path(str(output_cache), rapids_cli._output_key(argv))
+        os.utime(path, (i, i))
+    assert len(list(output_cache.iterdir())) == 2
+    run(capsysbinary, ["has-cuda-suffix", "cudf"], cached=False)
+    run(capsysbinary, ["has-cuda-suffix", "cuml"], cached=True)
@@ -0,0 +1,192 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import socket
+import threading
+from contextlib import redirect_stderr
+from unittest.mock import patch
+
+import pytest
+from pydantic import TypeAdapter
+from rapids_metadata import cli as rapids_cli
+from rapids_metadata import daemon as rapids_daemon
+from rapids_metadata.metadata import (
+    RAPIDSMetadata,
+    RAPIDSPackage,
+    RAPIDSRepository,
+    RAPIDSVersion,
+)
+
+MOCK_METADATA = RAPIDSMetadata(
+    versions={
+        "24.08": RAPIDSVersion(
+            repositories={
+                "repo1": RAPIDSRepository(
+                    packages={
+                        "package": RAPIDSPackage(),
+                    },
+                ),
+            },
+        ),
+    },
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "daemon.sock")
+    monkeypatch.setenv("RAPIDS_METADATA_SOCKET", path)
+    return path
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = rapids_daemon.MetadataDaemon(socket_path, MOCK_METADATA)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
+
+
+def test_socket_path(monkeypatch):
+    monkeypatch.delenv("RAPIDS_METADATA_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert (
+        rapids_cli._socket_path()
+        == f"/run/user/1000/rapids-metadata-{os.getuid()}.sock"
+    )
+    monkeypatch.setenv("RAPIDS_METADATA_SOCKET", "")
+    assert rapids_cli._socket_path() is None
+
+
+def test_daemon(daemon, tmp_path, monkeypatch, capsys):
+    (tmp_path / "VERSION").write_text("24.08.00\n")
+    monkeypatch.chdir(tmp_path)
+    with patch("rapids_metadata.json.main") as json_main:
+        rapids_cli.main([])
+    json_main.assert_not_called()
+    assert capsys.readouterr().out == (
+        '{"versions":{"24.08":{"repositories":{"repo1":{"packages":{"package":{'
+        '"has_conda_package":true,"has_cuda_suffix":true,'
+        '"has_wheel_package":true,"publishes_prereleases":true}}}}}}}'
+    )
+
+    rapids_cli.main(["-o", "output.json"])
+    assert capsys.readouterr().out == ""
+    assert (tmp_path / "output.json").read_text().startswith('{"versions":')
+
+
+def test_daemon_before_output_cache(daemon, socket_path, tmp_path, monkeypatch, capsys):
+    (tmp_path / "VERSION").write_text("24.08.00\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RAPIDS_METADATA_SOCKET", "")
+    rapids_cli.main(["--all-versions"])
+    cached = capsys.readouterr().out
+
+    monkeypatch.setenv("RAPIDS_METADATA_SOCKET", socket_path)
+    rapids_cli.main(["--all-versions"])
+    output = capsys.readouterr().out
+    assert output != cached
+    assert output.startswith('{"versions":{"24.08":{"repositories":{"repo1":')
+
+
+def test_daemon_msgpack(daemon, capsysbinary: pytest.CaptureFixture[bytes]):
+    msgpack = pytest.importorskip("msgpack")
+    with patch("rapids_metadata.json.main") as json_main:
+        rapids_cli.main(["--all-versions", "--format", "msgpack"])
+    json_main.assert_not_called()
+    assert msgpack.unpackb(capsysbinary.readouterr().out) == TypeAdapter(
+        RAPIDSMetadata
+    ).dump_python(MOCK_METADATA)
+
+
+def test_daemon_error(daemon, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        rapids_cli.main(["--schema", "--shard-dir", "shards"])
+    assert excinfo.value.code == 2
+    err = capsys.readouterr().err
+    assert err.startswith("usage: rapids-metadata-json ")
+    assert "--shard-dir can't be used with --schema" in err
+
+
+def test_daemon_key_mismatch(daemon):
+    assert daemon.answer({"key": "other", "argv": [], "cwd": "/"}) == {
+        "error": "Client and daemon are different installations"
+    }
+    with patch("rapids_metadata.cli._daemon_key", return_value="other"):
+        assert rapids_cli._query_daemon([]) is None
+
+
+@pytest.mark.parametrize("peer_credentials", [True, False])
+def test_other_users_daemon(daemon, monkeypatch, peer_credentials):
+    if not peer_credentials:
+        monkeypatch.delattr(socket, "SO_PEERCRED", raising=False)
+    elif not hasattr(socket, "SO_PEERCRED"):
+        pytest.skip("SO_PEERCRED isn't supported")
+    assert rapids_cli._query_daemon(["--all-versions"]) is not None
+    monkeypatch.setattr(os, "getuid", lambda: os.geteuid() + 1)
+    assert rapids_cli._query_daemon(["--all-versions"]) is None
+
+
+def test_refresh_error(socket_path, capsys):
+    stop = threading.Event()
+
+    def update_metadata(metadata):
+        stop.set()
+        raise RuntimeError("GitHub is down")
+
+    client_stderr = io.StringIO()
+    with (
+        rapids_daemon.MetadataDaemon(socket_path, MOCK_METADATA) as server,
+        patch("rapids_metadata.remote.update_metadata", update_metadata),
+        redirect_stderr(client_stderr),
+    ):
+        server.refresh_periodically(0, stop)
+    assert client_stderr.getvalue() == ""
+    assert "RuntimeError: GitHub is down" in capsys.readouterr().err
+    assert server.metadata is MOCK_METADATA
+
+
+def test_batch_not_forwarded(daemon):
+    assert rapids_cli._query_daemon(["batch"]) is None
+    assert daemon.answer(
+        {"key": daemon.key, "argv": ["batch", "--rapids-version", "24.08"], "cwd": "/"}
+    ) == {"status": 0, "stdout": b"", "stderr": ""}
+
+
+def test_fallback(socket_path):
+    with patch("rapids_metadata.json.main") as json_main:
+        rapids_cli.main(["--all-versions"])
+    json_main.assert_called_once_with(["--all-versions"])
+
+
+def test_stale_socket(socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(socket_path)
+    assert os.path.exists(socket_path)
+    with rapids_daemon.MetadataDaemon(socket_path, MOCK_METADATA):
+        pass
+    assert not os.path.exists(socket_path)
+
+
+def test_already_running(daemon, socket_path):
+    with pytest.raises(OSError, match="already listening"):
+        rapids_daemon.MetadataDaemon(socket_path, MOCK_METADATA)
+    assert rapids_cli._query_daemon(["--all-versions"]) is not None
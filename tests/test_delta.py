@@ -0,0 +1,152 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+from pydantic import TypeAdapter
+from rapids_metadata import all_metadata
+from rapids_metadata import delta as rapids_delta
+from rapids_metadata.metadata import (
+    RAPIDSMetadata,
+    RAPIDSPackage,
+    RAPIDSRepository,
+    RAPIDSVersion,
+)
+
+
+@pytest.fixture
+def old_metadata():
+    return RAPIDSMetadata(
+        versions={
+            "24.06": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={"package1": RAPIDSPackage()},
+                    ),
+                },
+            ),
+            "24.08": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={
+                            "package1": RAPIDSPackage(),
+                            "package2": RAPIDSPackage(),
+                        },
+                    ),
+                    "repo2": RAPIDSRepository(
+                        packages={"package3": RAPIDSPackage()},
+                    ),
+                },
+            ),
+            "24.10": RAPIDSVersion(),
+        }
+    )
+
+
+@pytest.fixture
+def new_metadata():
+    return RAPIDSMetadata(
+        versions={
+            "24.06": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={"package1": RAPIDSPackage()},
+                    ),
+                },
+            ),
+            "24.08": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={
+                            "package1": RAPIDSPackage(has_cuda_suffix=False),
+                            "package4": RAPIDSPackage(),
+                        },
+                    ),
+                    "repo3": RAPIDSRepository(),
+                },
+            ),
+            "24.12": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(),
+                },
+            ),
+        }
+    )
+
+
+def test_compute_delta(old_metadata, new_metadata):
+    delta = rapids_delta.compute_delta(old_metadata, new_metadata)
+    assert delta.base == rapids_delta.metadata_digest(old_metadata)
+    assert delta.target == rapids_delta.metadata_digest(new_metadata)
+    assert TypeAdapter(rapids_delta.MetadataDelta).dump_python(delta)["versions"] == {
+        "24.08": {
+            "repositories": {
+                "repo1": {
+                    "packages": {
+                        "package1": {
+                            "publishes_prereleases": True,
+                            "has_cuda_suffix": False,
+                            "has_conda_package": True,
+                            "has_wheel_package": True,
+                        },
+                        "package2": None,
+                        "package4": {
+                            "publishes_prereleases": True,
+                            "has_cuda_suffix": True,
+                            "has_conda_package": True,
+                            "has_wheel_package": True,
+                        },
+                    },
+                },
+                "repo2": None,
+                "repo3": {"packages": {}},
+            },
+        },
+        "24.10": None,
+        "24.12": {"repositories": {"repo1": {"packages": {}}}},
+    }
+
+
+def test_apply_delta(old_metadata, new_metadata):
+    old_json = TypeAdapter(RAPIDSMetadata).dump_python(old_metadata)
+    delta = rapids_delta.compute_delta(old_metadata, new_metadata)
+    delta = TypeAdapter(rapids_delta.MetadataDelta).validate_json(
+        TypeAdapter(rapids_delta.MetadataDelta).dump_json(delta)
+    )
+
+    updated = rapids_delta.apply_delta(old_metadata, delta)
+    assert updated == new_metadata
+    assert rapids_delta.metadata_digest(updated) == delta.target
+    assert updated.versions["24.06"] is old_metadata.versions["24.06"]
+    assert updated.versions["24.08"].repositories["repo1"].packages[
+        "package4"
+    ] is RAPIDSPackage.from_flags(0b1111)
+    assert TypeAdapter(RAPIDSMetadata).dump_python(old_metadata) == old_json
+
+
+def test_apply_delta_missing(old_metadata):
+    delta = rapids_delta.MetadataDelta(base="", target="", versions={"24.12": None})
+    with pytest.raises(KeyError):
+        rapids_delta.apply_delta(old_metadata, delta)
+
+
+def test_metadata_digest():
+    pretty = json.dumps(TypeAdapter(RAPIDSMetadata).dump_python(all_metadata), indent=2)
+    assert rapids_delta.metadata_digest(
+        TypeAdapter(RAPIDSMetadata).validate_json(pretty)
+    ) == rapids_delta.metadata_digest(all_metadata)
+    assert rapids_delta.metadata_digest(RAPIDSMetadata()) != (
+        rapids_delta.metadata_digest(all_metadata)
+    )
@@ -0,0 +1,195 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+import rapids_metadata.remote as rapids_remote
+from pydantic import TypeAdapter
+from pytest_httpserver import HTTPServer
+from rapids_metadata import instrumentation, snapshot
+from rapids_metadata.metadata import (
+    RAPIDSMetadata,
+    RAPIDSRepository,
+    RAPIDSVersion,
+)
+from rapids_metadata.rapids_version import RAPIDSVersionResolver
+
+
+@pytest.fixture
+def enabled():
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.reset()
+    if not was_enabled:
+        instrumentation.disable()
+
+
+def counters() -> dict[tuple[str, tuple[tuple[str, str], ...]], float]:
+    return {
+        (counter.name, tuple(counter.labels.items())): counter.value
+        for counter in instrumentation.report().counters
+    }
+
+
+def timing_calls() -> dict[tuple[str, tuple[tuple[str, str], ...]], int]:
+    return {
+        (timing.name, tuple(timing.labels.items())): timing.calls
+        for timing in instrumentation.report().timings
+    }
+
+
+def test_disabled(monkeypatch):
+    monkeypatch.setattr(instrumentation, "_enabled", False)
+    instrumentation.reset()
+    instrumentation._count("counter")
+    instrumentation._observe("timing", 1.0)
+    with instrumentation._timed("timing"):
+        pass
+    assert instrumentation.report() == instrumentation.Report((), ())
+    assert instrumentation.prometheus_text() == ""
+
+
+def test_enabled_by_environment(tmp_path):
+    code = dedent(
+        """\
+        from rapids_metadata import all_metadata, instrumentation
+        all_metadata
+        print(instrumentation.is_enabled(), len(instrumentation.report().timings))
+        """
+    )
+    env = {**os.environ, "RAPIDS_METADATA_INSTRUMENTATION": "1"}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    enabled, num_timings = result.stdout.split()
+    assert enabled == "True"
+    assert int(num_timings) > 2
+
+
+def test_report(enabled):
+    instrumentation._count("b", result="x")
+    instrumentation._count("b", 2, result="x")
+    instrumentation._count("a")
+    instrumentation._observe("t", 0.5, kind="k")
+    instrumentation._observe("t", 0.25, kind="k")
+    assert instrumentation.report() == instrumentation.Report(
+        counters=(
+            instrumentation.Counter("a", {}, 1),
+            instrumentation.Counter("b", {"result": "x"}, 3),
+        ),
+        timings=(instrumentation.Timing("t", {"kind": "k"}, 2, 0.75),),
+    )
+
+    instrumentation.reset()
+    assert instrumentation.report() == instrumentation.Report((), ())
+
+
+def test_prometheus_text(enabled):
+    instrumentation._count("probes", result="cached")
+    instrumentation._count("probes", 2, result="parsed")
+    instrumentation._observe("fetch_seconds", 0.5, source='a "quoted"\\path')
+    assert instrumentation.prometheus_text() == dedent(
+        """\
+        # TYPE rapids_metadata_probes_total counter
+        rapids_metadata_probes_total{result="cached"} 1
+        rapids_metadata_probes_total{result="parsed"} 2
+        # TYPE rapids_metadata_fetch_seconds summary
+        rapids_metadata_fetch_seconds_count{source="a \\"quoted\\"\\\\path"} 1
+        rapids_metadata_fetch_seconds_sum{source="a \\"quoted\\"\\\\path"} 0.5
+        """
+    )
+
+
+def test_snapshot(enabled):
+    snapshot.load()
+    calls = timing_calls()
+    assert calls[("import_seconds", (("stage", "read"),))] == 1
+    assert calls[("import_seconds", (("stage", "unmarshal"),))] == 1
+    assert calls[("import_version_seconds", (("version", "24.08"),))] == 1
+
+
+def test_version_file_probes(enabled, tmp_path):
+    (tmp_path / "VERSION").write_text("24.08.00\n")
+    directory = tmp_path / "src"
+    directory.mkdir()
+    resolver = RAPIDSVersionResolver()
+    resolver.resolve(directory)
+    resolver.resolve(directory)
+    assert counters() == {
+        ("version_file_probes", (("result", "cached"),)): 1,
+        ("version_file_probes", (("result", "missing"),)): 2,
+        ("version_file_probes", (("result", "parsed"),)): 1,
+    }
+
+
+@pytest.mark.parametrize(
+    ["version", "result"],
+    [("24.08.00", "exact"), ("99.02.00", "fallback"), ("24.02.00", "missing")],
+)
+def test_current_version_lookups(enabled, tmp_path, version, result):
+    metadata = RAPIDSMetadata(
+        versions={"24.08": RAPIDSVersion(), "24.10": RAPIDSVersion()}
+    )
+    (tmp_path / "VERSION").write_text(f"{version}\n")
+    try:
+        metadata.get_current_version(tmp_path)
+    except KeyError:
+        pass
+    assert counters()[("current_version_lookups", (("result", result),))] == 1
+
+
+def test_fetch(enabled, httpserver: HTTPServer, tmp_path):
+    metadata = RAPIDSMetadata(
+        versions={
+            "24.08": RAPIDSVersion(repositories={"repo": RAPIDSRepository()}),
+        }
+    )
+    body = TypeAdapter(RAPIDSMetadata).dump_json(metadata)
+    httpserver.expect_request("/rapids-metadata.json").respond_with_data(body)
+    url = httpserver.url_for("/rapids-metadata.json")
+    cache = rapids_remote.HTTPCache(str(tmp_path), ttl=3600)
+
+    rapids_remote._fetch_from_url(url, cache=cache)
+    rapids_remote._fetch_from_url(url, cache=cache)
+    assert counters() == {
+        ("fetch_bytes", (("source", "cache"),)): len(body),
+        ("fetch_bytes", (("source", "network"),)): len(body),
+    }
+    assert timing_calls() == {
+        ("fetch_seconds", (("source", "cache"),)): 1,
+        ("fetch_seconds", (("source", "network"),)): 1,
+        ("validation_seconds", (("type", "RAPIDSMetadata"),)): 2,
+    }
+
+
+def test_validation_cache_lookups(enabled, tmp_path):
+    body = TypeAdapter(RAPIDSMetadata).dump_json(RAPIDSMetadata())
+    cache = rapids_remote.ValidationCache(str(tmp_path))
+    cache.validate(body)
+    cache.validate(body)
+    assert counters() == {
+        ("validation_cache_lookups", (("result", "hit"),)): 1,
+        ("validation_cache_lookups", (("result", "miss"),)): 1,
+    }
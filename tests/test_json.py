@@ -1,4 +1,4 @@
-# Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -13,8 +13,13 @@
 # limitations under the License.
 
 import contextlib
+import hashlib
+import io
+import json
 import os.path
 import re
+import shutil
+import subprocess
 from collections.abc import Generator
 from textwrap import dedent
 from unittest.mock import patch
@@ -22,6 +27,7 @@ from unittest.mock import patch
 import pytest
 from pydantic import TypeAdapter
 from rapids_metadata import json as rapids_json
+from rapids_metadata.delta import metadata_digest
 from rapids_metadata.metadata import (
     RAPIDSMetadata,
     RAPIDSPackage,
@@ -140,6 +146,35 @@ def set_cwd(cwd: os.PathLike) -> Generator:
                 },
             },
         ),
+        (
+            RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(),
+                    "repo2": RAPIDSRepository(
+                        packages={
+                            "package": RAPIDSPackage(),
+                        }
+                    ),
+                }
+            ).derive(),
+            {
+                "repositories": {
+                    "repo1": {
+                        "packages": {},
+                    },
+                    "repo2": {
+                        "packages": {
+                            "package": {
+                                "publishes_prereleases": True,
+                                "has_cuda_suffix": True,
+                                "has_conda_package": True,
+                                "has_wheel_package": True,
+                            },
+                        },
+                    },
+                },
+            },
+        ),
         (
             RAPIDSMetadata(
                 versions={
@@ -172,6 +207,46 @@ def test_metadata_encoder(unencoded, encoded):
     assert TypeAdapter(type(unencoded)).dump_python(unencoded) == encoded
 
 
+@pytest.mark.parametrize(
+    "metadata",
+    [
+        RAPIDSMetadata(
+            versions={
+                "24.10": RAPIDSVersion(
+                    repositories={
+                        "repo2": RAPIDSRepository(
+                            packages={
+                                "package2": RAPIDSPackage(has_cuda_suffix=False),
+                                "package1": RAPIDSPackage(publishes_prereleases=False),
+                            },
+                        ),
+                        "repo1": RAPIDSRepository(),
+                    },
+                ),
+                "24.08": RAPIDSVersion(),
+            },
+        ),
+        RAPIDSMetadata(
+            versions={
+                "24.08": RAPIDSVersion(
+                    repositories={
+                        "répo": RAPIDSRepository(
+                            packages={"pâckage": RAPIDSPackage()},
+                        ),
+                    },
+                ),
+            },
+        ),
+    ],
+)
+@pytest.mark.parametrize("pretty", [False, True])
+def test_dump_json(metadata: RAPIDSMetadata, pretty: bool):
+    adapter = TypeAdapter(RAPIDSMetadata)
+    assert rapids_json._dump_json(adapter, metadata, pretty) == (
+        rapids_json._dumps(adapter.dump_python(metadata), pretty).encode()
+    )
+
+
 @pytest.mark.parametrize(
     ["version", "args", "expected_json"],
     [
@@ -378,3 +453,564 @@ def test_main(
     captured = capsys.readouterr()
     assert captured.out == ""
     check_output(written_json)
+
+
+def test_main_shard_dir(tmp_path):
+    mock_metadata = RAPIDSMetadata(
+        versions={
+            "24.08": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={
+                            "package": RAPIDSPackage(),
+                        },
+                    ),
+                },
+            ),
+            "24.10": RAPIDSVersion(),
+        },
+    )
+    shard_dir = tmp_path / "shards"
+    shard_dir.mkdir()
+    (shard_dir / "24.06.json").write_text("{}")
+    (shard_dir / "24.08.json").write_text("{}")
+    (shard_dir / "index.json").write_text(
+        '{"versions": {"24.06": {}, "24.08": {}, "../other": {}}}'
+    )
+    (shard_dir / "package.json").write_text("{}")
+    (shard_dir / "README").write_text("")
+    (tmp_path / "other.json").write_text("{}")
+
+    with patch("rapids_metadata.json.all_metadata", mock_metadata):
+        rapids_json.main(
+            [
+                "--all-versions",
+                "--shard-dir",
+                str(shard_dir),
+                "-o",
+                str(tmp_path / "rapids-metadata.json"),
+            ]
+        )
+
+    assert sorted(path.name for path in shard_dir.iterdir()) == [
+        "24.08.json",
+        "24.10.json",
+        "README",
+        "index.json",
+        "package.json",
+    ]
+    assert (tmp_path / "other.json").exists()
+    shard = (shard_dir / "24.08.json").read_bytes()
+    assert shard == (
+        b'{"repositories":{"repo1":{"packages":{"package":{'
+        b'"has_conda_package":true,"has_cuda_suffix":true,'
+        b'"has_wheel_package":true,"publishes_prereleases":true}}}}}'
+    )
+    index = json.loads((shard_dir / "index.json").read_text())
+    assert index == {
+        "versions": {
+            "24.08": {"sha256": hashlib.sha256(shard).hexdigest()},
+            "24.10": {
+                "sha256": hashlib.sha256(
+                    (shard_dir / "24.10.json").read_bytes()
+                ).hexdigest()
+            },
+        }
+    }
+
+
+def test_main_shard_dir_schema(tmp_path):
+    with pytest.raises(SystemExit):
+        rapids_json.main(["--schema", "--shard-dir", str(tmp_path)])
+
+
+def test_main_delta_dir(tmp_path):
+    revisions = [
+        RAPIDSMetadata(versions={"24.08": RAPIDSVersion()}),
+        RAPIDSMetadata(
+            versions={
+                "24.08": RAPIDSVersion(),
+                "24.10": RAPIDSVersion(repositories={"repo": RAPIDSRepository()}),
+            }
+        ),
+        RAPIDSMetadata(
+            versions={
+                "24.10": RAPIDSVersion(repositories={"repo": RAPIDSRepository()}),
+            }
+        ),
+    ]
+    output = tmp_path / "rapids-metadata.json"
+    delta_dir = tmp_path / "deltas"
+    for revision in [*revisions, revisions[-1]]:
+        with patch("rapids_metadata.json.all_metadata", revision):
+            rapids_json.main(
+                [
+                    "--all-versions",
+                    "--delta-dir",
+                    str(delta_dir),
+                    "-o",
+                    str(output),
+                ]
+            )
+
+    digests = [metadata_digest(revision) for revision in revisions]
+    index = json.loads((delta_dir / "index.json").read_text())
+    assert index == {
+        "latest": digests[2],
+        "deltas": [
+            {"base": digests[0], "target": digests[1]},
+            {"base": digests[1], "target": digests[2]},
+        ],
+    }
+    assert sorted(path.name for path in delta_dir.iterdir()) == sorted(
+        ["index.json", f"{digests[0]}.json", f"{digests[1]}.json"]
+    )
+    delta = json.loads((delta_dir / f"{digests[1]}.json").read_text())
+    assert delta == {
+        "base": digests[1],
+        "target": digests[2],
+        "versions": {"24.08": None},
+    }
+
+
+def test_main_delta_dir_max_deltas(tmp_path):
+    output = tmp_path / "rapids-metadata.json"
+    delta_dir = tmp_path / "deltas"
+    with patch("rapids_metadata.json._MAX_DELTAS", 2):
+        for i in range(5):
+            with patch(
+                "rapids_metadata.json.all_metadata",
+                RAPIDSMetadata(versions={f"24.{i:02}": RAPIDSVersion()}),
+            ):
+                rapids_json.main(
+                    ["--all-versions", "--delta-dir", str(delta_dir), "-o", str(output)]
+                )
+    index = json.loads((delta_dir / "index.json").read_text())
+    assert len(index["deltas"]) == 2
+    assert len(list(delta_dir.iterdir())) == 3
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--delta-dir", "deltas"],
+        ["--schema", "--delta-dir", "deltas", "-o", "schema.json"],
+    ],
+)
+def test_main_delta_dir_invalid(args):
+    with pytest.raises(SystemExit):
+        rapids_json.main(args)
+
+
+_ROWS_METADATA = RAPIDSMetadata(
+    versions={
+        "24.10": RAPIDSVersion(
+            repositories={
+                "repo1": RAPIDSRepository(
+                    packages={
+                        "package2": RAPIDSPackage(has_wheel_package=False),
+                        "package1": RAPIDSPackage(),
+                    },
+                ),
+            },
+        ),
+        "24.08": RAPIDSVersion(
+            repositories={
+                "repo2": RAPIDSRepository(),
+                "repo1": RAPIDSRepository(
+                    packages={
+                        "package1": RAPIDSPackage(publishes_prereleases=False),
+                    },
+                ),
+            },
+        ),
+    },
+)
+
+
+@pytest.mark.parametrize(
+    ["format", "expected_output"],
+    [
+        (
+            "ndjson",
+            dedent(
+                """\
+                {"version": "24.08", "repository": "repo1", "package": "package1", "publishes_prereleases": false, "has_cuda_suffix": true, "has_conda_package": true, "has_wheel_package": true}
+                {"version": "24.10", "repository": "repo1", "package": "package1", "publishes_prereleases": true, "has_cuda_suffix": true, "has_conda_package": true, "has_wheel_package": true}
+                {"version": "24.10", "repository": "repo1", "package": "package2", "publishes_prereleases": true, "has_cuda_suffix": true, "has_conda_package": true, "has_wheel_package": false}
+                """
+            ),
+        ),
+        (
+            "csv",
+            dedent(
+                """\
+                version,repository,package,publishes_prereleases,has_cuda_suffix,has_conda_package,has_wheel_package
+                24.08,repo1,package1,false,true,true,true
+                24.10,repo1,package1,true,true,true,true
+                24.10,repo1,package2,true,true,true,false
+                """
+            ),
+        ),
+    ],
+)
+@pytest.mark.parametrize("output", [False, True])
+def test_main_rows(
+    capsys: pytest.CaptureFixture[str],
+    tmp_path,
+    format: str,
+    expected_output: str,
+    output: bool,
+):
+    args = ["--all-versions", "--format", format]
+    if output:
+        args += ["-o", str(tmp_path / "rows")]
+    with patch("rapids_metadata.json.all_metadata", _ROWS_METADATA):
+        rapids_json.main(args)
+    captured = capsys.readouterr()
+    if output:
+        assert captured.out == ""
+        assert (tmp_path / "rows").read_text() == expected_output
+    else:
+        assert captured.out == expected_output
+
+
+def test_main_msgpack(capsysbinary: pytest.CaptureFixture[bytes]):
+    msgpack = pytest.importorskip("msgpack")
+    with patch("rapids_metadata.json.all_metadata", _ROWS_METADATA):
+        rapids_json.main(["--all-versions", "--format", "msgpack"])
+    data = msgpack.unpackb(capsysbinary.readouterr().out)
+    assert data == TypeAdapter(RAPIDSMetadata).dump_python(_ROWS_METADATA)
+    assert list(data["versions"]) == ["24.08", "24.10"]
+
+
+def test_main_msgpack_missing(capsys: pytest.CaptureFixture[str]):
+    with patch.dict("sys.modules", {"msgpack": None}):
+        with pytest.raises(SystemExit):
+            rapids_json.main(["--all-versions", "--format", "msgpack"])
+    assert "requires the msgpack package" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--format", "csv", "--schema"],
+        ["--format", "ndjson", "--pretty"],
+        ["--format", "csv", "--shard-dir", "shards"],
+        ["--format", "msgpack", "all-packages"],
+        ["--format", "shell", "--all-versions"],
+        ["--format", "shell", "--pretty"],
+        ["--rapids-version", "24.08", "--all-versions"],
+        ["--rapids-version", "24.08", "--schema"],
+    ],
+)
+def test_main_format_invalid(args):
+    with pytest.raises(SystemExit):
+        rapids_json.main(args)
+
+
+_SHELL_METADATA = RAPIDSMetadata(
+    versions={
+        **_ROWS_METADATA.versions,
+        "24.12": RAPIDSVersion(
+            repositories={
+                "repo'1": RAPIDSRepository(
+                    packages={"package $1": RAPIDSPackage(has_cuda_suffix=False)},
+                ),
+            },
+        ),
+    },
+)
+
+
+@pytest.mark.parametrize(
+    ["args", "expected_output"],
+    [
+        (
+            [],
+            dedent(
+                """\
+                RAPIDS_METADATA_VERSION=24.10
+                declare -gA RAPIDS_REPO_OF=(
+                  [package1]=repo1
+                  [package2]=repo1
+                )
+                declare -gA RAPIDS_PRERELEASE=(
+                  [package1]=1
+                  [package2]=1
+                )
+                declare -gA RAPIDS_CUDA_SUFFIXED=(
+                  [package1]=1
+                  [package2]=1
+                )
+                declare -gA RAPIDS_CONDA=(
+                  [package1]=1
+                  [package2]=1
+                )
+                declare -gA RAPIDS_WHEEL=(
+                  [package1]=1
+                )
+                """
+            ),
+        ),
+        (
+            ["--rapids-version", "24.8"],
+            dedent(
+                """\
+                RAPIDS_METADATA_VERSION=24.08
+                declare -gA RAPIDS_REPO_OF=(
+                  [package1]=repo1
+                )
+                declare -gA RAPIDS_PRERELEASE=()
+                declare -gA RAPIDS_CUDA_SUFFIXED=(
+                  [package1]=1
+                )
+                declare -gA RAPIDS_CONDA=(
+                  [package1]=1
+                )
+                declare -gA RAPIDS_WHEEL=(
+                  [package1]=1
+                )
+                """
+            ),
+        ),
+    ],
+)
+def test_main_shell(
+    capsys: pytest.CaptureFixture[str],
+    tmp_path,
+    args: list[str],
+    expected_output: str,
+):
+    (tmp_path / "VERSION").write_text("24.10.00\n")
+    with set_cwd(tmp_path):
+        rapids_json.main(["--format", "shell", *args], source=_SHELL_METADATA)
+    assert capsys.readouterr().out == expected_output
+
+
+def test_main_shell_source(tmp_path):
+    bash = shutil.which("bash")
+    if bash is None:
+        pytest.skip("bash not found")
+    script = tmp_path / "metadata.sh"
+    rapids_json.main(
+        ["--format", "shell", "--rapids-version", "24.12", "-o", str(script)],
+        source=_SHELL_METADATA,
+    )
+    # Sourcing the script in a function still defines global arrays.
+    result = subprocess.run(
+        [
+            bash,
+            "-c",
+            'load() { source "$1"; }; load "$1"; '
+            'echo "$RAPIDS_METADATA_VERSION" "${RAPIDS_REPO_OF[package \\$1]}" '
+            '"${RAPIDS_PRERELEASE[package \\$1]}" '
+            '"${RAPIDS_CUDA_SUFFIXED[package \\$1]:-unset}" "${#RAPIDS_REPO_OF[@]}"',
+            "bash",
+            str(script),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout == "24.12 repo'1 1 unset 1\n"
+
+
+def test_main_rapids_version(capsys: pytest.CaptureFixture[str]):
+    rapids_json.main(["--rapids-version", "24.8.0"], source=_ROWS_METADATA)
+    assert json.loads(capsys.readouterr().out) == TypeAdapter(
+        RAPIDSMetadata
+    ).dump_python(RAPIDSMetadata(versions={"24.08": _ROWS_METADATA.versions["24.08"]}))
+
+    with pytest.raises(SystemExit) as excinfo:
+        rapids_json.main(["--rapids-version", "24.06"], source=_ROWS_METADATA)
+    assert excinfo.value.code == "RAPIDS version 24.06 not found"
+
+
+@pytest.mark.parametrize(
+    ["args", "expected_output"],
+    [
+        (["has-cuda-suffix", "package1"], "true\n"),
+        (["has-cuda-suffix", "package2"], "false\n"),
+        (["has-cuda-suffix", "--json", "package2"], "false"),
+        (["publishes-prereleases", "package2"], "true\n"),
+        (["publishes-prereleases", "package3"], "false\n"),
+        (["has-conda-package", "package3"], "false\n"),
+        (["has-wheel-package", "package3"], "true\n"),
+        (["all-packages"], "package1\npackage2\npackage3\n"),
+        (["all-packages", "--json"], '["package1","package2","package3"]'),
+        (["prerelease-packages"], "package1\npackage2\n"),
+        (["cuda-suffixed-packages"], "package1\npackage3\n"),
+        (["conda-packages"], "package1\npackage2\n"),
+        (["wheel-packages"], "package1\npackage2\npackage3\n"),
+        (["repositories"], "repo1\nrepo2\n"),
+        (["repository-of", "package3"], "repo2\n"),
+        (["repository-of", "--json", "package3"], '"repo2"'),
+        (["repository-packages", "repo1"], "package1\npackage2\n"),
+        (
+            ["--pretty", "repository-packages", "--json", "repo2"],
+            '[\n  "package3"\n]\n',
+        ),
+        (["all-packages", "--rapids-version", "24.8"], "package\n"),
+        (["all-packages", "--rapids-version", "24.08.00"], "package\n"),
+        (["--rapids-version", "24.08", "all-packages"], "package\n"),
+    ],
+)
+def test_main_query(
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: str,
+    args: list[str],
+    expected_output: str,
+):
+    mock_metadata = RAPIDSMetadata(
+        versions={
+            "24.08": RAPIDSVersion(
+                repositories={
+                    "repo": RAPIDSRepository(packages={"package": RAPIDSPackage()}),
+                },
+            ),
+            "24.10": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={
+                            "package1": RAPIDSPackage(),
+                            "package2": RAPIDSPackage(has_cuda_suffix=False),
+                        },
+                    ),
+                    "repo2": RAPIDSRepository(
+                        packages={
+                            "package3": RAPIDSPackage(
+                                publishes_prereleases=False, has_conda_package=False
+                            ),
+                        },
+                    ),
+                },
+            ),
+        },
+    )
+    with open(os.path.join(tmp_path, "VERSION"), "w") as f:
+        f.write("24.10.00\n")
+
+    with set_cwd(tmp_path):
+        rapids_json.main(args, source=mock_metadata)
+    assert capsys.readouterr().out == expected_output
+
+
+@pytest.mark.parametrize(
+    ["args", "expected_error"],
+    [
+        (["has-cuda-suffix", "nonexistent"], "Package nonexistent not found"),
+        (["repository-of", "nonexistent"], "Package nonexistent not found"),
+        (
+            ["repository-packages", "nonexistent"],
+            "Repository nonexistent not found",
+        ),
+        (
+            ["all-packages", "--rapids-version", "24.06"],
+            "RAPIDS version 24.06 not found",
+        ),
+    ],
+)
+def test_main_query_not_found(args: list[str], expected_error: str):
+    mock_metadata = RAPIDSMetadata(versions={"24.08": RAPIDSVersion()})
+    with pytest.raises(SystemExit) as excinfo:
+        rapids_json.main(
+            [*args, "--rapids-version", "24.08"]
+            if "--rapids-version" not in args
+            else args,
+            source=mock_metadata,
+        )
+    assert excinfo.value.code == expected_error
+
+
+def test_main_query_invalid():
+    with pytest.raises(SystemExit) as excinfo:
+        rapids_json.main(["--all-versions", "all-packages"])
+    assert excinfo.value.code == 2
+
+
+def test_main_batch(capsys: pytest.CaptureFixture[str], tmp_path: str):
+    mock_metadata = RAPIDSMetadata(
+        versions={
+            "24.08": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={"package1": RAPIDSPackage(has_cuda_suffix=False)}
+                    ),
+                },
+            ),
+            "24.10": RAPIDSVersion(
+                repositories={
+                    "repo2": RAPIDSRepository(packages={"package1": RAPIDSPackage()}),
+                },
+            ),
+        },
+    )
+    queries = [
+        {"package": "package1", "version": "24.08"},
+        {"query": "has-cuda-suffix", "package": "package1"},
+        {"query": "repository-of", "package": "package1", "version": "24.8"},
+        {"query": "all-packages", "version": "24.10"},
+        {"query": "has-cuda-suffix", "package": "package2"},
+        {"query": "has-cuda-suffix"},
+        {"query": "unknown"},
+        {"package": "package1", "version": "25.02"},
+        {"package": "package1", "version": 24.08},
+        [],
+    ]
+    stdin = "".join(f"{json.dumps(query)}\n" for query in queries) + "\nnot json\n"
+    with open(os.path.join(tmp_path, "VERSION"), "w") as f:
+        f.write("24.10.00\n")
+
+    with set_cwd(tmp_path), patch("sys.stdin", io.StringIO(stdin)):
+        rapids_json.main(["batch"], source=mock_metadata)
+    answers = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert answers == [
+        {
+            **queries[0],
+            "answer": {
+                "repository": "repo1",
+                "publishes_prereleases": True,
+                "has_cuda_suffix": False,
+                "has_conda_package": True,
+                "has_wheel_package": True,
+            },
+        },
+        {**queries[1], "answer": True},
+        {**queries[2], "answer": "repo1"},
+        {**queries[3], "answer": ["package1"]},
+        {**queries[4], "error": "Package package2 not found"},
+        {**queries[5], "error": "Query must have a package string"},
+        {**queries[6], "error": "Unknown query unknown"},
+        {**queries[7], "error": "RAPIDS version 25.02 not found"},
+        {**queries[8], "error": "Version must be a string"},
+        {"input": [], "error": "Query must be an object"},
+        {"input": "not json", "error": "Expecting value: line 1 column 1 (char 0)"},
+    ]
+
+    with patch("sys.stdin", io.StringIO(stdin)):
+        rapids_json.main(["batch", "--rapids-version", "24.08"], source=mock_metadata)
+    answers = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert answers[1] == {**queries[1], "answer": False}
+
+
+def test_batch_streaming():
+    metadata = RAPIDSMetadata(
+        versions={
+            "24.08": RAPIDSVersion(
+                repositories={
+                    "repo": RAPIDSRepository(packages={"package": RAPIDSPackage()}),
+                },
+            ),
+        },
+    )
+    output = io.StringIO()
+
+    def lines():
+        for i in range(3):
+            # Each answer is written before the next query is read.
+            assert output.getvalue().count("\n") == i
+            yield '{"query": "repository-of", "package": "package", "version": "24.08"}\n'
+
+    rapids_json._answer_batch(metadata, None, lines(), output)
+    assert output.getvalue().count("\n") == 3
@@ -0,0 +1,190 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import inspect
+import marshal
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+from pydantic import TypeAdapter
+from rapids_metadata import all_metadata, query, snapshot
+from rapids_metadata.metadata import RAPIDSMetadata
+
+
+def test_no_heavy_imports(tmp_path):
+    (tmp_path / "VERSION").write_text("24.08.00\n")
+    code = dedent(
+        """\
+        import sys
+        from rapids_metadata.query import all_metadata
+
+        version = all_metadata.get_current_version(".")
+        version.all_packages
+        all_metadata.floor_version("24.09")
+        all_metadata.get_package_releases("cudf")
+        print(sorted(
+            name
+            for name in sys.modules
+            if name.partition(".")[0] in ("pydantic", "packaging")
+        ))
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout == "[]\n"
+
+
+def test_load_default_path():
+    assert inspect.signature(query.load).parameters["path"].default == (
+        snapshot.SNAPSHOT_PATH
+    )
+
+
+def test_same_as_metadata():
+    metadata = query.all_metadata
+    assert list(metadata.versions) == list(all_metadata.versions)
+    for version, version_data in all_metadata.versions.items():
+        query_version = metadata.versions[version]
+        assert list(query_version.repositories) == list(version_data.repositories)
+        for repository, repository_data in version_data.repositories.items():
+            assert [
+                (package, package_data.flags)
+                for package, package_data in query_version.repositories[
+                    repository
+                ].packages.items()
+            ] == [
+                (package, package_data.flags)
+                for package, package_data in repository_data.packages.items()
+            ]
+        assert query_version.all_packages == version_data.all_packages
+        assert query_version.prerelease_packages == version_data.prerelease_packages
+        assert (
+            query_version.cuda_suffixed_packages == version_data.cuda_suffixed_packages
+        )
+        assert query_version.conda_packages == version_data.conda_packages
+        assert query_version.wheel_packages == version_data.wheel_packages
+        assert query_version.package_repositories == version_data.package_repositories
+
+    assert metadata.sorted_versions == all_metadata.sorted_versions
+    assert metadata.latest_version == all_metadata.latest_version
+    for version in ["24.8", "24.09", "24.08.00", "1.0", "99.0"]:
+        assert metadata.find_version(version) == all_metadata.find_version(version)
+        assert metadata.floor_version(version) == all_metadata.floor_version(version)
+        assert metadata.ceiling_version(version) == all_metadata.ceiling_version(
+            version
+        )
+    assert list(metadata.package_index) == list(all_metadata.package_index)
+    for package, releases in all_metadata.package_index.items():
+        assert [
+            (release.version, release.repository, release.package.flags)
+            for release in metadata.get_package_releases(package)
+        ] == [
+            (release.version, release.repository, release.package.flags)
+            for release in releases
+        ]
+    assert metadata.get_package_releases("nonexistent") == ()
+
+
+def versions(*names):
+    return query.RAPIDSMetadata(
+        {
+            name: query.RAPIDSVersion(
+                {"repo": query.RAPIDSRepository({name: query.RAPIDSPackage()})}
+            )
+            for name in names
+        }
+    )
+
+
+def test_loads_order():
+    # Sorted, so that repositories and packages added in later versions are in
+    # the middle.
+    adapter = TypeAdapter(RAPIDSMetadata)
+    metadata = adapter.validate_json(
+        adapter.dump_json(all_metadata, context={"sort_keys": True})
+    )
+    loaded = query.loads(snapshot.dumps(metadata))
+    for version, version_data in metadata.versions.items():
+        loaded_version = loaded.versions[version]
+        assert list(loaded_version.repositories) == list(version_data.repositories)
+        for repository, repository_data in version_data.repositories.items():
+            assert list(loaded_version.repositories[repository].packages) == list(
+                repository_data.packages
+            )
+
+
+@pytest.mark.parametrize(
+    ["version", "expected"],
+    [
+        ("24.08.00", "24.08"),
+        ("24.10.00a1", "24.10"),
+        ("99.02.00", "24.10"),
+        ("24.02.00", KeyError),
+    ],
+)
+def test_get_current_version(tmp_path, version, expected):
+    metadata = versions("24.10", "24.08")
+    (tmp_path / "VERSION").write_text(f"{version}\n")
+    if isinstance(expected, type):
+        with pytest.raises(expected):
+            metadata.get_current_version(tmp_path)
+    else:
+        assert metadata.get_current_version(tmp_path) is metadata.versions[expected]
+
+
+def test_version_comparison():
+    metadata = versions("24.10", "24.08", "24.8.1", "9.0")
+    assert metadata.sorted_versions == ("9.0", "24.08", "24.8.1", "24.10")
+    assert metadata.find_version("24.8.0") == "24.08"
+    assert metadata.find_version("24.9") is None
+    assert metadata.floor_version("24.9") == "24.8.1"
+    assert metadata.ceiling_version("24.9") == "24.10"
+    assert metadata.ceiling_version("25.0") is None
+    with pytest.raises(ValueError, match="Invalid version"):
+        metadata.find_version("invalid")
+
+
+def test_read_only():
+    metadata = versions("24.08")
+    version = metadata.versions["24.08"]
+    with pytest.raises(AttributeError):
+        metadata.versions = {}  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        metadata.versions["24.10"] = version  # type: ignore[index]
+    with pytest.raises(TypeError):
+        version.repositories["repo"].packages["24.08"] = query.RAPIDSPackage()  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        del version.repositories
+
+
+def test_package_flags():
+    for flags in range(16):
+        package = query.RAPIDSPackage.from_flags(flags)
+        assert package.flags == flags
+        assert query.RAPIDSPackage.from_flags(flags) is package
+    assert query.RAPIDSPackage().flags == 0b1111
+    with pytest.raises(ValueError, match="Invalid package flags 16"):
+        query.RAPIDSPackage.from_flags(16)
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError, match="Unsupported snapshot format version 0"):
+        query.loads(marshal.dumps((0, [])))
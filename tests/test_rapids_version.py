@@ -1,4 +1,4 @@
-# Copyright (c) 2024, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os.path
+from unittest.mock import patch
 
 import pytest
 from rapids_metadata import rapids_version
@@ -40,3 +41,83 @@ def test_get_rapids_version(tmp_path, dirname, version):
             rapids_version.get_rapids_version(abs_dir)
     else:
         assert rapids_version.get_rapids_version(abs_dir) == version
+
+
+def test_resolver_invalidation(tmp_path):
+    os.makedirs(os.path.join(tmp_path, "dir1/dir2/dir3"))
+    resolver = rapids_version.RAPIDSVersionResolver()
+    abs_dir = os.path.join(tmp_path, "dir1/dir2/dir3")
+    with pytest.raises(FileNotFoundError):
+        resolver.resolve(abs_dir)
+
+    with open(os.path.join(tmp_path, "dir1/VERSION"), "w") as f:
+        f.write("24.08\n")
+    assert resolver.resolve(abs_dir) == "24.08"
+
+    with open(os.path.join(tmp_path, "dir1/dir2/VERSION"), "w") as f:
+        f.write("24.10.00a1\n")
+    assert resolver.resolve(abs_dir) == "24.10"
+
+    with open(os.path.join(tmp_path, "dir1/dir2/VERSION"), "w") as f:
+        f.write("24.12.00\n")
+    assert resolver.resolve(abs_dir) == "24.12"
+
+    with open(os.path.join(tmp_path, "dir1/dir2/VERSION"), "w") as f:
+        f.write("invalid\n")
+    assert resolver.resolve(abs_dir) == "24.08"
+
+    os.unlink(os.path.join(tmp_path, "dir1/VERSION"))
+    with pytest.raises(FileNotFoundError):
+        resolver.resolve(abs_dir)
+
+
+def test_resolve_many(tmp_path):
+    for dirname in ["a/b/c", "a/b/d", "a/e", "f"]:
+        os.makedirs(os.path.join(tmp_path, dirname))
+    with open(os.path.join(tmp_path, "a/VERSION"), "w") as f:
+        f.write("24.08\n")
+    with open(os.path.join(tmp_path, "a/b/d/VERSION"), "w") as f:
+        f.write("24.10\n")
+
+    resolver = rapids_version.RAPIDSVersionResolver()
+    dirnames = ["a/b/c", "a/b/d", "a/e", "a", "f", "a/b/c"]
+    with patch("os.stat", wraps=os.stat) as stat:
+        assert resolver.resolve_many(
+            os.path.join(tmp_path, dirname) for dirname in dirnames
+        ) == ["24.08", "24.10", "24.08", "24.08", None, "24.08"]
+    stat_dirs = [os.path.dirname(call.args[0]) for call in stat.call_args_list]
+    assert len(stat_dirs) == len(set(stat_dirs))
+    assert os.path.join(tmp_path, "a") in stat_dirs
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "24.08.00",
+        "24.08",
+        "24",
+        "v24.10.00a1",
+        " 24.08.00\n",
+        "1!24.08.01",
+        "24.8.0.dev0",
+        "24.08.00rc2.post1.dev3+local.1",
+        "24.08-1",
+        "24.08.00.a.1",
+        "24.08.00-preview_2",
+        "24.08.00R3",
+        "invalid",
+        "24.08.00.",
+        "24..08",
+        "",
+        "24.08.00+",
+        "24.08.00a1b2",
+    ],
+)
+def test_parse_release(version):
+    from packaging.version import InvalidVersion, Version
+
+    try:
+        expected = Version(version).release
+    except InvalidVersion:
+        expected = None
+    assert rapids_version._parse_release(version) == expected
@@ -1,4 +1,4 @@
-# Copyright (c) 2024-2025, NVIDIA CORPORATION.
+# Copyright (c) 2024-2026, NVIDIA CORPORATION.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -12,13 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import hashlib
+import json
+import marshal
+import os
+import time
 from unittest.mock import patch
 
+import pytest
 import rapids_metadata.remote as rapids_remote
-from pydantic import TypeAdapter
+from pydantic import TypeAdapter, ValidationError
 from pytest_httpserver import HTTPServer
 from rapids_metadata import all_metadata
-from rapids_metadata.metadata import RAPIDSMetadata
+from rapids_metadata import json as rapids_json
+from rapids_metadata.metadata import RAPIDSMetadata, RAPIDSPackage, _TrackedDict
+from werkzeug import Response
 
 
 def test_fetch_from_url(httpserver: HTTPServer):
@@ -31,8 +40,591 @@ def test_fetch_from_url(httpserver: HTTPServer):
     )
 
 
+def test_fetch_from_url_in_event_loop(httpserver: HTTPServer, metadata_json):
+    httpserver.expect_request("/rapids-metadata.json").respond_with_data(
+        metadata_json, content_type="application/json"
+    )
+    httpserver.expect_request("/missing.json").respond_with_data("", status=404)
+
+    async def fetch():
+        assert (
+            rapids_remote._fetch_from_url(httpserver.url_for("/rapids-metadata.json"))
+            == all_metadata
+        )
+        with pytest.raises(OSError):
+            rapids_remote._fetch_from_url(
+                httpserver.url_for("/missing.json"), retries=0
+            )
+
+    asyncio.run(fetch())
+
+
 def test_fetch_latest():
-    with patch("rapids_metadata.remote._fetch_from_url") as patch_fetch_from_url:
+    with patch(
+        "rapids_metadata.remote.fetch_from_url_async"
+    ) as patch_fetch_from_url_async:
         return_value = rapids_remote.fetch_latest()
-    patch_fetch_from_url.assert_called_once_with(rapids_remote._GITHUB_METADATA_URL)
-    assert return_value == patch_fetch_from_url()
+    patch_fetch_from_url_async.assert_called_once_with(
+        rapids_remote._GITHUB_METADATA_URL,
+        cache=rapids_remote.HTTPCache(),
+        timeout=rapids_remote.DEFAULT_TIMEOUT,
+        retries=rapids_remote.DEFAULT_RETRIES,
+        backoff=rapids_remote.DEFAULT_BACKOFF,
+        lazy=False,
+        validation_cache=rapids_remote.ValidationCache(),
+    )
+    assert return_value == patch_fetch_from_url_async.return_value
+
+
+def test_fetch_latest_without_cache():
+    with patch(
+        "rapids_metadata.remote.fetch_from_url_async"
+    ) as patch_fetch_from_url_async:
+        rapids_remote.fetch_latest(
+            cache=False,
+            timeout=5,
+            retries=0,
+            backoff=0,
+            lazy=True,
+            validation_cache=False,
+        )
+    patch_fetch_from_url_async.assert_called_once_with(
+        rapids_remote._GITHUB_METADATA_URL,
+        cache=None,
+        timeout=5,
+        retries=0,
+        backoff=0,
+        lazy=True,
+        validation_cache=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "function, args",
+    [
+        ("fetch_version", ["24.08"]),
+        ("update_metadata", [RAPIDSMetadata()]),
+    ],
+)
+def test_blocking_wrapper_options(function, args):
+    with patch(f"rapids_metadata.remote.{function}_async") as patch_async:
+        return_value = getattr(rapids_remote, function)(
+            *args, cache=False, timeout=5, retries=1, backoff=0.25
+        )
+    kwargs = patch_async.call_args.kwargs
+    assert (kwargs["cache"], kwargs["timeout"], kwargs["retries"]) == (False, 5, 1)
+    assert kwargs["backoff"] == 0.25
+    assert return_value == patch_async.return_value
+
+
+def test_cache_directory(xdg_cache_home):
+    assert rapids_remote.HTTPCache().directory == os.path.join(
+        xdg_cache_home, "rapids-metadata", "http"
+    )
+
+
+@pytest.fixture
+def metadata_json():
+    return json.dumps(TypeAdapter(RAPIDSMetadata).dump_python(all_metadata))
+
+
+def test_cache_ttl(httpserver: HTTPServer, tmp_path, metadata_json):
+    cache = rapids_remote.HTTPCache(str(tmp_path / "cache"), ttl=3600)
+    url = httpserver.url_for("/rapids-metadata.json")
+    httpserver.expect_oneshot_request("/rapids-metadata.json").respond_with_data(
+        metadata_json, content_type="application/json"
+    )
+    assert rapids_remote._fetch_from_url(url, cache=cache) == all_metadata
+    assert rapids_remote._fetch_from_url(url, cache=cache) == all_metadata
+    assert len(httpserver.log) == 1
+
+    cache.clear()
+    with pytest.raises(OSError):
+        rapids_remote._fetch_from_url(url, cache=cache, retries=0)
+
+
+def test_cache_revalidation(httpserver: HTTPServer, tmp_path, metadata_json):
+    cache = rapids_remote.HTTPCache(str(tmp_path / "cache"), ttl=0)
+    url = httpserver.url_for("/rapids-metadata.json")
+    last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+    httpserver.expect_ordered_request("/rapids-metadata.json").respond_with_data(
+        metadata_json,
+        content_type="application/json",
+        headers={"ETag": '"v1"', "Last-Modified": last_modified},
+    )
+    httpserver.expect_ordered_request(
+        "/rapids-metadata.json",
+        headers={"If-None-Match": '"v1"', "If-Modified-Since": last_modified},
+    ).respond_with_response(Response(status=304))
+    httpserver.expect_ordered_request(
+        "/rapids-metadata.json", headers={"If-None-Match": '"v1"'}
+    ).respond_with_data(
+        json.dumps(TypeAdapter(RAPIDSMetadata).dump_python(RAPIDSMetadata())),
+        content_type="application/json",
+        headers={"ETag": '"v2"'},
+    )
+
+    assert rapids_remote._fetch_from_url(url, cache=cache) == all_metadata
+    assert rapids_remote._fetch_from_url(url, cache=cache) == all_metadata
+    assert rapids_remote._fetch_from_url(url, cache=cache) == RAPIDSMetadata()
+    httpserver.check_assertions()
+    assert len(httpserver.log) == 3
+
+
+@pytest.mark.parametrize("status", [404, 429, 503])
+def test_cache_fallback(httpserver: HTTPServer, tmp_path, metadata_json, status):
+    cache = rapids_remote.HTTPCache(str(tmp_path / "cache"), ttl=0)
+    url = httpserver.url_for("/rapids-metadata.json")
+    httpserver.expect_ordered_request("/rapids-metadata.json").respond_with_data(
+        metadata_json, content_type="application/json"
+    )
+    httpserver.expect_ordered_request("/rapids-metadata.json").respond_with_data(
+        "", status=status
+    )
+    assert rapids_remote._fetch_from_url(url, cache=cache) == all_metadata
+    assert rapids_remote._fetch_from_url(url, cache=cache, retries=0) == all_metadata
+    httpserver.check_assertions()
+
+    with pytest.raises(OSError):
+        rapids_remote._fetch_from_url(url, retries=0)
+
+
+def test_cache_offline(httpserver: HTTPServer, tmp_path, metadata_json):
+    cache = rapids_remote.HTTPCache(str(tmp_path / "cache"), ttl=0)
+    url = httpserver.url_for("/rapids-metadata.json")
+    httpserver.expect_request("/rapids-metadata.json").respond_with_data(
+        metadata_json, content_type="application/json"
+    )
+    assert rapids_remote._fetch_from_url(url, cache=cache) == all_metadata
+    httpserver.stop()
+    try:
+        assert (
+            rapids_remote._fetch_from_url(url, cache=cache, retries=0) == all_metadata
+        )
+        with pytest.raises(OSError):
+            rapids_remote._fetch_from_url(url, retries=0)
+    finally:
+        httpserver.start()
+
+
+def test_cache_corrupted(httpserver: HTTPServer, tmp_path, metadata_json):
+    cache = rapids_remote.HTTPCache(str(tmp_path / "cache"), ttl=3600)
+    url = httpserver.url_for("/rapids-metadata.json")
+    httpserver.expect_request("/rapids-metadata.json").respond_with_data(
+        metadata_json, content_type="application/json"
+    )
+    rapids_remote._fetch_from_url(url, cache=cache)
+    body_path, _ = cache._paths(url)
+    with open(body_path, "w") as f:
+        f.write("{}")
+    assert rapids_remote._fetch_from_url(url, cache=cache) == all_metadata
+    assert len(httpserver.log) == 2
+
+
+def test_fetch_retries(httpserver: HTTPServer, metadata_json):
+    url = httpserver.url_for("/rapids-metadata.json")
+    httpserver.expect_ordered_request("/rapids-metadata.json").respond_with_data(
+        "", status=503
+    )
+    httpserver.expect_ordered_request("/rapids-metadata.json").respond_with_data(
+        "", status=429
+    )
+    httpserver.expect_ordered_request("/rapids-metadata.json").respond_with_data(
+        metadata_json, content_type="application/json"
+    )
+    assert (
+        asyncio.run(rapids_remote.fetch_from_url_async(url, retries=2, backoff=0))
+        == all_metadata
+    )
+    httpserver.check_assertions()
+
+
+def test_fetch_retries_exhausted(httpserver: HTTPServer):
+    url = httpserver.url_for("/rapids-metadata.json")
+    httpserver.expect_request("/rapids-metadata.json").respond_with_data("", status=503)
+    with pytest.raises(OSError):
+        asyncio.run(rapids_remote.fetch_from_url_async(url, retries=2, backoff=0))
+    assert len(httpserver.log) == 3
+
+
+def test_fetch_no_retry_on_client_error(httpserver: HTTPServer):
+    url = httpserver.url_for("/rapids-metadata.json")
+    httpserver.expect_request("/rapids-metadata.json").respond_with_data("", status=404)
+    with pytest.raises(OSError):
+        asyncio.run(rapids_remote.fetch_from_url_async(url, retries=2, backoff=0))
+    assert len(httpserver.log) == 1
+
+
+def test_fetch_timeout(httpserver: HTTPServer, metadata_json):
+    def slow_handler(request):
+        time.sleep(0.5)
+        return Response(metadata_json, content_type="application/json")
+
+    url = httpserver.url_for("/rapids-metadata.json")
+    httpserver.expect_request("/rapids-metadata.json").respond_with_handler(
+        slow_handler
+    )
+    with pytest.raises((OSError, asyncio.TimeoutError)):
+        asyncio.run(rapids_remote.fetch_from_url_async(url, timeout=0.1, retries=0))
+
+
+def test_fetch_all(httpserver: HTTPServer, metadata_json):
+    httpserver.expect_request("/main.json").respond_with_data(
+        metadata_json, content_type="application/json"
+    )
+    httpserver.expect_request("/staging.json").respond_with_json({"versions": {}})
+    assert asyncio.run(
+        rapids_remote.fetch_all_async(
+            [httpserver.url_for("/main.json"), httpserver.url_for("/staging.json")]
+        )
+    ) == [all_metadata, RAPIDSMetadata()]
+
+
+def test_fetch_lazy(httpserver: HTTPServer):
+    data = TypeAdapter(RAPIDSMetadata).dump_python(all_metadata)
+    data["versions"]["99.02"] = {"repositories": {"repo": {"packages": []}}}
+    httpserver.expect_request("/rapids-metadata.json").respond_with_json(data)
+    url = httpserver.url_for("/rapids-metadata.json")
+
+    with patch(
+        "rapids_metadata.remote._validate_version",
+        wraps=rapids_remote._validate_version,
+    ) as validate_version:
+        metadata = rapids_remote._fetch_from_url(url, lazy=True)
+        assert "99.02" in metadata.versions
+        assert len(metadata.versions) == len(all_metadata.versions) + 1
+        assert list(metadata.versions) == list(data["versions"])
+        validate_version.assert_not_called()
+
+        assert metadata.versions["24.08"] == all_metadata.versions["24.08"]
+        assert metadata.versions["24.08"] is metadata.versions["24.08"]
+        validate_version.assert_called_once()
+
+    with pytest.raises(ValidationError):
+        metadata.versions["99.02"]
+    with pytest.raises(ValidationError):
+        metadata.validate_all()
+
+    del metadata.versions["99.02"]
+    metadata.validate_all()
+    assert metadata == all_metadata
+    with pytest.raises(ValidationError):
+        rapids_remote._fetch_from_url(url)
+
+
+def test_fetch_lazy_invalid(httpserver: HTTPServer):
+    httpserver.expect_request("/rapids-metadata.json").respond_with_json(
+        {"versions": []}
+    )
+    with pytest.raises(ValidationError):
+        rapids_remote._fetch_from_url(
+            httpserver.url_for("/rapids-metadata.json"), lazy=True
+        )
+
+
+def test_validation_cache_directory(xdg_cache_home):
+    assert rapids_remote.ValidationCache().directory == os.path.join(
+        xdg_cache_home, "rapids-metadata", "validated"
+    )
+
+
+@pytest.fixture
+def validation_cache(tmp_path):
+    return rapids_remote.ValidationCache(str(tmp_path / "validated"))
+
+
+def validate_with_count(cache, body):
+    with patch(
+        "rapids_metadata.remote._validate", wraps=rapids_remote._validate
+    ) as validate:
+        metadata = cache.validate(body)
+    return metadata, validate.call_count
+
+
+def test_validation_cache(validation_cache):
+    body = TypeAdapter(RAPIDSMetadata).dump_json(all_metadata)
+    assert validate_with_count(validation_cache, body) == (all_metadata, 1)
+    assert validate_with_count(validation_cache, body) == (all_metadata, 0)
+    assert validate_with_count(validation_cache, body + b" ") == (all_metadata, 1)
+    assert len(os.listdir(validation_cache.directory)) == 2
+
+    validation_cache.clear()
+    assert os.listdir(validation_cache.directory) == []
+    assert validate_with_count(validation_cache, body) == (all_metadata, 1)
+
+
+def test_validation_cache_flat(validation_cache):
+    body = TypeAdapter(RAPIDSMetadata).dump_json(all_metadata)
+    validation_cache.validate(body)
+    metadata, count = validate_with_count(validation_cache, body)
+    assert count == 0
+    for version_data in metadata.versions.values():
+        assert type(version_data.repositories) is _TrackedDict
+
+    metadata.versions["25.02"].repositories["cudf"].packages["package"] = (
+        RAPIDSPackage()
+    )
+    assert "package" not in metadata.versions["26.04"].all_packages
+
+
+def test_validation_cache_order(validation_cache):
+    # Sorted, like rapids-metadata.json, so that repositories and packages
+    # added in later versions are in the middle.
+    body = TypeAdapter(RAPIDSMetadata).dump_json(
+        all_metadata, context={"sort_keys": True}
+    )
+    missed, count = validate_with_count(validation_cache, body)
+    assert count == 1
+    hit, count = validate_with_count(validation_cache, body)
+    assert count == 0
+
+    def order(metadata):
+        return [
+            (
+                version,
+                [
+                    (repository, list(repository_data.packages))
+                    for repository, repository_data in version_data.repositories.items()
+                ],
+            )
+            for version, version_data in metadata.versions.items()
+        ]
+
+    assert order(hit) == order(missed)
+    assert order(missed) != order(all_metadata)
+
+
+def entry(fields):
+    return marshal.dumps(tuple(fields), rapids_remote._MARSHAL_VERSION)
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        pytest.param(lambda data: data[:-10], id="truncated"),
+        pytest.param(lambda data: b"", id="empty"),
+        pytest.param(lambda data: marshal.dumps(None), id="wrong-type"),
+        pytest.param(lambda data: data[:-1] + bytes([data[-1] ^ 1]), id="flipped-bit"),
+        pytest.param(
+            lambda data: entry([0, *marshal.loads(data)[1:]]),
+            id="format-version",
+        ),
+        pytest.param(
+            lambda data: entry([*marshal.loads(data)[:1], 0, *marshal.loads(data)[2:]]),
+            id="snapshot-format-version",
+        ),
+        pytest.param(
+            lambda data: entry(
+                [*marshal.loads(data)[:2], "0.0.0", *marshal.loads(data)[3:]]
+            ),
+            id="package-version",
+        ),
+        pytest.param(
+            lambda data: entry(
+                [*marshal.loads(data)[:3], "0" * 64, *marshal.loads(data)[4:]]
+            ),
+            id="digest",
+        ),
+        pytest.param(
+            lambda data: entry(marshal.loads(data)[:-1]),
+            id="missing-field",
+        ),
+    ],
+)
+def test_validation_cache_invalid_entry(validation_cache, corrupt):
+    body = TypeAdapter(RAPIDSMetadata).dump_json(all_metadata)
+    validation_cache.validate(body)
+    (path,) = [
+        os.path.join(validation_cache.directory, name)
+        for name in os.listdir(validation_cache.directory)
+    ]
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(corrupt(data))
+
+    assert validate_with_count(validation_cache, body) == (all_metadata, 1)
+    assert validate_with_count(validation_cache, body) == (all_metadata, 0)
+
+
+def test_validation_cache_invalid_document(validation_cache):
+    with pytest.raises(ValidationError):
+        validation_cache.validate(b'{"versions": []}')
+    assert not os.path.exists(validation_cache.directory)
+
+
+def test_validation_cache_max_entries(tmp_path):
+    cache = rapids_remote.ValidationCache(str(tmp_path), max_entries=2)
+    bodies = [
+        TypeAdapter(RAPIDSMetadata).dump_json(
+            RAPIDSMetadata(versions={f"24.{minor:02}": all_metadata.versions["24.08"]})
+        )
+        for minor in (2, 4, 6)
+    ]
+    for i, body in enumerate(bodies):
+        cache.validate(body)
+        # Make the order of the modification times unambiguous.
+        os.utime(cache._path(hashlib.sha256(body).hexdigest()), (i, i))
+    assert validate_with_count(cache, bodies[0])[1] == 1
+    assert validate_with_count(cache, bodies[2])[1] == 0
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_fetch_validation_cache(httpserver: HTTPServer, validation_cache, lazy):
+    httpserver.expect_request("/rapids-metadata.json").respond_with_json(
+        TypeAdapter(RAPIDSMetadata).dump_python(all_metadata)
+    )
+    url = httpserver.url_for("/rapids-metadata.json")
+    rapids_remote._fetch_from_url(url, validation_cache=validation_cache)
+    with patch(
+        "rapids_metadata.remote._validate", wraps=rapids_remote._validate
+    ) as validate:
+        metadata = rapids_remote._fetch_from_url(
+            url, lazy=lazy, validation_cache=validation_cache
+        )
+    validate.assert_not_called()
+    assert metadata == all_metadata
+
+
+@pytest.fixture
+def shard_dir(tmp_path):
+    shard_dir = tmp_path / "shards"
+    rapids_json.main(
+        ["--all-versions", "--shard-dir", str(shard_dir), "-o", os.devnull]
+    )
+    return shard_dir
+
+
+def serve_shards(httpserver: HTTPServer, shard_dir, **kwargs):
+    for path in shard_dir.iterdir():
+        httpserver.expect_request(f"/shards/{path.name}").respond_with_data(
+            path.read_bytes(), content_type="application/json", **kwargs
+        )
+    return httpserver.url_for("/shards/")
+
+
+def test_fetch_version(httpserver: HTTPServer, shard_dir):
+    base_url = serve_shards(httpserver, shard_dir)
+    assert (
+        rapids_remote.fetch_version("24.12", base_url=base_url)
+        == all_metadata.versions["24.12"]
+    )
+    assert [entry[0].path for entry in httpserver.log] == [
+        "/shards/index.json",
+        "/shards/24.12.json",
+    ]
+
+    with pytest.raises(KeyError):
+        rapids_remote.fetch_version("0.1", base_url=base_url)
+
+
+def test_fetch_version_digest_mismatch(httpserver: HTTPServer, shard_dir):
+    (shard_dir / "24.12.json").write_text('{"repositories":{}}')
+    base_url = serve_shards(httpserver, shard_dir)
+    with pytest.raises(ValueError, match="doesn't match the index"):
+        rapids_remote.fetch_version("24.12", base_url=base_url)
+    # The cached shard was revalidated once before giving up.
+    assert len(httpserver.log) == 4
+
+
+def test_fetch_version_stale_cache(httpserver: HTTPServer, shard_dir, tmp_path):
+    cache = rapids_remote.HTTPCache(str(tmp_path / "cache"), ttl=3600)
+    shard_path = shard_dir / "24.12.json"
+    shard = shard_path.read_bytes()
+    shard_path.write_text('{"repositories":{}}')
+    base_url = httpserver.url_for("/shards/")
+    httpserver.expect_oneshot_request("/shards/24.12.json").respond_with_data(
+        shard_path.read_bytes(), headers={"ETag": '"old"'}
+    )
+    asyncio.run(
+        rapids_remote._fetch_bytes(
+            f"{base_url}24.12.json", cache, rapids_remote.DEFAULT_TIMEOUT, 0, 0
+        )
+    )
+
+    shard_path.write_bytes(shard)
+    serve_shards(httpserver, shard_dir)
+    assert (
+        rapids_remote.fetch_version("24.12", base_url=base_url, cache=cache)
+        == all_metadata.versions["24.12"]
+    )
+
+
+@pytest.fixture
+def delta_revisions(tmp_path):
+    revisions = [
+        RAPIDSMetadata(versions={"24.08": all_metadata.versions["24.08"]}),
+        RAPIDSMetadata(
+            versions={
+                "24.08": all_metadata.versions["24.08"],
+                "24.10": all_metadata.versions["24.10"],
+            }
+        ),
+        RAPIDSMetadata(
+            versions={
+                "24.08": all_metadata.versions["24.08"],
+                "24.10": all_metadata.versions["24.10"],
+                "24.12": all_metadata.versions["24.12"],
+            }
+        ),
+    ]
+    for revision in revisions:
+        with patch("rapids_metadata.json.all_metadata", revision):
+            rapids_json.main(
+                [
+                    "--all-versions",
+                    "--delta-dir",
+                    str(tmp_path / "deltas"),
+                    "-o",
+                    str(tmp_path / "rapids-metadata.json"),
+                ]
+            )
+    return revisions
+
+
+def serve_deltas(httpserver: HTTPServer, tmp_path):
+    for path in (tmp_path / "deltas").iterdir():
+        httpserver.expect_request(f"/deltas/{path.name}").respond_with_data(
+            path.read_bytes(), content_type="application/json"
+        )
+    httpserver.expect_request("/rapids-metadata.json").respond_with_data(
+        (tmp_path / "rapids-metadata.json").read_bytes(),
+        content_type="application/json",
+    )
+    return httpserver.url_for("/deltas/"), httpserver.url_for("/rapids-metadata.json")
+
+
+def test_update_metadata(httpserver: HTTPServer, tmp_path, delta_revisions):
+    base_url, full_url = serve_deltas(httpserver, tmp_path)
+    old = delta_revisions[0]
+    updated = rapids_remote.update_metadata(
+        old, base_url=base_url, full_url=full_url, cache=False
+    )
+    assert updated == delta_revisions[-1]
+    assert updated.versions["24.08"] is old.versions["24.08"]
+    assert len(httpserver.log) == 3
+    assert all(entry[0].path != "/rapids-metadata.json" for entry in httpserver.log)
+
+    assert (
+        rapids_remote.update_metadata(
+            updated, base_url=base_url, full_url=full_url, cache=False
+        )
+        is updated
+    )
+    assert len(httpserver.log) == 4
+
+
+def test_update_metadata_unknown_revision(
+    httpserver: HTTPServer, tmp_path, delta_revisions
+):
+    base_url, full_url = serve_deltas(httpserver, tmp_path)
+    assert (
+        rapids_remote.update_metadata(
+            RAPIDSMetadata(), base_url=base_url, full_url=full_url, cache=False
+        )
+        == delta_revisions[-1]
+    )
+    assert [entry[0].path for entry in httpserver.log] == [
+        "/deltas/index.json",
+        "/rapids-metadata.json",
+    ]
@@ -0,0 +1,155 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import marshal
+
+import pytest
+from pydantic import TypeAdapter
+from rapids_metadata import all_metadata
+from rapids_metadata import snapshot as rapids_snapshot
+from rapids_metadata.definitions import all_metadata as defined_metadata
+from rapids_metadata.metadata import (
+    RAPIDSMetadata,
+    RAPIDSPackage,
+    RAPIDSRepository,
+    RAPIDSVersion,
+    _TrackedDict,
+)
+
+
+def test_snapshot_up_to_date():
+    # If this fails, run ci/generate_snapshot.py
+    assert all_metadata == defined_metadata
+    assert list(all_metadata.versions) == list(defined_metadata.versions)
+    for version, version_data in defined_metadata.versions.items():
+        assert list(all_metadata.versions[version].repositories) == list(
+            version_data.repositories
+        )
+
+
+def test_round_trip():
+    metadata = RAPIDSMetadata(
+        versions={
+            "24.06": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={
+                            "package1": RAPIDSPackage(),
+                            "package2": RAPIDSPackage(has_cuda_suffix=False),
+                        }
+                    ),
+                    "repo2": RAPIDSRepository(),
+                }
+            ),
+            "24.08": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={
+                            "package1": RAPIDSPackage(publishes_prereleases=False),
+                            "package3": RAPIDSPackage(has_wheel_package=False),
+                        }
+                    ),
+                    "repo3": RAPIDSRepository(
+                        packages={
+                            "package4": RAPIDSPackage(has_conda_package=False),
+                        }
+                    ),
+                }
+            ),
+        }
+    )
+    loaded = rapids_snapshot.loads(rapids_snapshot.dumps(metadata))
+    assert loaded == metadata
+    assert TypeAdapter(RAPIDSMetadata).dump_python(loaded) == TypeAdapter(
+        RAPIDSMetadata
+    ).dump_python(metadata)
+
+    loaded.versions["24.08"].repositories["repo1"].packages["package1"] = RAPIDSPackage(
+        has_cuda_suffix=False
+    )
+    assert loaded.versions["24.06"].repositories["repo1"].packages[
+        "package1"
+    ] is RAPIDSPackage.from_flags(0b1111)
+
+    loaded.versions["24.06"].repositories["repo1"].packages["package5"] = (
+        RAPIDSPackage()
+    )
+    assert "package5" not in loaded.versions["24.08"].all_packages
+
+
+def test_order():
+    metadata = RAPIDSMetadata(
+        versions={
+            "24.06": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(
+                        packages={
+                            "package1": RAPIDSPackage(),
+                            "package3": RAPIDSPackage(),
+                        }
+                    ),
+                    "repo3": RAPIDSRepository(),
+                }
+            ),
+        }
+    )
+    derived = metadata.versions["24.08"] = metadata.versions["24.06"].derive()
+    derived.repositories = {
+        "repo3": RAPIDSRepository(),
+        "repo2": RAPIDSRepository(),
+        "repo1": RAPIDSRepository(
+            packages={
+                "package1": RAPIDSPackage(),
+                "package2": RAPIDSPackage(),
+                "package3": RAPIDSPackage(),
+            }
+        ),
+    }
+    metadata.versions["24.10"] = derived.derive()
+
+    loaded = rapids_snapshot.loads(rapids_snapshot.dumps(metadata))
+    for version, version_data in metadata.versions.items():
+        loaded_version = loaded.versions[version]
+        assert list(loaded_version.repositories) == list(version_data.repositories)
+        for repository, repository_data in version_data.repositories.items():
+            assert list(loaded_version.repositories[repository].packages) == list(
+                repository_data.packages
+            )
+
+
+def test_flat():
+    loaded = rapids_snapshot.loads(rapids_snapshot.dumps(all_metadata))
+    assert loaded == all_metadata
+    for version_data in loaded.versions.values():
+        assert type(version_data.repositories) is _TrackedDict
+        for repository_data in version_data.repositories.values():
+            assert type(repository_data.packages) is _TrackedDict
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError, match="Unsupported snapshot format version 0"):
+        rapids_snapshot.loads(marshal.dumps((0, [])))
+
+
+def test_metadata_classes_importable():
+    import rapids_metadata
+    from rapids_metadata import metadata
+
+    for name in (
+        "RAPIDSMetadata",
+        "RAPIDSPackage",
+        "RAPIDSRepository",
+        "RAPIDSVersion",
+    ):
+        assert getattr(rapids_metadata, name) is getattr(metadata, name)